@@ -0,0 +1,177 @@
+"""
+Collatz Cipher - Çok Anahtarlı Toplu Şifreleme
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Her biri farklı anahtarla şifrelenecek çok sayıda kısa mesaj için, her
+anahtarın Collatz yörüngesini bir NumPy şeridi olarak tutar ve tüm
+yörüngeleri aynı adımda ilerletir. Değerler uint64'e sığdığı sürece
+şeritler vektörel işlenir; taşma riski olan şeritler büyük sayı kullanan
+CollatzPRNG'ye devredilir. Sonuçlar her anahtar için encrypt_bytes ile
+birebir aynıdır.
+"""
+
+import numpy as np
+
+from collatz_prng import CollatzPRNG
+from cipher import xor_bytes
+
+
+# 3n+1 bu değerden büyük tek sayılarda uint64'ü taşırabilir
+_ODD_LIMIT = (2 ** 64 - 2) // 3
+
+# Bu değerden büyük seed'ler şeritlere girmez, CollatzPRNG ile üretilir
+# (seed + step_count yeniden başlatması uint64'e sığsın diye)
+_SEED_LIMIT = 2 ** 63
+
+
+def _finish_lane(row, seed, current, step_count, acc):
+    """
+    Taşan bir şeridin kalan keystream'ini CollatzPRNG ile üretir.
+
+    Args:
+        row: Şeridin keystream satırı (uint8 dizisi, yerinde doldurulur)
+        seed: Şeridin seed değeri
+        current: Şeridin mevcut değeri
+        step_count: Üretilmiş bit sayısı
+        acc: Yarım kalan byte'ın şimdiye kadarki bitleri
+    """
+    prng = CollatzPRNG(seed)
+    prng.current, prng.step_count = current, step_count
+    pos = step_count >> 3
+    if step_count & 7:
+        for _ in range(8 - (step_count & 7)):
+            acc = (acc << 1) | prng.next_bit()
+        row[pos] = acc
+        pos += 1
+    prng.fill_bytes(memoryview(row[pos:]))
+
+
+def keystream_batch(keys, lengths):
+    """
+    Birden çok anahtarın keystream'ini birlikte üretir.
+
+    Args:
+        keys: Anahtar listesi (1'den büyük tam sayılar)
+        lengths: Her anahtar için istenen keystream uzunluğu (byte)
+
+    Returns:
+        Her anahtar için keystream (bytes) listesi
+    """
+    keys = list(keys)
+    lengths = [int(n) for n in lengths]
+    if len(keys) != len(lengths):
+        raise ValueError("Anahtar ve uzunluk sayıları eşit olmalı!")
+    if any(key <= 1 for key in keys):
+        raise ValueError("Anahtar 1'den büyük pozitif tam sayı olmalı!")
+    if not keys:
+        return []
+
+    # Şeritleri uzunluğa göre azalan sırala: t. adımda etkin şeritler bir önektir
+    order = sorted(range(len(keys)), key=lambda i: -lengths[i])
+    lane_keys = [keys[i] for i in order]
+    lane_lengths = np.array([lengths[i] for i in order], dtype=np.int64)
+    max_length = int(lane_lengths[0])
+    out = np.zeros((len(keys), max_length), dtype=np.uint8)
+
+    # Büyük seed'li anahtarlar şeritlere hiç girmez; taşan şeritler de
+    # çıkarılır, böylece vektörel döngü yalnızca uint64 şeritleri taşır
+    rows = np.array([lane for lane, key in enumerate(lane_keys)
+                     if key < _SEED_LIMIT], dtype=np.intp)
+    seeds = np.array([lane_keys[lane] for lane in rows], dtype=np.uint64)
+    live_lengths = lane_lengths[rows]
+    current = seeds.copy()
+    acc = np.zeros(len(rows), dtype=np.uint64)
+    evicted = []
+
+    one = np.uint64(1)
+    three = np.uint64(3)
+    limit = np.uint64(_ODD_LIMIT)
+    active = 0
+
+    for t in range(int(live_lengths[0]) * 8 if len(rows) else 0):
+        if t & 7 == 0:
+            # Bu byte'ta etkin şeritler: uzunluğu t/8'den büyük olanlar
+            active = int(np.searchsorted(-live_lengths, -(t >> 3),
+                                         side='left'))
+            if not active:
+                break
+        c = current[:active]
+        restart = c <= one
+        if restart.any():
+            c[restart] = seeds[:active][restart] + np.uint64(t)
+
+        risky = (c & one).astype(bool) & (c > limit)
+        if risky.any():
+            for lane in np.nonzero(risky)[0]:
+                evicted.append((int(rows[lane]), int(c[lane]), t,
+                                int(acc[lane])))
+            # Taşan şeritleri çıkar; çıktıları CollatzPRNG ile tamamlanır
+            keep = np.ones(len(rows), dtype=bool)
+            keep[:active][risky] = False
+            rows, seeds, live_lengths, current, acc = (
+                rows[keep], seeds[keep], live_lengths[keep], current[keep],
+                acc[keep])
+            active -= int(risky.sum())
+            if not active:
+                continue
+            c = current[:active]
+
+        a = acc[:active]
+        odd = (c & one).astype(bool)
+        a <<= one
+        a |= odd
+        halved = c >> one
+        np.multiply(c, three, out=c)
+        c += one
+        np.copyto(c, halved, where=~odd)
+
+        if t & 7 == 7:
+            out[rows[:active], t >> 3] = a
+            a[:] = 0
+
+    for lane, key in enumerate(lane_keys):
+        if key >= _SEED_LIMIT:
+            row = out[lane, :lane_lengths[lane]]
+            CollatzPRNG(key).fill_bytes(memoryview(row))
+    for lane, value, step_count, partial in evicted:
+        _finish_lane(out[lane, :lane_lengths[lane]], lane_keys[lane], value,
+                     step_count, partial)
+
+    result = [None] * len(keys)
+    for lane, original in enumerate(order):
+        result[original] = out[lane, :lengths[original]].tobytes()
+    return result
+
+
+def encrypt_batch(keys, messages):
+    """
+    Her mesajı karşılık gelen anahtarla şifreler.
+
+    Sonuç, her çift için CollatzCipher(key).encrypt_bytes(message) ile
+    aynıdır, ancak tüm yörüngeler birlikte vektörel olarak ilerletilir.
+
+    Args:
+        keys: Anahtar listesi
+        messages: Byte dizisi listesi (anahtarlarla aynı uzunlukta)
+
+    Returns:
+        Şifreli byte dizisi listesi
+    """
+    messages = list(messages)
+    keystreams = keystream_batch(keys, [len(m) for m in messages])
+    return [xor_bytes(m, ks) for m, ks in zip(messages, keystreams)]
+
+
+def decrypt_batch(keys, ciphertexts):
+    """
+    Toplu şifre çözme (bkz. encrypt_batch).
+
+    Args:
+        keys: Anahtar listesi
+        ciphertexts: Şifreli byte dizisi listesi
+
+    Returns:
+        Çözülmüş byte dizisi listesi
+    """
+    # XOR simetrik olduğu için aynı işlem
+    return encrypt_batch(keys, ciphertexts)
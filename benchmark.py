@@ -0,0 +1,519 @@
+"""
+Collatz Cipher - Performans Ölçüm Modülü
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Bu modül Collatz PRNG ve şifreleme işlemlerinin hızını ölçer.
+
+Komut satırı:
+    python benchmark.py run [--output SONUC.json] [--baseline TABAN.json]
+                            [--threshold 0.10] [--max-size N] [--repeat N]
+    python benchmark.py demo
+
+`run` ölçüm paketini çalıştırır, sonuçları JSON olarak yazar ve bir taban
+çizgisi verilmişse eşiği aşan gerilemeleri raporlar (çıkış kodu 1).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from collatz_prng import CheckpointIndex, CollatzPRNG
+from cipher import CollatzCipher
+
+
+# Ölçülen seed genişlikleri (bit)
+SEED_BITS = [8, 64, 128, 256, 512, 1024, 2048, 4096]
+
+# encrypt_bytes için ölçülen mesaj boyutları (byte, 16 B - 1 GB)
+MESSAGE_SIZES = [16, 256, 1 << 12, 1 << 16, 1 << 20, 1 << 24, 1 << 28, 1 << 30]
+
+# encrypt_file için ölçülen parça boyutları (byte)
+CHUNK_SIZES = [1 << 12, 1 << 16, 1 << 20]
+
+# Varsayılan gerileme eşiği (oransal)
+DEFAULT_THRESHOLD = 0.10
+
+
+def seed_of_bits(bits):
+    """
+    Belirtilen bit genişliğinde deterministik bir seed üretir.
+
+    Args:
+        bits: Seed'in bit uzunluğu
+
+    Returns:
+        bits uzunluğunda tek sayı
+    """
+    return random.Random(bits).getrandbits(bits) | (1 << (bits - 1)) | 1
+
+
+def best_time(func, repeat=3):
+    """
+    Fonksiyonu birkaç kez çalıştırıp en kısa süreyi döndürür.
+
+    Args:
+        func: Argümansız çağrılacak fonksiyon
+        repeat: Tekrar sayısı
+
+    Returns:
+        Saniye cinsinden en iyi süre
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def bench_seed_sizes(num_bytes=20000, seed_bits=SEED_BITS, jump_bits=None,
+                     repeat=3):
+    """
+    Farklı seed genişliklerinde generate_bytes hızını ölçer.
+
+    Args:
+        num_bytes: Her ölçümde üretilecek byte sayısı
+        seed_bits: Ölçülecek seed genişlikleri
+        jump_bits: CollatzPRNG sıçrama tablosu genişliği (None: kapalı)
+        repeat: Tekrar sayısı
+
+    Returns:
+        [(seed_bit_sayısı, byte_per_saniye), ...] listesi
+    """
+    curve = []
+    for bits in seed_bits:
+        seed = seed_of_bits(bits)
+        # Sıçrama tablosunu ölçüm dışında hazırla
+        CollatzPRNG(seed, jump_bits=jump_bits).generate_bytes(1)
+        elapsed = best_time(
+            lambda: CollatzPRNG(seed, jump_bits=jump_bits).generate_bytes(num_bytes),
+            repeat,
+        )
+        curve.append((bits, num_bytes / elapsed))
+    return curve
+
+
+def bench_parallel(size=8 << 20, max_jobs=None, key=2024, repeat=1):
+    """
+    Paralel dosya şifrelemenin çekirdek sayısına göre hızlanmasını ölçer.
+
+    Sıcak ölçümde kaydedilmiş bir kontrol noktası indeksi index_path ile
+    verilir; soğuk ölçüm, indeksi olmayan bir çağıranın göreceği gibi
+    indeksin oluşturulup kaydedilmesini de içerir (jobs = 1 indeks
+    gerektirmez).
+
+    Args:
+        size: Test dosyası boyutu (byte)
+        max_jobs: En fazla işlem sayısı (None: tüm çekirdekler)
+        key: Şifreleme anahtarı
+        repeat: Tekrar sayısı
+
+    Returns:
+        [(jobs, sıcak saniye, sıcak hızlanma, soğuk saniye,
+        soğuk hızlanma), ...] listesi
+    """
+    max_jobs = max_jobs or os.cpu_count() or 1
+    interval = max(size // (4 * max_jobs), 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "plain.bin")
+        dst = os.path.join(tmp, "cipher.bin")
+        index_path = os.path.join(tmp, "plain.idx")
+        with open(src, 'wb') as f:
+            f.write(os.urandom(size))
+
+        index_time = best_time(
+            lambda: CheckpointIndex.build(key, size, interval).save(index_path),
+            repeat
+        )
+
+        curve = []
+        for jobs in range(1, max_jobs + 1):
+            elapsed = best_time(
+                lambda: CollatzCipher(key).encrypt_file(
+                    src, dst, jobs=jobs, index_path=index_path),
+                repeat
+            )
+            cold = elapsed + index_time if jobs > 1 else elapsed
+            serial = curve[0][1] if curve else elapsed
+            curve.append((jobs, elapsed, serial / elapsed, cold,
+                          serial / cold))
+    return curve
+
+
+async def _async_loopback(size, chunk_size, key):
+    """bench_async_loopback için yerel soket üzerinden ölçüm yapar."""
+    cipher = CollatzCipher(key)
+    loop = asyncio.get_running_loop()
+    max_lag = 0.0
+    running = True
+
+    async def handle(reader, writer):
+        await cipher.apipe(reader, writer, chunk_size)
+        writer.close()
+
+    async def monitor():
+        # 1 ms'lik uykunun ne kadar geciktiği olay döngüsü gecikmesini verir
+        nonlocal max_lag
+        while running:
+            start = loop.time()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, loop.time() - start - 0.001)
+
+    async def send(writer):
+        block = os.urandom(chunk_size)
+        for offset in range(0, size, chunk_size):
+            writer.write(block[:min(chunk_size, size - offset)])
+            await writer.drain()
+        writer.write_eof()
+
+    async def receive(reader):
+        total = 0
+        while True:
+            chunk = await reader.read(1 << 16)
+            if not chunk:
+                return total
+            total += len(chunk)
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    monitor_task = asyncio.create_task(monitor())
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        start = time.perf_counter()
+        _, received = await asyncio.gather(send(writer), receive(reader))
+        elapsed = time.perf_counter() - start
+        writer.close()
+    finally:
+        running = False
+        await monitor_task
+        server.close()
+        await server.wait_closed()
+
+    return {
+        "bytes": received,
+        "seconds": elapsed,
+        "bytes_per_sec": received / elapsed,
+        "max_loop_lag_ms": max_lag * 1e3,
+    }
+
+
+def bench_async_loopback(size=1 << 20, chunk_size=1 << 14, key=2024):
+    """
+    CollatzCipher.apipe hızını ve olay döngüsü gecikmesini yerel (loopback)
+    bir TCP bağlantısı üzerinden ölçer.
+
+    Args:
+        size: Gönderilecek veri boyutu (byte)
+        chunk_size: apipe parça boyutu (byte)
+        key: Şifreleme anahtarı
+
+    Returns:
+        bytes, seconds, bytes_per_sec ve max_loop_lag_ms içeren sözlük
+    """
+    return asyncio.run(_async_loopback(size, chunk_size, key))
+
+
+def _prng_cases(seed_bits, num_bytes):
+    """PRNG sıcak yolları için (ad, parametreler, birim, miktar, fonksiyon)."""
+    bits = num_bytes * 8
+    for width in seed_bits:
+        seed = seed_of_bits(width)
+
+        def next_bit(seed=seed):
+            prng = CollatzPRNG(seed)
+            for _ in range(bits):
+                prng.next_bit()
+
+        def next_byte(seed=seed):
+            prng = CollatzPRNG(seed)
+            for _ in range(num_bytes):
+                prng.next_byte()
+
+        def next_int(seed=seed):
+            prng = CollatzPRNG(seed)
+            for _ in range(num_bytes // 4):
+                prng.next_int(32)
+
+        def generate_bits(seed=seed):
+            CollatzPRNG(seed).generate_bits(bits)
+
+        def generate_bytes(seed=seed):
+            CollatzPRNG(seed).generate_bytes(num_bytes)
+
+        def generate_bits_packed(seed=seed):
+            CollatzPRNG(seed).generate_bits(bits, packed=True)
+
+        def generate_array(seed=seed):
+            CollatzPRNG(seed).generate_array(num_bytes // 8, 'uint64')
+
+        params = {"seed_bits": width, "bytes": num_bytes}
+        yield "next_bit", params, "bits", bits, next_bit
+        yield "next_byte", params, "bytes", num_bytes, next_byte
+        yield "next_int", params, "bytes", num_bytes // 4 * 4, next_int
+        yield "generate_bits", params, "bits", bits, generate_bits
+        yield "generate_bytes", params, "bytes", num_bytes, generate_bytes
+        yield ("generate_bits_packed", params, "bits", bits,
+               generate_bits_packed)
+        yield ("generate_array", params, "bytes", num_bytes // 8 * 8,
+               generate_array)
+
+
+def _cipher_cases(message_sizes, key):
+    """encrypt_bytes için (ad, parametreler, birim, miktar, fonksiyon)."""
+    cipher = CollatzCipher(key)
+    for size in message_sizes:
+        data = os.urandom(size)
+        yield ("encrypt_bytes", {"size": size}, "bytes", size,
+               lambda data=data: cipher.encrypt_bytes(data))
+
+
+def _stats_cases(size, key):
+    """
+    Ölçüm sayaçlarının maliyeti için encrypt_bytes ölçümleri: kapalı,
+    yalnızca süre/sayaç (trace=False) ve tam izleme (trace=True).
+    """
+    data = os.urandom(size)
+    for mode in ("off", "timing", "trace"):
+        cipher = CollatzCipher(key)
+        if mode != "off":
+            cipher.enable_stats(trace=mode == "trace")
+        yield ("encrypt_bytes_stats", {"size": size, "mode": mode}, "bytes",
+               size, lambda cipher=cipher: cipher.encrypt_bytes(data))
+
+
+def _file_cases(tmp, file_size, chunk_sizes, key):
+    """encrypt_file için (ad, parametreler, birim, miktar, fonksiyon)."""
+    cipher = CollatzCipher(key)
+    src = os.path.join(tmp, "plain.bin")
+    dst = os.path.join(tmp, "cipher.bin")
+    with open(src, 'wb') as f:
+        f.write(os.urandom(file_size))
+    for chunk_size in chunk_sizes:
+        yield ("encrypt_file", {"size": file_size, "chunk_size": chunk_size},
+               "bytes", file_size,
+               lambda chunk_size=chunk_size: cipher.encrypt_file(
+                   src, dst, chunk_size=chunk_size))
+
+
+def peak_memory(func):
+    """
+    Fonksiyonun bir çalıştırmasındaki en yüksek Python bellek kullanımını
+    tracemalloc ile ölçer.
+
+    Args:
+        func: Argümansız çağrılacak fonksiyon
+
+    Returns:
+        En yüksek ayrılmış bellek (byte)
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def case_name(name, params):
+    """Bir ölçümün sonuç dosyalarındaki benzersiz adını üretir."""
+    return "/".join([name] + [f"{k}={v}" for k, v in sorted(params.items())])
+
+
+def run_suite(seed_bits=SEED_BITS, prng_bytes=2048,
+              message_sizes=MESSAGE_SIZES, max_size=1 << 20,
+              file_size=1 << 20, chunk_sizes=CHUNK_SIZES, key=2024,
+              repeat=3, memory=True, progress=None):
+    """
+    PRNG ve şifreleme sıcak yollarının ölçüm paketini çalıştırır.
+
+    Süre ölçümleri tracemalloc kapalıyken yapılır; en yüksek bellek
+    kullanımı ayrı bir çalıştırmada ölçülür.
+
+    Args:
+        seed_bits: PRNG ölçümleri için seed genişlikleri
+        prng_bytes: Her PRNG ölçümünde üretilecek byte sayısı
+        message_sizes: encrypt_bytes mesaj boyutları
+        max_size: Bu boyuttan büyük mesajlar atlanır (byte)
+        file_size: encrypt_file test dosyası boyutu (byte)
+        chunk_sizes: encrypt_file parça boyutları
+        key: Şifreleme anahtarı
+        repeat: Tekrar sayısı (en iyi süre alınır)
+        memory: True ise en yüksek bellek kullanımı da ölçülür
+        progress: Her ölçümden sonra sonuç sözlüğüyle çağrılır (opsiyonel)
+
+    Returns:
+        "meta" ve "results" anahtarlı, JSON'a yazılabilir sözlük
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            *_prng_cases(seed_bits, prng_bytes),
+            *_cipher_cases([n for n in message_sizes if n <= max_size], key),
+            *_stats_cases(min(1 << 16, max_size), key),
+            *_file_cases(tmp, file_size, chunk_sizes, key),
+        ]
+        for name, params, unit, amount, func in cases:
+            elapsed = best_time(func, repeat)
+            result = {
+                "name": name,
+                "params": params,
+                "unit": unit,
+                "seconds": elapsed,
+                "rate": amount / elapsed if elapsed else float("inf"),
+            }
+            if memory:
+                result["peak_bytes"] = peak_memory(func)
+            results[case_name(name, params)] = result
+            if progress is not None:
+                progress(result)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Ölçüm sonuçlarını bir taban çizgisiyle karşılaştırır.
+
+    Hız threshold oranından fazla düşmüşse veya en yüksek bellek kullanımı
+    threshold oranından fazla artmışsa ölçüm gerilemiş sayılır. Yalnızca
+    iki sonuçta da bulunan ölçümler karşılaştırılır.
+
+    Args:
+        current: run_suite çıktısı
+        baseline: Daha önce kaydedilmiş run_suite çıktısı
+        threshold: İzin verilen oransal değişim (0.10 = %10)
+
+    Returns:
+        [(ölçüm_adı, metrik, taban, şimdiki, oran), ...] gerileme listesi
+    """
+    regressions = []
+    base_results = baseline["results"]
+    for name, result in current["results"].items():
+        base = base_results.get(name)
+        if base is None:
+            continue
+        ratio = result["rate"] / base["rate"]
+        if ratio < 1 - threshold:
+            regressions.append((name, "rate", base["rate"], result["rate"],
+                                ratio))
+        if "peak_bytes" in result and base.get("peak_bytes"):
+            ratio = result["peak_bytes"] / base["peak_bytes"]
+            if ratio > 1 + threshold:
+                regressions.append((name, "peak_bytes", base["peak_bytes"],
+                                    result["peak_bytes"], ratio))
+    return regressions
+
+
+def _print_result(result):
+    """Bir ölçüm sonucunu tek satır olarak yazdırır."""
+    line = (f"{case_name(result['name'], result['params']):<50}"
+            f"{result['rate'] / 1e3:>12.1f} K{result['unit']}/s")
+    if "peak_bytes" in result:
+        line += f"{result['peak_bytes'] / 1024:>12.0f} KiB"
+    print(line)
+
+
+def demo():
+    """Seed genişliği, paralellik ve asyncio eğrilerini yazdırır."""
+    print("=" * 60)
+    print("Seed Genişliğine Göre Keystream Hızı (KB/s)")
+    print("=" * 60)
+
+    modes = [None, 8, 16]
+    curves = [bench_seed_sizes(jump_bits=k) for k in modes]
+
+    header = "".join(f"{'k=' + str(k):>12}" for k in modes)
+    print(f"{'Seed bit':<10}{header}")
+    for i, bits in enumerate(SEED_BITS):
+        row = "".join(f"{curve[i][1] / 1e3:>12.0f}" for curve in curves)
+        print(f"{bits:<10}{row}")
+
+    print("\n" + "=" * 60)
+    print("Paralel Dosya Şifreleme (8 MB)")
+    print("=" * 60)
+    print(f"{'İşlem':<10}{'Süre (s)':>12}{'Hızlanma':>12}"
+          f"{'Soğuk (s)':>12}{'Hızlanma':>12}")
+    for jobs, elapsed, speedup, cold, cold_speedup in bench_parallel():
+        print(f"{jobs:<10}{elapsed:>12.2f}{speedup:>12.2f}"
+              f"{cold:>12.2f}{cold_speedup:>12.2f}")
+
+    print("\n" + "=" * 60)
+    print("asyncio Loopback Şifreleme (1 MB)")
+    print("=" * 60)
+    result = bench_async_loopback()
+    print(f"Hız: {result['bytes_per_sec'] / 1e3:.0f} KB/s")
+    print(f"En büyük olay döngüsü gecikmesi: {result['max_loop_lag_ms']:.1f} ms")
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: run / demo."""
+    parser = argparse.ArgumentParser(description="Collatz Cipher ölçümleri")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Ölçüm paketini çalıştır")
+    run_parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    run_parser.add_argument("--baseline", help="Karşılaştırılacak JSON dosyası")
+    run_parser.add_argument("--threshold", type=float,
+                            default=DEFAULT_THRESHOLD)
+    run_parser.add_argument("--seed-bits", type=int, nargs="+",
+                            default=SEED_BITS)
+    run_parser.add_argument("--prng-bytes", type=int, default=2048)
+    run_parser.add_argument("--max-size", type=int, default=1 << 20,
+                            help="En büyük encrypt_bytes mesaj boyutu (byte)")
+    run_parser.add_argument("--file-size", type=int, default=1 << 20)
+    run_parser.add_argument("--chunk-sizes", type=int, nargs="+",
+                            default=CHUNK_SIZES)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--no-memory", action="store_true",
+                            help="tracemalloc ölçümünü atla")
+
+    commands.add_parser("demo", help="Ölçüm eğrilerini yazdır")
+
+    args = parser.parse_args(argv)
+    if args.command == "demo":
+        demo()
+        return 0
+
+    report = run_suite(seed_bits=args.seed_bits, prng_bytes=args.prng_bytes,
+                       max_size=args.max_size, file_size=args.file_size,
+                       chunk_sizes=args.chunk_sizes, repeat=args.repeat,
+                       memory=not args.no_memory, progress=_print_result)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for name, metric, base, current, ratio in regressions:
+        print(f"GERİLEME {name} {metric}: {base:.4g} -> {current:.4g} "
+              f"({ratio:.2f}x)")
+    if not regressions:
+        print(f"Gerileme yok (eşik %{args.threshold * 100:.0f})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,408 @@ Bu modül Collatz PRNG'yi kullanarak stream cipher (akış şifresi) uygular.
 Çözme: ciphertext XOR keystream (aynı seed ile)
 """
 
-from collatz_prng import CollatzPRNG
+import asyncio
+import contextlib
+import io
+import mmap
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from collatz_prng import (CollatzPRNG, CheckpointIndex, decode_state,
+                          shared_trajectory_cache)
+from instrumentation import CollatzStats, InstrumentedCollatzPRNG
+from keystream_store import shared_prefix_cache
+from prefetch import KeystreamPrefetcher
+
+
+# Akış şifrelemede varsayılan parça boyutu (byte)
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Yerinde (mmap) şifrelemede diske yazma aralığı (byte)
+DEFAULT_FLUSH_SIZE = 1 << 26
+
+# Asenkron akışta dilim boyutu (byte): daha küçük parçalar olay döngüsünde
+# işlenir, büyük parçalar executor'da bu boyutta dilimlerle işlenir
+ASYNC_SLICE_SIZE = 1 << 10
+
+
+def _xor_stream(prng, src, dst, chunk_size, limit=None, stats=None):
+    """
+    src'den okunan veriyi prng keystream'i ile XOR'layıp dst'ye yazar.
+
+    Args:
+        prng: Keystream kaynağı (CollatzPRNG veya KeystreamPrefetcher)
+        src: Okunacak ikili dosya nesnesi
+        dst: Yazılacak ikili dosya nesnesi
+        chunk_size: Parça boyutu (byte)
+        limit: En fazla işlenecek byte sayısı (None: akış sonuna kadar)
+        stats: XOR ve G/Ç sürelerinin yazılacağı CollatzStats (isteğe bağlı)
+
+    Returns:
+        İşlenen byte sayısı
+    """
+    buffer = bytearray(chunk_size)
+    keystream = bytearray(chunk_size)
+    data_view = memoryview(buffer)
+    key_view = memoryview(keystream)
+    total = 0
+    if stats is not None:
+        return _xor_stream_measured(prng, src, dst, chunk_size, limit, stats,
+                                    data_view, key_view)
+
+    while limit is None or total < limit:
+        size = chunk_size if limit is None else min(chunk_size, limit - total)
+        if hasattr(src, 'readinto'):
+            count = src.readinto(data_view[:size])
+        else:
+            chunk = src.read(size)
+            count = len(chunk)
+            data_view[:count] = chunk
+        if not count:
+            break
+        prng.fill_bytes(key_view[:count])
+        _xor_into(data_view[:count], data_view[:count], key_view[:count])
+        dst.write(data_view[:count])
+        total += count
+
+    return total
+
+
+def _xor_stream_measured(prng, src, dst, chunk_size, limit, stats, data_view,
+                         key_view):
+    """_xor_stream'in XOR ve G/Ç sürelerini stats'a yazan sürümü."""
+    clock = time.perf_counter
+    total = 0
+
+    while limit is None or total < limit:
+        size = chunk_size if limit is None else min(chunk_size, limit - total)
+        start = clock()
+        if hasattr(src, 'readinto'):
+            count = src.readinto(data_view[:size])
+        else:
+            chunk = src.read(size)
+            count = len(chunk)
+            data_view[:count] = chunk
+        io_time = clock() - start
+        if not count:
+            stats.record_io(0, io_time)
+            break
+        prng.fill_bytes(key_view[:count])
+        start = clock()
+        _xor_into(data_view[:count], data_view[:count], key_view[:count])
+        stats.record_xor(count, clock() - start)
+        start = clock()
+        dst.write(data_view[:count])
+        stats.record_io(count, io_time + clock() - start)
+        total += count
+
+    return total
+
+
+def _encrypt_file_range(key, state, input_path, output_path, start, end,
+                        chunk_size, jump_bits=None):
+    """
+    Paralel şifrelemede bir işçinin [start, end) aralığını işler.
+
+    PRNG, aralık başındaki (current, step_count) anlık görüntüsünden
+    başlatılır; çıktı dosyasında aynı konuma yazılır.
+
+    Returns:
+        İşlenen byte sayısı
+    """
+    prng = CollatzPRNG(key, jump_bits=jump_bits)
+    prng.current, prng.step_count = state
+    with open(input_path, 'rb') as src, open(output_path, 'r+b') as dst:
+        src.seek(start)
+        dst.seek(start)
+        return _xor_stream(prng, src, dst, chunk_size, end - start)
+
+
+def _update_sliced(context, chunk, slice_size):
+    """
+    Parçayı dilim dilim işler ve her dilimden sonra GIL'i bırakır.
+
+    Executor iş parçacığında çalışırken olay döngüsünün GIL'i beklemesini
+    yorumlayıcının geçiş aralığı (5 ms) yerine bir dilim süresiyle sınırlar.
+    """
+    out = bytearray(len(chunk))
+    src_view = memoryview(chunk)
+    dst_view = memoryview(out)
+    for start in range(0, len(out), slice_size):
+        end = start + slice_size
+        context.update_into(src_view[start:end], dst_view[start:end])
+        time.sleep(0)
+    return bytes(out)
+
+
+def _open_binary(path, mode):
+    """Dosyayı ikili modda açar; '-' için stdin/stdout kullanılır."""
+    if path == '-':
+        stream = sys.stdin.buffer if 'r' in mode else sys.stdout.buffer
+        return contextlib.nullcontext(stream)
+    return open(path, mode)
+
+
+def _same_file(input_path, output_path):
+    """İki yol aynı dosyayı gösteriyorsa True döndürür ('-' hariç)."""
+    if '-' in (input_path, output_path):
+        return False
+    try:
+        return os.path.samefile(input_path, output_path)
+    except OSError:
+        return False
+
+
+def xor_bytes(data, keystream):
+    """Eşit uzunluktaki iki byte dizisini tek bir büyük sayı işlemiyle XOR'lar."""
+    length = len(data)
+    value = int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')
+    return value.to_bytes(length, 'big')
+
+
+def _xor_into(dst, src, keystream):
+    """src XOR keystream sonucunu dst'ye yazar (eşit uzunlukta tamponlar)."""
+    dst[:] = xor_bytes(src, keystream)
+
+
+def _xor_buffer(prng, src_view, dst_view, block_size, keystream=None,
+                stats=None):
+    """
+    src_view'ı prng keystream'i ile blok blok XOR'layıp dst_view'a yazar.
+
+    Args:
+        prng: Keystream'i üretecek CollatzPRNG (durumu ilerletilir)
+        src_view: Girdi byte görünümü
+        dst_view: Yazılabilir hedef byte görünümü
+        block_size: Keystream blok boyutu (byte)
+        keystream: Yeniden kullanılacak en az block_size byte'lık
+            memoryview (None ise yeni tampon ayrılır)
+        stats: XOR sürelerinin yazılacağı CollatzStats (isteğe bağlı)
+    """
+    length = len(src_view)
+    if keystream is None:
+        keystream = memoryview(bytearray(min(block_size, length)))
+    for start in range(0, length, block_size):
+        end = min(start + block_size, length)
+        key_view = keystream[:end - start]
+        prng.fill_bytes(key_view)
+        if stats is None:
+            _xor_into(dst_view[start:end], src_view[start:end], key_view)
+        else:
+            began = time.perf_counter()
+            _xor_into(dst_view[start:end], src_view[start:end], key_view)
+            stats.record_xor(end - start, time.perf_counter() - began)
+
+
+def _byte_view(buffer, writable=False):
+    """Herhangi bir buffer-protocol nesnesinin byte görünümünü döndürür."""
+    view = memoryview(buffer)
+    if writable and view.readonly:
+        raise TypeError("Hedef tampon yazılabilir olmalı!")
+    return view.cast('B')
+
+
+class CipherContext:
+    """
+    Parça parça gelen veriyi şifreleyen (veya çözen) akış bağlamı.
+
+    Canlı bir CollatzPRNG tutar; her update() çağrısı keystream'i kaldığı
+    yerden sürdürür. Veri biriktirilmez, bu yüzden bir akışı bin parça
+    halinde işlemek tek seferde işlemekle aynı maliyettedir.
+    """
+
+    def __init__(self, prng, block_size=DEFAULT_CHUNK_SIZE, stats=None):
+        """
+        Args:
+            prng: Keystream'i üretecek CollatzPRNG
+            block_size: Keystream blok boyutu (byte)
+            stats: XOR sürelerinin yazılacağı CollatzStats (isteğe bağlı)
+        """
+        self._prng = prng
+        self._block_size = block_size
+        self._keystream = memoryview(bytearray(block_size))
+        self._stats = stats
+        self._finalized = False
+
+    @property
+    def position(self):
+        """Keystream'de şu ana kadar işlenen byte sayısı."""
+        return self._prng.step_count >> 3
+
+    @property
+    def state(self):
+        """Mevcut konumdaki PRNG durumu: (current, step_count)."""
+        return self._prng.current, self._prng.step_count
+
+    def update(self, chunk):
+        """
+        Bir veri parçasını işler.
+
+        Args:
+            chunk: Girdi parçası (buffer-protocol nesnesi)
+
+        Returns:
+            İşlenmiş byte dizisi
+        """
+        out = bytearray(len(_byte_view(chunk)))
+        self.update_into(chunk, out)
+        return bytes(out)
+
+    def update_into(self, chunk, out):
+        """
+        Bir veri parçasını işleyip sonucu out tamponuna yazar.
+
+        Args:
+            chunk: Girdi parçası (buffer-protocol nesnesi)
+            out: Yazılabilir hedef tampon (en az chunk kadar uzun)
+
+        Returns:
+            Yazılan byte sayısı
+        """
+        if self._finalized:
+            raise ValueError("Bağlam sonlandırıldı!")
+        src_view = _byte_view(chunk)
+        dst_view = _byte_view(out, writable=True)
+        length = len(src_view)
+        if len(dst_view) < length:
+            raise ValueError("Hedef tampon girdiden kısa!")
+        _xor_buffer(self._prng, src_view, dst_view, self._block_size,
+                    self._keystream, self._stats)
+        return length
+
+    def finalize(self):
+        """
+        Bağlamı sonlandırır. Akış şifresinde bekleyen veri yoktur.
+
+        Returns:
+            Boş byte dizisi
+        """
+        self._finalized = True
+        return b''
+
+
+class _CipherStream(io.RawIOBase):
+    """
+    CollatzReader/CollatzWriter için ortak taban.
+
+    Sarılan dosyanın byte 0'ı keystream'in byte 0'ına karşılık gelir;
+    seek() hem dosyayı hem de PRNG'yi aynı konuma getirir.
+    """
+
+    def __init__(self, prng, fileobj, block_size=DEFAULT_CHUNK_SIZE,
+                 stats=None):
+        super().__init__()
+        self._prng = prng
+        self._stats = stats
+        self._raw = fileobj
+        self._block_size = block_size
+        self._keystream = memoryview(bytearray(block_size))
+        self._origin = prng.step_count
+        self._pos = 0
+
+    def seekable(self):
+        return self._raw.seekable()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Dosyada ve keystream'de konum değiştirir.
+
+        Returns:
+            Yeni byte konumu
+        """
+        pos = self._raw.seek(offset, whence)
+        self._prng.seek(self._origin + pos * 8)
+        self._pos = pos
+        return pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            # RawIOBase.close() flush() çağırır; sarılan dosya ondan sonra
+            # kapatılmalı
+            try:
+                super().close()
+            finally:
+                self._raw.close()
+
+
+class CollatzReader(_CipherStream):
+    """
+    Okurken şifre çözen (veya şifreleyen) dosya benzeri nesne.
+
+    io.BufferedReader ile sarılabilir; readinto() veriyi çağıranın
+    tamponuna okuyup yerinde XOR'lar, ara bytes nesnesi oluşturmaz.
+    """
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        if hasattr(self._raw, 'readinto'):
+            count = self._raw.readinto(view)
+        else:
+            chunk = self._raw.read(len(view))
+            count = None if chunk is None else len(chunk)
+            if count:
+                view[:count] = chunk
+        if not count:
+            return count
+        window = view[:count]
+        _xor_buffer(self._prng, window, window, self._block_size,
+                    self._keystream, self._stats)
+        self._pos += count
+        return count
+
+
+class CollatzWriter(_CipherStream):
+    """
+    Yazarken şifreleyen (veya şifre çözen) dosya benzeri nesne.
+
+    Veri blok blok ara tampona XOR'lanıp sarılan dosyaya yazılır; çağıranın
+    tamponu değiştirilmez.
+    """
+
+    def __init__(self, prng, fileobj, block_size=DEFAULT_CHUNK_SIZE,
+                 stats=None):
+        super().__init__(prng, fileobj, block_size, stats)
+        self._out = memoryview(bytearray(block_size))
+
+    def writable(self):
+        return True
+
+    def write(self, buffer):
+        view = memoryview(buffer).cast('B')
+        count = len(view)
+        for start in range(0, count, self._block_size):
+            end = min(start + self._block_size, count)
+            out = self._out[:end - start]
+            self._prng.fill_bytes(out)
+            if self._stats is None:
+                _xor_into(out, view[start:end], out)
+            else:
+                began = time.perf_counter()
+                _xor_into(out, view[start:end], out)
+                self._stats.record_xor(end - start,
+                                       time.perf_counter() - began)
+            written = 0
+            while written < len(out):
+                result = self._raw.write(out[written:])
+                if result is None:
+                    raise BlockingIOError("Hedef dosya yazmaya hazır değil!")
+                written += result
+        self._pos += count
+        return count
+
+    def flush(self):
+        super().flush()
+        if hasattr(self._raw, 'flush'):
+            self._raw.flush()
 
 
 class CollatzCipher:
@@ -19,18 +420,108 @@ class CollatzCipher:
     - Her byte, Collatz PRNG'den üretilen byte ile XOR'lanır
     """
 
-    def __init__(self, key):
+    def __init__(self, key, index=None, store=None, prefix_cache=None,
+                 state=None, trajectory_cache=None, jump_bits=None):
         """
         Args:
             key: Şifreleme anahtarı (pozitif tam sayı, seed olarak kullanılır)
+            index: Keystream için CheckpointIndex (isteğe bağlı, seek için)
+            store: Keystream önbelleği olarak KeystreamStore (isteğe bağlı)
+            prefix_cache: Bellek içi KeystreamPrefixCache; True ise süreç
+                genelinde paylaşılan önbellek kullanılır (isteğe bağlı)
+            state: Keystream'in başlayacağı PRNG durumu; (current,
+                step_count) tuple'ı veya CollatzPRNG.getstate() çıktısı.
+                Yarım kalmış bir işi sürdürmek için kullanılır; verilen
+                verinin byte 0'ı bu durumdaki keystream'le XOR'lanır.
+            trajectory_cache: PRNG'lere verilecek TrajectoryCache; True ise
+                süreç genelinde paylaşılan önbellek kullanılır (varsayılan
+                kapalı; yalnızca aynı anahtarla tekrarlanan işlemleri
+                hızlandırır, bkz. TrajectoryCache)
+            jump_bits: PRNG'lerin bir sıçramada üreteceği bit sayısı (1-20,
+                bkz. CollatzPRNG); None ise adım adım üretilir. Keystream
+                değişmez, yalnızca üretim hızlanır.
         """
         if key <= 1:
             raise ValueError("Anahtar 1'den büyük pozitif tam sayı olmalı!")
+        if jump_bits is not None and not 1 <= jump_bits <= 20:
+            raise ValueError("jump_bits 1 ile 20 arasında olmalı!")
+        if index is not None and index.seed != key:
+            raise ValueError("Kontrol noktası indeksi farklı bir anahtara ait!")
+        if isinstance(state, (bytes, bytearray, memoryview)):
+            seed, current, step_count = decode_state(state)
+            if seed != key:
+                raise ValueError("PRNG durumu farklı bir anahtara ait!")
+            state = (current, step_count)
+        self.state = state
+        if trajectory_cache is True:
+            trajectory_cache = shared_trajectory_cache
+        self.trajectory_cache = trajectory_cache
         self.key = key
+        self.jump_bits = jump_bits
+        self.index = index
+        self.store = store
+        if prefix_cache is True:
+            prefix_cache = shared_prefix_cache
+        self.prefix_cache = prefix_cache
+        self.prefetch_stats = None
+        self.stats = None
 
     def _get_prng(self):
         """Yeni bir PRNG instance'ı oluşturur."""
-        return CollatzPRNG(self.key)
+        if self.stats is not None:
+            prng = InstrumentedCollatzPRNG(self.key, self.jump_bits,
+                                           index=self.index, stats=self.stats)
+        else:
+            prng = CollatzPRNG(self.key, self.jump_bits, index=self.index)
+        prng.trajectory_cache = self.trajectory_cache
+        if self.state is not None:
+            prng.current, prng.step_count = self.state
+        return prng
+
+    def _keystream_source(self):
+        """Keystream önekini sunan depo/önbellek (yoksa None)."""
+        if self.state is not None:
+            # Saklanan önekler keystream başından başlar
+            return None
+        return self.store if self.store is not None else self.prefix_cache
+
+    def enable_stats(self, trace=True, hooks=()):
+        """
+        Ölçüm sayaçlarını açar.
+
+        Bundan sonra oluşturulan tüm PRNG'ler ve şifreleme işlemleri aynı
+        CollatzStats nesnesine yazar (bkz. instrumentation modülü).
+        Paralel dosya şifrelemede işçi süreçlerinin sayaçları toplanmaz.
+
+        Args:
+            trace: Yeniden başlatmaları ve en büyük bit uzunluğunu da izle
+            hooks: kanca(olay, bilgi) biçiminde çağrılacak fonksiyonlar
+
+        Returns:
+            CollatzStats
+        """
+        self.stats = CollatzStats(trace, hooks)
+        return self.stats
+
+    def disable_stats(self):
+        """Ölçüm sayaçlarını kapatır."""
+        self.stats = None
+
+    def build_index(self, length, interval=1 << 20):
+        """
+        Keystream için kontrol noktası indeksi oluşturur veya büyütür.
+
+        Args:
+            length: Kapsanacak keystream uzunluğu (byte)
+            interval: Kontrol noktaları arası byte sayısı
+
+        Returns:
+            CheckpointIndex
+        """
+        if self.index is None:
+            self.index = CheckpointIndex(self.key, interval, self.jump_bits)
+        self.index.extend(length)
+        return self.index
 
     def encrypt_bytes(self, plaintext):
         """
@@ -42,15 +533,71 @@ class CollatzCipher:
         Returns:
             Şifreli byte dizisi
         """
-        prng = self._get_prng()
-        ciphertext = bytearray()
+        ciphertext = bytearray(len(plaintext))
+        self.encrypt_into(plaintext, ciphertext)
+        return bytes(ciphertext)
 
-        for byte in plaintext:
-            key_byte = prng.next_byte()
-            encrypted_byte = byte ^ key_byte
-            ciphertext.append(encrypted_byte)
+    def encrypt_into(self, src, dst, block_size=DEFAULT_CHUNK_SIZE):
+        """
+        src'yi şifreleyip sonucu dst tamponuna yazar.
 
-        return bytes(ciphertext)
+        Keystream block_size byte'lık bloklar halinde üretilir ve her blok
+        tek bir geniş XOR işlemiyle uygulanır; girdi boyutuyla orantılı ek
+        bellek ayrılmaz. src ve dst aynı tampon olabilir. Bir KeystreamStore
+        veya KeystreamPrefixCache verilmişse keystream üretilmez, saklanan
+        önekle XOR'lanır (önbelleğin boyut sınırını aşan girdiler için
+        PRNG kullanılır).
+
+        Args:
+            src: Girdi (bytes, bytearray, memoryview, mmap...)
+            dst: Yazılabilir hedef tampon (en az src kadar uzun)
+            block_size: Keystream blok boyutu (byte)
+
+        Returns:
+            İşlenen byte sayısı
+        """
+        src_view = _byte_view(src)
+        dst_view = _byte_view(dst, writable=True)
+        length = len(src_view)
+        if len(dst_view) < length:
+            raise ValueError("Hedef tampon girdiden kısa!")
+
+        stats = self.stats
+        source = self._keystream_source()
+        keystream = None
+        if source is not None:
+            keystream = source.keystream(self.key, length, self.jump_bits)
+        if keystream is not None:
+            with keystream:
+                for start in range(0, length, block_size):
+                    end = min(start + block_size, length)
+                    if stats is None:
+                        _xor_into(dst_view[start:end], src_view[start:end],
+                                  keystream[start:end])
+                    else:
+                        began = time.perf_counter()
+                        _xor_into(dst_view[start:end], src_view[start:end],
+                                  keystream[start:end])
+                        stats.record_xor(end - start,
+                                         time.perf_counter() - began)
+            return length
+
+        _xor_buffer(self._get_prng(), src_view, dst_view, block_size,
+                    stats=stats)
+        return length
+
+    def encrypt_inplace(self, buffer, block_size=DEFAULT_CHUNK_SIZE):
+        """
+        Yazılabilir tamponu yerinde şifreler (veya çözer).
+
+        Args:
+            buffer: Yazılabilir tampon (bytearray, memoryview, mmap...)
+            block_size: Keystream blok boyutu (byte)
+
+        Returns:
+            İşlenen byte sayısı
+        """
+        return self.encrypt_into(buffer, buffer, block_size)
 
     def decrypt_bytes(self, ciphertext):
         """
@@ -65,6 +612,152 @@ class CollatzCipher:
         # XOR şifreleme simetrik olduğu için aynı işlem
         return self.encrypt_bytes(ciphertext)
 
+    def encryptor(self, block_size=DEFAULT_CHUNK_SIZE):
+        """
+        Parça parça şifreleme için bir CipherContext döndürür.
+
+        Args:
+            block_size: Keystream blok boyutu (byte)
+
+        Returns:
+            CipherContext
+        """
+        return CipherContext(self._get_prng(), block_size, self.stats)
+
+    def decryptor(self, block_size=DEFAULT_CHUNK_SIZE):
+        """
+        Parça parça çözme için bir CipherContext döndürür.
+
+        Args:
+            block_size: Keystream blok boyutu (byte)
+
+        Returns:
+            CipherContext
+        """
+        # XOR simetrik olduğu için aynı işlem
+        return self.encryptor(block_size)
+
+    async def aencrypt_stream(self, reader, chunk_size=DEFAULT_CHUNK_SIZE,
+                              executor=None):
+        """
+        asyncio.StreamReader'dan okunan veriyi şifreleyerek parça parça üretir.
+
+        Kullanım:
+            async for chunk in cipher.aencrypt_stream(reader):
+                ...
+
+        Keystream en fazla chunk_size byte'lık parçalar halinde üretilir;
+        ASYNC_SLICE_SIZE'dan büyük parçalar olay döngüsünü bloklamamak için
+        executor'da (varsayılan: iş parçacığı havuzu) dilimler halinde
+        işlenir.
+
+        Args:
+            reader: asyncio.StreamReader (veya read(n) coroutine'i olan nesne)
+            chunk_size: En büyük parça boyutu (byte)
+            executor: Kullanılacak concurrent.futures executor'ı
+
+        Yields:
+            Şifreli byte parçaları
+        """
+        context = self.encryptor(min(chunk_size, DEFAULT_CHUNK_SIZE))
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await reader.read(chunk_size)
+            if not chunk:
+                break
+            if len(chunk) <= ASYNC_SLICE_SIZE:
+                yield context.update(chunk)
+            else:
+                yield await loop.run_in_executor(
+                    executor, _update_sliced, context, chunk, ASYNC_SLICE_SIZE
+                )
+
+    def adecrypt_stream(self, reader, chunk_size=DEFAULT_CHUNK_SIZE,
+                        executor=None):
+        """
+        Şifreli asenkron akışı çözer (bkz. aencrypt_stream).
+        """
+        # XOR simetrik olduğu için aynı işlem
+        return self.aencrypt_stream(reader, chunk_size, executor)
+
+    async def apipe(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE,
+                    executor=None):
+        """
+        reader'dan okunan veriyi şifreleyip writer'a yazar.
+
+        Her parçadan sonra writer.drain() beklenir, böylece karşı taraf
+        yavaşsa okuma da yavaşlar (geri basınç).
+
+        Args:
+            reader: asyncio.StreamReader
+            writer: asyncio.StreamWriter
+            chunk_size: En büyük parça boyutu (byte)
+            executor: Kullanılacak concurrent.futures executor'ı
+
+        Returns:
+            İşlenen byte sayısı
+        """
+        total = 0
+        async for chunk in self.aencrypt_stream(reader, chunk_size, executor):
+            writer.write(chunk)
+            await writer.drain()
+            total += len(chunk)
+        return total
+
+    def wrap_reader(self, fileobj, buffer_size=io.DEFAULT_BUFFER_SIZE):
+        """
+        Okunan veriyi çözen dosya benzeri bir nesne döndürür.
+
+        Sonuç io.BufferedReader'dır; tarfile, gzip, shutil.copyfileobj gibi
+        dosya nesnesi bekleyen kodlara doğrudan verilebilir. Sarılan dosya
+        seek edilebiliyorsa seek()/tell() de desteklenir.
+
+        Args:
+            fileobj: Şifreli veriyi içeren ikili dosya nesnesi
+            buffer_size: Okuma tamponu boyutu (byte)
+
+        Returns:
+            io.BufferedReader
+        """
+        reader = CollatzReader(self._get_prng(), fileobj, stats=self.stats)
+        return io.BufferedReader(reader, buffer_size)
+
+    def wrap_writer(self, fileobj, buffer_size=io.DEFAULT_BUFFER_SIZE):
+        """
+        Yazılan veriyi şifreleyerek fileobj'ye aktaran dosya benzeri nesne.
+
+        Args:
+            fileobj: Şifreli verinin yazılacağı ikili dosya nesnesi
+            buffer_size: Yazma tamponu boyutu (byte)
+
+        Returns:
+            io.BufferedWriter
+        """
+        writer = CollatzWriter(self._get_prng(), fileobj, stats=self.stats)
+        return io.BufferedWriter(writer, buffer_size)
+
+    def decrypt_range(self, ciphertext, start, end):
+        """
+        Şifreli verinin yalnızca [start, end) byte aralığını çözer.
+
+        Keystream baştan üretilmez; PRNG start konumuna seek() ile
+        (indeks varsa en yakın kontrol noktasından) konumlandırılır.
+
+        Args:
+            ciphertext: Şifreli verinin tamamı (bytes, bytearray, mmap...)
+            start: Aralık başlangıcı (byte)
+            end: Aralık sonu (byte, hariç)
+
+        Returns:
+            Çözülmüş byte dizisi
+        """
+        if not 0 <= start <= end <= len(ciphertext):
+            raise ValueError("Geçersiz byte aralığı!")
+        prng = self._get_prng()
+        prng.seek(prng.step_count + start * 8)
+        keystream = prng.generate_bytes(end - start)
+        return xor_bytes(memoryview(ciphertext)[start:end], keystream)
+
     def encrypt_text(self, plaintext):
         """
         Metin şifreler.
@@ -93,35 +786,299 @@ class CollatzCipher:
         plaintext_bytes = self.decrypt_bytes(ciphertext_bytes)
         return plaintext_bytes.decode('utf-8')
 
-    def encrypt_file(self, input_path, output_path):
+    def _keystream(self, length):
+        """
+        İlk length byte'lık keystream'i döndürür.
+
+        Depo veya önek önbelleği varsa oradan, yoksa (ya da önek önbelleğe
+        sığmıyorsa) yeni bir PRNG ile üretilir.
+        """
+        source = self._keystream_source()
+        if source is not None:
+            keystream = source.keystream(self.key, length, self.jump_bits)
+            if keystream is not None:
+                return keystream
+        return self._get_prng().generate_bytes(length)
+
+    def encrypt_many(self, texts):
+        """
+        Birden çok metni aynı anahtarla şifreler.
+
+        Keystream en uzun metin için bir kez üretilir ve her metin onunla
+        XOR'lanır; hex kodlama tüm sonuçlar için tek seferde yapılır.
+
+        Args:
+            texts: Metin listesi
+
+        Returns:
+            Hex formatında şifreli metin listesi
+        """
+        encoded = [text.encode('utf-8') for text in texts]
+        keystream = self._keystream(max(map(len, encoded), default=0))
+        joined = b''.join(xor_bytes(data, keystream[:len(data)])
+                          for data in encoded)
+        hex_all = joined.hex()
+
+        result = []
+        offset = 0
+        for data in encoded:
+            end = offset + 2 * len(data)
+            result.append(hex_all[offset:end])
+            offset = end
+        return result
+
+    def decrypt_many(self, ciphertexts_hex):
+        """
+        encrypt_many ile şifrelenmiş metinleri çözer.
+
+        Args:
+            ciphertexts_hex: Hex formatında şifreli metin listesi
+
+        Returns:
+            Çözülmüş metin listesi
+
+        Raises:
+            ValueError: Bir öğe geçerli bir hex dizisi değilse
+        """
+        # Her öğe ayrı çözülür; tek uzunluklu veya bozuk bir öğe
+        # decrypt_text'teki gibi ValueError verir
+        encoded = [bytes.fromhex(text) for text in ciphertexts_hex]
+        keystream = self._keystream(max(map(len, encoded), default=0))
+        return [xor_bytes(data, keystream[:len(data)]).decode('utf-8')
+                for data in encoded]
+
+    def encrypt_stream(self, src, dst, chunk_size=DEFAULT_CHUNK_SIZE,
+                       prefetch=0):
+        """
+        Dosya nesnesinden okuyup şifreleyerek başka bir dosya nesnesine yazar.
+
+        Veri chunk_size byte'lık parçalar halinde yeniden kullanılan
+        tamponlara okunur; PRNG durumu parçalar arasında korunur. Bellek
+        kullanımı dosya boyutundan bağımsızdır.
+
+        prefetch > 0 ise keystream, G/Ç ile örtüşmesi için arka plandaki
+        bir iş parçacığında prefetch blok önceden üretilir; ölçümler
+        işlem sonunda prefetch_stats özelliğine yazılır.
+
+        Args:
+            src: Okunacak ikili dosya nesnesi (dosya, pipe, BytesIO...)
+            dst: Yazılacak ikili dosya nesnesi
+            chunk_size: Parça boyutu (byte)
+            prefetch: Ön üretim halkasının derinliği (0: kapalı)
+
+        Returns:
+            İşlenen byte sayısı
+        """
+        if chunk_size <= 0:
+            raise ValueError("Parça boyutu pozitif olmalı!")
+        if not prefetch:
+            return _xor_stream(self._get_prng(), src, dst, chunk_size,
+                               stats=self.stats)
+
+        with KeystreamPrefetcher(self._get_prng(), chunk_size,
+                                 prefetch) as keystream:
+            try:
+                return _xor_stream(keystream, src, dst, chunk_size,
+                                   stats=self.stats)
+            finally:
+                self.prefetch_stats = keystream.stats()
+
+    def decrypt_stream(self, src, dst, chunk_size=DEFAULT_CHUNK_SIZE,
+                       prefetch=0):
+        """
+        Şifreli akışı çözer (bkz. encrypt_stream).
+
+        Args:
+            src: Okunacak ikili dosya nesnesi
+            dst: Yazılacak ikili dosya nesnesi
+            chunk_size: Parça boyutu (byte)
+            prefetch: Ön üretim halkasının derinliği (0: kapalı)
+
+        Returns:
+            İşlenen byte sayısı
+        """
+        # XOR simetrik olduğu için aynı işlem
+        return self.encrypt_stream(src, dst, chunk_size, prefetch)
+
+    def encrypt_file(self, input_path, output_path=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE, jobs=1, inplace=False,
+                     prefetch=0, index_path=None):
         """
         Dosya şifreler.
 
+        Dosya parça parça işlenir, bu yüzden bellek kullanımı sabittir.
+        jobs > 1 ise dosya kontrol noktası indeksinin sınırlarında
+        aralıklara bölünüp işlemler arasında paralel şifrelenir (bkz.
+        _encrypt_file_parallel). İndeks şifreye verilmiş olmalı ya da
+        index_path'ten yüklenir; indeks oluşturmak tüm keystream'i seri
+        üretmek demek olduğu için burada oluşturulmaz. İndeks yoksa veya
+        dosyayı bölmeye yetmiyorsa uyarı verilip seri işlenir (indeks
+        CheckpointIndex.build(...).save(yol) ile bir kez hazırlanabilir).
+        Başlangıç durumu verilmiş şifreler de seri işlenir. inplace=True
+        ise ya da girdi ve çıktı aynı dosyaysa dosya mmap ile yerinde
+        şifrelenir (bkz. encrypt_file_inplace).
+
         Args:
-            input_path: Girdi dosyası yolu
-            output_path: Çıktı dosyası yolu
+            input_path: Girdi dosyası yolu ('-' ise stdin)
+            output_path: Çıktı dosyası yolu ('-' ise stdout)
+            chunk_size: Parça boyutu (byte)
+            jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+            inplace: Dosyayı ikinci bir kopya yazmadan yerinde şifrele
+            prefetch: Keystream ön üretim halkasının derinliği (0: kapalı)
+            index_path: jobs > 1 için CheckpointIndex.save() ile kaydedilmiş
+                indeks dosyası (isteğe bağlı)
+
+        Returns:
+            İşlenen byte sayısı
+        """
+        if inplace:
+            if output_path not in (None, input_path):
+                raise ValueError("Yerinde şifrelemede çıktı yolu verilemez!")
+            return self.encrypt_file_inplace(input_path)
+        if output_path is None:
+            raise ValueError("Çıktı dosyası yolu gerekli!")
+        if _same_file(input_path, output_path):
+            # Çıktıyı 'wb' ile açmak girdiyi okunmadan kesip silerdi
+            return self.encrypt_file_inplace(input_path)
+
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        if jobs > 1 and self.state is None:
+            if input_path == '-' or output_path == '-':
+                raise ValueError("Paralel şifreleme stdin/stdout desteklemez!")
+            if index_path is not None:
+                index = CheckpointIndex.load(index_path)
+                if index.seed != self.key:
+                    raise ValueError(
+                        "Kontrol noktası indeksi farklı bir anahtara ait!")
+                self.index = index
+            length = os.path.getsize(input_path)
+            if self.index is not None and any(
+                    0 < offset < length
+                    for offset, _, _ in self.index.checkpoints):
+                return self._encrypt_file_parallel(input_path, output_path,
+                                                   chunk_size, jobs, length)
+            warnings.warn("Dosyayı bölecek kontrol noktası indeksi yok, seri "
+                          "şifreleniyor (bkz. index_path)", RuntimeWarning,
+                          stacklevel=2)
+
+        with _open_binary(input_path, 'rb') as src, \
+                _open_binary(output_path, 'wb') as dst:
+            total = self.encrypt_stream(src, dst, chunk_size, prefetch)
+            dst.flush()
+        return total
+
+    def _encrypt_file_parallel(self, input_path, output_path, chunk_size,
+                               jobs, length):
+        """
+        Dosyayı kontrol noktası sınırlarında aralıklara bölüp her aralığı
+        ayrı bir işlemde şifreler.
+
+        Her işçi PRNG'yi aralık başındaki indeks anlık görüntüsünden başlatır.
+        İndeksin kapsamadığı kuyruk son aralığa eklenir.
         """
-        with open(input_path, 'rb') as f:
-            plaintext = f.read()
+        checkpoints = [cp for cp in self.index.checkpoints if cp[0] < length]
 
-        ciphertext = self.encrypt_bytes(plaintext)
+        # Ardışık kontrol noktalarını jobs kadar aralığa grupla
+        per_job = -(-len(checkpoints) // jobs)
+        starts = checkpoints[::per_job]
+        bounds = [cp[0] for cp in starts[1:]] + [length]
 
         with open(output_path, 'wb') as f:
-            f.write(ciphertext)
+            f.truncate(length)
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_encrypt_file_range, self.key, (current, steps),
+                            input_path, output_path, start, end, chunk_size,
+                            self.jump_bits)
+                for (start, current, steps), end in zip(starts, bounds)
+            ]
+            return sum(future.result() for future in futures)
+
+    def encrypt_file_inplace(self, path, start=0, state=None,
+                             flush_size=DEFAULT_FLUSH_SIZE,
+                             block_size=DEFAULT_CHUNK_SIZE, progress=None):
+        """
+        Dosyayı mmap ile yerinde şifreler (veya çözer).
+
+        Keystream pencere pencere doğrudan eşlenmiş belleğe XOR'lanır; her
+        flush_size byte'ta bir değişiklikler diske yazılır ve işlenen
+        sayfalar sayfa önbelleğinden bırakılır. Böylece tek bir okuma ve
+        yazma geçişi yapılır ve bellek baskısı sınırlı kalır.
+
+        Kesintiden sonra devam etmek için progress geri çağrısının son
+        bildirdiği (offset, state) değerleri start ve state olarak verilir.
+
+        Args:
+            path: Dosya yolu
+            start: Şifrelemenin başlayacağı byte konumu
+            state: start konumundaki PRNG durumu (current, step_count);
+                None ise PRNG start konumuna seek() ile getirilir
+            flush_size: Diske yazma aralığı (byte)
+            block_size: Keystream blok boyutu (byte)
+            progress: Her flush sonrası progress(offset, state) ile çağrılır
 
-        print(f"Dosya şifrelendi: {input_path} -> {output_path}")
+        Returns:
+            İşlenen byte sayısı
+        """
+        prng = self._get_prng()
+        if state is not None:
+            prng.current, prng.step_count = state
+        else:
+            prng.seek(prng.step_count + start * 8)
+
+        with open(path, 'r+b') as f:
+            length = os.fstat(f.fileno()).st_size
+            if start >= length:
+                return 0
+            with mmap.mmap(f.fileno(), 0) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                offset = start
+                while offset < length:
+                    end = min(offset + flush_size, length)
+                    with memoryview(mm) as view, view[offset:end] as window:
+                        _xor_buffer(prng, window, window, block_size,
+                                    stats=self.stats)
 
-    def decrypt_file(self, input_path, output_path):
+                    # Pencereyi diske yaz ve sayfa önbelleğinden bırak;
+                    # eşlenmiş sayfalar fadvise ile bırakılamadığı için önce
+                    # eşlemeden çıkarılır
+                    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+                    mm.flush(aligned, end - aligned)
+                    if hasattr(mmap, 'MADV_DONTNEED'):
+                        mm.madvise(mmap.MADV_DONTNEED, aligned, end - aligned)
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), aligned, end - aligned,
+                                         os.POSIX_FADV_DONTNEED)
+                    offset = end
+                    if progress is not None:
+                        progress(offset, (prng.current, prng.step_count))
+
+        return length - start
+
+    def decrypt_file(self, input_path, output_path=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE, jobs=1, inplace=False,
+                     prefetch=0, index_path=None):
         """
         Şifreli dosyayı çözer.
 
         Args:
-            input_path: Şifreli dosya yolu
-            output_path: Çıktı dosyası yolu
+            input_path: Şifreli dosya yolu ('-' ise stdin)
+            output_path: Çıktı dosyası yolu ('-' ise stdout)
+            chunk_size: Parça boyutu (byte)
+            jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+            inplace: Dosyayı yerinde çöz
+            prefetch: Keystream ön üretim halkasının derinliği (0: kapalı)
+            index_path: Bkz. encrypt_file
+
+        Returns:
+            İşlenen byte sayısı
         """
         # XOR simetrik olduğu için aynı işlem
-        self.encrypt_file(input_path, output_path)
-        print(f"Dosya çözüldü: {input_path} -> {output_path}")
+        return self.encrypt_file(input_path, output_path, chunk_size, jobs,
+                                 inplace, prefetch, index_path)
 
 
 def visualize_encryption(plaintext, key):
@@ -8,6 +8,141 @@ Collatz Varsayımı (3n+1 Problemi):
 Her pozitif tam sayı sonunda 1'e ulaşır (varsayım).
 """
 
+import collections
+import json
+import struct
+import sys
+import threading
+
+# Bu bit genişliğinden büyük seed'ler için düşük pencereli koşu stratejisi
+BIG_SEED_BITS = 64
+
+# Büyük sayılarda adımların üzerinde yürütüldüğü düşük bit penceresi
+_RUN_WINDOW = 64
+
+# skip() sırasında kullanılan geçici tamponun en büyük boyutu (byte)
+_SKIP_BLOCK = 1 << 16
+
+# k adımlık sıçrama tabloları önbelleği: k -> (parite, çarpan, toplam)
+_JUMP_TABLES = {}
+
+# Yörünge önbelleğinin varsayılan boyut sınırı (byte)
+DEFAULT_TRAJECTORY_CACHE_BYTES = 1 << 24
+
+# Önbellekteki bir girdinin parite vektörü dışındaki yaklaşık maliyeti (byte)
+_TRAJECTORY_OVERHEAD = 160
+
+# Yörünge önbelleğinin kullanım sayısını izlediği en fazla seed sayısı
+_ADMIT_SEEDS = 1 << 12
+
+# generate_array() için desteklenen dtype adları
+_ARRAY_DTYPES = ('uint8', 'uint16', 'uint32', 'uint64', 'float64')
+
+# float64 üretiminde 53 bitlik kesir çarpanı
+_RECIP_BPF = 2.0 ** -53
+
+# Durum anlık görüntüsü başlığı: sürüm, seed uzunluğu, current uzunluğu,
+# step_count (ardından seed ve current byte'ları)
+_STATE = struct.Struct('>BIIQ')
+_STATE_VERSION = 1
+
+
+def _jump_table(k):
+    """
+    k adımlık Collatz sıçrama tablosunu üretir (önbellekli).
+
+    n = q * 2^k + r yazıldığında ilk k adımın parite bitleri yalnızca r'ye
+    bağlıdır ve k adım sonra n = a * q + b olur. Tablo her r için
+    (bitler, a, b) değerlerini tutar.
+
+    Args:
+        k: Bir sıçramada ilerlenecek adım sayısı
+
+    Returns:
+        (parite, çarpan, toplam) listelerinden oluşan tuple
+    """
+    table = _JUMP_TABLES.get(k)
+    if table is None:
+        size = 1 << k
+        parity = [0] * size
+        mult = [0] * size
+        add = [0] * size
+        for r in range(size):
+            a = size
+            b = r
+            bits = 0
+            for _ in range(k):
+                # a her adımda en az 2 ile bölünebilir kalır, parite b'den gelir
+                if b & 1:
+                    bits = (bits << 1) | 1
+                    a *= 3
+                    b = 3 * b + 1
+                else:
+                    bits <<= 1
+                    a >>= 1
+                    b >>= 1
+            parity[r] = bits
+            mult[r] = a
+            add[r] = b
+        table = (parity, mult, add)
+        _JUMP_TABLES[k] = table
+    return table
+
+
+def encode_state(seed, current, step_count):
+    """
+    (seed, current, step_count) üçlüsünü kompakt bir byte dizisine çevirir.
+
+    Args:
+        seed: Seed değeri
+        current: Yörüngedeki mevcut değer
+        step_count: Üretilmiş bit sayısı
+
+    Returns:
+        bytes
+    """
+    seed_raw = seed.to_bytes((seed.bit_length() + 7) // 8, 'big')
+    current_raw = current.to_bytes((current.bit_length() + 7) // 8, 'big')
+    return (_STATE.pack(_STATE_VERSION, len(seed_raw), len(current_raw),
+                        step_count) + seed_raw + current_raw)
+
+
+def decode_state(blob):
+    """
+    encode_state çıktısını (seed, current, step_count) üçlüsüne çevirir.
+
+    Args:
+        blob: encode_state ile üretilmiş byte dizisi
+
+    Returns:
+        (seed, current, step_count) tuple'ı
+    """
+    if len(blob) < _STATE.size:
+        raise ValueError("Geçersiz PRNG durumu!")
+    version, seed_len, current_len, step_count = _STATE.unpack_from(blob)
+    if (version != _STATE_VERSION
+            or len(blob) != _STATE.size + seed_len + current_len):
+        raise ValueError("Geçersiz PRNG durumu!")
+    body = memoryview(blob)[_STATE.size:]
+    seed = int.from_bytes(body[:seed_len], 'big')
+    current = int.from_bytes(body[seed_len:], 'big')
+    return seed, current, step_count
+
+
+def _check_out(out, shape, dtype):
+    """out dizisinin generate_bits/generate_array için uygun olduğunu denetler."""
+    if out.shape != shape or out.dtype != dtype:
+        raise ValueError(
+            f"out dizisi {shape} boyutlu ve {dtype} türünde olmalı!")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out dizisi C-bitişik ve yazılabilir olmalı!")
+    return out
+
+
+def _restore(cls, state, jump_bits, index):
+    """Pickle ile aktarılan bir PRNG'yi yeniden oluşturur."""
+    return cls.from_state(state, jump_bits, index)
+
 
 class CollatzPRNG:
     """
@@ -18,16 +153,40 @@ class CollatzPRNG:
     - Tek sayı -> 1 biti üret
     """
 
-    def __init__(self, seed):
+    # Milyonlarca örnek için __dict__ yerine sabit yuvalar
+    __slots__ = ('seed', 'current', 'step_count', 'jump_bits', 'index',
+                 'trajectory_cache')
+
+    # Ölçüm sayaçları; yalnızca InstrumentedCollatzPRNG'de ayarlanır
+    stats = None
+
+    def __init__(self, seed, jump_bits=None, index=None,
+                 trajectory_cache=None):
         """
         Args:
             seed: Başlangıç değeri (pozitif tam sayı, 1'den büyük olmalı)
+            jump_bits: Hızlandırılmış modda bir sıçramada üretilecek bit
+                sayısı (1-20, örn. 8 veya 16). None ise adım adım üretilir.
+            index: seek() için kullanılacak CheckpointIndex (isteğe bağlı)
+            trajectory_cache: Yeniden başlatma yörüngeleri için
+                TrajectoryCache; True ise süreç genelinde paylaşılan
+                önbellek kullanılır (varsayılan kapalı; seed ikinci kez
+                baştan üretilene kadar kullanılmaz)
         """
         if seed <= 1:
             raise ValueError("Seed 1'den büyük pozitif tam sayı olmalı!")
+        if jump_bits is not None and not 1 <= jump_bits <= 20:
+            raise ValueError("jump_bits 1 ile 20 arasında olmalı!")
+        if index is not None and index.seed != seed:
+            raise ValueError("Kontrol noktası indeksi farklı bir seed'e ait!")
         self.seed = seed
         self.current = seed
         self.step_count = 0
+        self.jump_bits = jump_bits
+        self.index = index
+        if trajectory_cache is True:
+            trajectory_cache = shared_trajectory_cache
+        self.trajectory_cache = trajectory_cache
 
     def _collatz_step(self, n):
         """Tek bir Collatz adımı uygular."""
@@ -83,17 +242,406 @@ class CollatzPRNG:
             result = (result << 1) | self.next_bit()
         return result
 
-    def generate_bits(self, count):
+    def generate_bits(self, count, packed=False, out=None):
         """
         Belirtilen sayıda bit üretir.
 
+        packed=True ise bitler ara liste oluşturulmadan fill_bytes() ile
+        doğrudan bir uint8 NumPy dizisine paketlenir (ilk bit en anlamlı
+        bit; np.unpackbits(dizi, count=count) ile açılır). out verilirse
+        sonuç bu diziye yazılır; packed=False iken out, bit başına bir
+        uint8 (0/1) değer alan count uzunluğunda bir dizi olmalıdır ve
+        bitler paketli ara dizi olmadan doğrudan out'a açılır.
+
         Args:
             count: Üretilecek bit sayısı
+            packed: True ise paketlenmiş uint8 dizisi döndürülür
+            out: Sonucun yazılacağı C-bitişik uint8 dizisi (isteğe bağlı)
+
+        Returns:
+            Bit listesi [0, 1, 1, 0, ...] ya da packed/out verilmişse
+            NumPy dizisi
+        """
+        if not packed and out is None:
+            return [self.next_bit() for _ in range(count)]
+
+        import numpy as np
+
+        full, rest = divmod(count, 8)
+        if not packed:
+            return self._unpack_into(_check_out(out, (count,),
+                                                np.dtype(np.uint8)), full, rest)
+
+        nbytes = (count + 7) >> 3
+        if out is not None:
+            buffer = _check_out(out, (nbytes,), np.dtype(np.uint8))
+        else:
+            buffer = np.empty(nbytes, dtype=np.uint8)
+        self.fill_bytes(buffer[:full])
+        if rest:
+            last = 0
+            for _ in range(rest):
+                last = (last << 1) | self.next_bit()
+            buffer[full] = last << (8 - rest)
+        return buffer
+
+    def _unpack_into(self, out, full, rest):
+        """
+        generate_bits(packed=False, out=...) için bitleri out'a açar.
+
+        Keystream sabit boyutlu bir paket tamponuna üretilir ve her bit
+        konumu (i = 0..7) out'un 8 adımlı görünümüne right_shift/bitwise_and
+        ile doğrudan yazılır; count boyutunda ara dizi oluşturulmaz.
+        """
+        import numpy as np
+
+        scratch = np.empty(min(full, _SKIP_BLOCK), dtype=np.uint8)
+        pos = 0
+        while pos < full:
+            n = min(full - pos, len(scratch))
+            block = scratch[:n]
+            self.fill_bytes(block)
+            bits = out[pos * 8:(pos + n) * 8]
+            for i in range(8):
+                lane = bits[i::8]
+                np.right_shift(block, 7 - i, out=lane)
+                np.bitwise_and(lane, 1, out=lane)
+            pos += n
+        for i in range(full * 8, full * 8 + rest):
+            out[i] = self.next_bit()
+        return out
+
+    def generate_array(self, count, dtype='uint8', out=None):
+        """
+        count elemanlı bir NumPy dizisini doğrudan keystream ile doldurur.
+
+        Tam sayı dtype'larında her eleman, aynı konumdan next_int(8 *
+        itemsize) çağrısının döndüreceği değerdir (byte'lar big-endian
+        okunur). float64 elemanları [0, 1) aralığındadır; her biri 64 bit
+        tüketir ve bunların ilk 53'ü kullanılır.
+
+        Args:
+            count: Eleman sayısı
+            dtype: 'uint8', 'uint16', 'uint32', 'uint64' veya 'float64'
+            out: Sonucun yazılacağı (count,) boyutlu C-bitişik dizi
+                (verilirse dtype'ı kullanılır)
 
         Returns:
-            Bit listesi [0, 1, 1, 0, ...]
+            NumPy dizisi
         """
-        return [self.next_bit() for _ in range(count)]
+        import numpy as np
+
+        dtype = np.dtype(out.dtype if out is not None else dtype)
+        if dtype.name not in _ARRAY_DTYPES or not dtype.isnative:
+            raise ValueError(
+                f"Desteklenmeyen dtype: {dtype} ({', '.join(_ARRAY_DTYPES)})")
+        if out is None:
+            out = np.empty(count, dtype=dtype)
+        out = _check_out(out, (count,), dtype)
+        raw = out.view(np.uint64) if dtype.kind == 'f' else out
+        self.fill_bytes(raw.view(np.uint8))
+        if raw.dtype.itemsize > 1 and sys.byteorder == 'little':
+            raw.byteswap(inplace=True)
+        if dtype.kind == 'f':
+            np.right_shift(raw, 11, out=raw)
+            np.multiply(raw, _RECIP_BPF, out=out, casting='unsafe')
+        return out
+
+    def fill_bytes(self, buffer):
+        """
+        Verilen yazılabilir tamponu keystream byte'ları ile doldurur.
+
+        next_bit() ile birebir aynı bit dizisini üretir, ancak her bit için
+        metot çağrısı yapmak yerine yörüngeyi yerel değişkenlerle tek bir
+        döngüde ilerletir ve bitleri doğrudan tampona paketler.
+
+        Args:
+            buffer: Yazılabilir tampon (bytearray, memoryview, mmap...)
+
+        Returns:
+            Yazılan byte sayısı
+        """
+        view = memoryview(buffer).cast('B')
+        cache = self.trajectory_cache
+        if cache is not None and cache.admit(
+                self.seed, self.step_count == 0 and len(view) > 0):
+            return self._fill_cached(view)
+        if self.jump_bits is not None:
+            return self._fill_jump(view)
+        if self.seed.bit_length() > BIG_SEED_BITS:
+            return self._fill_runs(view)
+
+        count = len(view)
+        seed = self.seed
+        n = self.current
+        steps = self.step_count
+
+        for i in range(count):
+            byte = 0
+            for _ in range(8):
+                # 1'e ulaşıldıysa next_bit() ile aynı kuralla yeniden başlat
+                if n <= 1:
+                    n = seed + steps
+                if n & 1:
+                    byte = (byte << 1) | 1
+                    n = 3 * n + 1
+                else:
+                    byte <<= 1
+                    n >>= 1
+                steps += 1
+            view[i] = byte
+
+        self.current = n
+        self.step_count = steps
+        return count
+
+    def _fill_runs(self, view):
+        """
+        fill_bytes() için büyük seed stratejisi.
+
+        Çift sayılarda sondaki sıfır sayısı kadar 0 biti tek kaydırmayla
+        üretilir; tek adım her zaman ardından gelen yarıya bölme ile
+        birleştirilir (3n+1 daima çifttir). Büyük sayılarda adımlar yalnızca
+        düşük _RUN_WINDOW bitlik parça üzerinde yürütülür ve üst kısım
+        pencere sonunda tek bir çarpma ile güncellenir:
+
+            n = hi * 2^W + lo  ->  n' = hi * 3^m * 2^shift + lo'
+
+        Böylece byte başına maliyet anahtar genişliğinden büyük ölçüde
+        bağımsız kalır.
+        """
+        window = _RUN_WINDOW
+        wmask = (1 << window) - 1
+        big = 1 << (window + 1)
+        count = len(view)
+        seed = self.seed
+        n = self.current
+        steps = self.step_count
+        remaining = count * 8
+        acc = 0
+        nacc = 0
+        pos = 0
+
+        while remaining:
+            if n > big:
+                # n > 2^(W+1) iken pencere içinde 1'e ulaşılamaz
+                hi = n >> window
+                lo = n & wmask
+                shift = window
+                mult = 1
+                while shift and remaining:
+                    if lo & 1:
+                        if remaining >= 2:
+                            lo = (3 * lo + 1) >> 1
+                            mult *= 3
+                            shift -= 1
+                            acc = (acc << 2) | 2
+                            nacc += 2
+                            steps += 2
+                            remaining -= 2
+                        else:
+                            lo = 3 * lo + 1
+                            mult *= 3
+                            acc = (acc << 1) | 1
+                            nacc += 1
+                            steps += 1
+                            remaining -= 1
+                    else:
+                        # Üst kısmın katsayısı çift kaldıkça parite lo'dan gelir
+                        z = (lo & -lo).bit_length() - 1 if lo else shift
+                        if z > shift:
+                            z = shift
+                        if z > remaining:
+                            z = remaining
+                        lo >>= z
+                        shift -= z
+                        acc <<= z
+                        nacc += z
+                        steps += z
+                        remaining -= z
+                n = ((mult * hi) << shift) + lo
+            else:
+                if n <= 1:
+                    n = seed + steps
+                if n & 1:
+                    if remaining >= 2:
+                        n = (3 * n + 1) >> 1
+                        acc = (acc << 2) | 2
+                        nacc += 2
+                        steps += 2
+                        remaining -= 2
+                    else:
+                        n = 3 * n + 1
+                        acc = (acc << 1) | 1
+                        nacc += 1
+                        steps += 1
+                        remaining -= 1
+                else:
+                    z = (n & -n).bit_length() - 1
+                    if z > remaining:
+                        z = remaining
+                    n >>= z
+                    acc <<= z
+                    nacc += z
+                    steps += z
+                    remaining -= z
+
+            # Biriken bitleri topluca tampona yaz
+            if nacc >= 64:
+                rem = nacc & 7
+                nbytes = nacc >> 3
+                view[pos:pos + nbytes] = (acc >> rem).to_bytes(nbytes, 'big')
+                pos += nbytes
+                nacc = rem
+                acc &= (1 << rem) - 1
+
+        if nacc:
+            view[pos:] = acc.to_bytes(nacc >> 3, 'big')
+
+        self.current = n
+        self.step_count = steps
+        return count
+
+    def _fill_cached(self, view):
+        """
+        fill_bytes() için yörünge önbellekli üretim.
+
+        Her yörünge başında (seed veya seed + step_count) başlangıç değeri
+        önbellekte aranır; yörüngenin 1'e kadarki tamamı tampona sığıyorsa
+        saklanan parite vektörü adım atılmadan kopyalanır. Aksi halde
+        yörünge adım adım üretilir ve 1'e ulaşılırsa önbelleğe eklenir.
+        """
+        cache = self.trajectory_cache
+        count = len(view)
+        seed = self.seed
+        n = self.current
+        steps = self.step_count
+        remaining = count * 8
+        acc = 0
+        nacc = 0
+        pos = 0
+        at_start = steps == 0 and n == seed
+        start = None
+        start_bit = 0
+
+        while remaining:
+            if n <= 1:
+                n = seed + steps
+                at_start = True
+            if at_start:
+                at_start = False
+                entry = cache.get(n, remaining)
+                if entry is not None:
+                    vector, length = entry
+                    acc = (acc << length) | vector
+                    nacc += length
+                    steps += length
+                    remaining -= length
+                    n = 1
+                else:
+                    start = n
+                    start_bit = count * 8 - remaining
+            if n > 1:
+                if n & 1:
+                    if remaining >= 2:
+                        n = (3 * n + 1) >> 1
+                        acc = (acc << 2) | 2
+                        nacc += 2
+                        steps += 2
+                        remaining -= 2
+                    else:
+                        n = 3 * n + 1
+                        acc = (acc << 1) | 1
+                        nacc += 1
+                        steps += 1
+                        remaining -= 1
+                else:
+                    z = (n & -n).bit_length() - 1
+                    if z > remaining:
+                        z = remaining
+                    n >>= z
+                    acc <<= z
+                    nacc += z
+                    steps += z
+                    remaining -= z
+
+                if n == 1 and start is not None:
+                    # Yörüngenin bitleri tamponun yazılmış kısmı ile acc'de
+                    length = count * 8 - remaining - start_bit
+                    first = start_bit >> 3
+                    bits = (int.from_bytes(view[first:pos], 'big') << nacc) | acc
+                    cache.put(start, bits & ((1 << length) - 1), length)
+                    start = None
+
+            # Biriken bitleri topluca tampona yaz
+            if nacc >= 64:
+                rem = nacc & 7
+                nbytes = nacc >> 3
+                view[pos:pos + nbytes] = (acc >> rem).to_bytes(nbytes, 'big')
+                pos += nbytes
+                nacc = rem
+                acc &= (1 << rem) - 1
+
+        if nacc:
+            view[pos:] = acc.to_bytes(nacc >> 3, 'big')
+
+        self.current = n
+        self.step_count = steps
+        return count
+
+    def _fill_jump(self, view):
+        """
+        fill_bytes() için k adımlık sıçrama tablolu üretim.
+
+        n > 2^k olduğu sürece yörünge sıçrama içinde 1'e ulaşamaz (her adım
+        en fazla yarıya indirir); bu yüzden tek bir tablo araması ve büyük
+        sayı işlemiyle k bit üretilir. Küçük değerlerde, 1'e ulaşılınca
+        yeniden başlatmada ve tamponun sonunda adım adım üretime düşülür.
+        """
+        k = self.jump_bits
+        parity, mult, add = _jump_table(k)
+        mask = (1 << k) - 1
+        limit = 1 << k
+        count = len(view)
+        seed = self.seed
+        n = self.current
+        steps = self.step_count
+        remaining = count * 8
+        acc = 0
+        nacc = 0
+        pos = 0
+
+        while remaining:
+            if n > limit and remaining >= k:
+                r = n & mask
+                n = mult[r] * (n >> k) + add[r]
+                acc = (acc << k) | parity[r]
+                nacc += k
+                steps += k
+                remaining -= k
+            else:
+                if n <= 1:
+                    n = seed + steps
+                if n & 1:
+                    acc = (acc << 1) | 1
+                    n = 3 * n + 1
+                else:
+                    acc <<= 1
+                    n >>= 1
+                nacc += 1
+                steps += 1
+                remaining -= 1
+
+            # Tamamlanan byte'ları tampona yaz
+            while nacc >= 8:
+                nacc -= 8
+                view[pos] = (acc >> nacc) & 0xFF
+                pos += 1
+            acc &= (1 << nacc) - 1
+
+        self.current = n
+        self.step_count = steps
+        return count
 
     def generate_bytes(self, count):
         """
@@ -105,13 +653,102 @@ class CollatzPRNG:
         Returns:
             Byte listesi
         """
-        return bytes([self.next_byte() for _ in range(count)])
+        buffer = bytearray(count)
+        self.fill_bytes(buffer)
+        return bytes(buffer)
+
+    def getstate(self):
+        """
+        Üretecin mevcut durumunu döndürür.
+
+        Returns:
+            (seed, current, step_count) üçlüsünün kompakt byte kodlaması
+        """
+        return encode_state(self.seed, self.current, self.step_count)
+
+    def setstate(self, state):
+        """
+        getstate() ile alınmış bir duruma döner.
+
+        Args:
+            state: getstate() çıktısı
+        """
+        seed, current, step_count = decode_state(state)
+        if seed <= 1:
+            raise ValueError("Seed 1'den büyük pozitif tam sayı olmalı!")
+        if self.index is not None and self.index.seed != seed:
+            raise ValueError("Kontrol noktası indeksi farklı bir seed'e ait!")
+        self.seed = seed
+        self.current = current
+        self.step_count = step_count
+
+    @classmethod
+    def from_state(cls, state, jump_bits=None, index=None):
+        """
+        getstate() ile alınmış durumdan yeni bir üreteç oluşturur.
+
+        Args:
+            state: getstate() çıktısı
+            jump_bits: Bkz. __init__
+            index: Bkz. __init__
+
+        Returns:
+            Keystream'e kaldığı yerden devam eden üreteç
+        """
+        seed, current, step_count = decode_state(state)
+        prng = cls(seed, jump_bits, index)
+        prng.current = current
+        prng.step_count = step_count
+        return prng
+
+    def __reduce__(self):
+        # Pickle/multiprocessing için kompakt durum; yörünge önbelleği
+        # sürece özel olduğu için aktarılmaz
+        return _restore, (type(self), self.getstate(), self.jump_bits,
+                          self.index)
 
     def reset(self):
         """PRNG'yi başlangıç durumuna sıfırlar."""
         self.current = self.seed
         self.step_count = 0
 
+    def skip(self, count):
+        """
+        Çıktı üretmeden count bit ileri gider.
+
+        Args:
+            count: Atlanacak bit sayısı
+        """
+        if count < 0:
+            raise ValueError("Geriye doğru atlanamaz, seek() kullanın!")
+        scratch = bytearray(min(count >> 3, _SKIP_BLOCK))
+        while count >= 8:
+            view = memoryview(scratch)[:min(count >> 3, len(scratch))]
+            count -= self.fill_bytes(view) * 8
+        for _ in range(count):
+            self.next_bit()
+
+    def seek(self, bit_offset):
+        """
+        Keystream'de verilen bit konumuna gider.
+
+        Bit konumu step_count ile aynıdır. İndeks varsa hedefin önündeki en
+        yakın kontrol noktasından, yoksa mevcut konumdan veya baştan
+        başlanarak ileri üretilir.
+
+        Args:
+            bit_offset: Hedef bit konumu (0 = keystream başı)
+        """
+        if bit_offset < 0:
+            raise ValueError("Bit konumu negatif olamaz!")
+        if bit_offset < self.step_count:
+            self.reset()
+        if self.index is not None:
+            checkpoint = self.index.nearest(bit_offset)
+            if checkpoint[1] > self.step_count:
+                self.current, self.step_count = checkpoint
+        self.skip(bit_offset - self.step_count)
+
     def get_collatz_sequence(self, length=20):
         """
         Collatz dizisini döndürür (görselleştirme için).
@@ -138,6 +775,264 @@ class CollatzPRNG:
         return numbers, bits
 
 
+class TrajectoryCache:
+    """
+    Yeniden başlatma yörüngeleri için bellekle sınırlı LRU önbellek.
+
+    Bir başlangıç değerini, 1'e ulaşana kadarki paketlenmiş parite
+    vektörüne ve adım sayısına eşler. Yörüngenin bitleri yalnızca başlangıç
+    değerine bağlı olduğu için aynı değerden başlayan her yörünge (farklı
+    anahtarlarda veya aynı anahtarla tekrarlanan şifrelemelerde) önbellekten
+    kopyalanabilir. Birçok CollatzPRNG/CollatzCipher örneği ve iş parçacığı
+    arasında paylaşılabilir.
+
+    Önbelleksiz yörünge üretimi normal motorlardan yavaştır; bu yüzden bir
+    seed'in keystream'i ancak ikinci kez baştan üretilirken önbelleğe
+    alınır. Tek seferlik anahtarlar normal motorla, ek maliyetsiz üretilir.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_TRAJECTORY_CACHE_BYTES):
+        """
+        Args:
+            max_bytes: Yaklaşık toplam bellek sınırı (byte)
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bits_served = 0
+        self.evictions = 0
+        # başlangıç değeri -> (parite vektörü, adım sayısı)
+        self._entries = collections.OrderedDict()
+        # seed -> keystream'in baştan kaç kez üretildiği
+        self._uses = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cost(start, length):
+        """Bir girdinin yaklaşık bellek maliyeti (byte)."""
+        return (length + start.bit_length()) // 8 + _TRAJECTORY_OVERHEAD
+
+    def admit(self, seed, starting):
+        """
+        Seed'in keystream'inin önbellek üzerinden üretilip üretilmeyeceğini
+        belirler.
+
+        Args:
+            seed: PRNG'nin seed değeri
+            starting: Keystream baştan üretilmeye başlanıyorsa True
+
+        Returns:
+            Seed en az ikinci kez baştan üretiliyorsa True
+        """
+        with self._lock:
+            uses = self._uses.get(seed, 0)
+            if starting:
+                uses += 1
+                self._uses[seed] = uses
+                if len(self._uses) > _ADMIT_SEEDS:
+                    self._uses.popitem(last=False)
+            if uses:
+                self._uses.move_to_end(seed)
+            return uses >= 2
+
+    def get(self, start, limit):
+        """
+        Başlangıç değerinin yörüngesini döndürür.
+
+        Args:
+            start: Yörüngenin başlangıç değeri
+            limit: Kullanılabilecek en fazla bit sayısı
+
+        Returns:
+            (parite vektörü, adım sayısı) veya yörünge yoksa ya da limit'ten
+            uzunsa None
+        """
+        with self._lock:
+            entry = self._entries.get(start)
+            if entry is None or entry[1] > limit:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(start)
+            self.hits += 1
+            self.bits_served += entry[1]
+            return entry
+
+    def put(self, start, vector, length):
+        """
+        Bir yörüngeyi önbelleğe ekler.
+
+        Args:
+            start: Yörüngenin başlangıç değeri
+            vector: Parite bitleri (ilk adım en anlamlı bit)
+            length: Adım sayısı (1'e ulaşana kadar)
+        """
+        cost = self._cost(start, length)
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            if start in self._entries:
+                return
+            self._entries[start] = (vector, length)
+            self.total_bytes += cost
+            while self.total_bytes > self.max_bytes:
+                old, (_, old_length) = self._entries.popitem(last=False)
+                self.total_bytes -= self._cost(old, old_length)
+                self.evictions += 1
+
+    def stats(self):
+        """
+        Önbellek sayaçlarını döndürür.
+
+        Returns:
+            hits, misses, hit_rate, bits_served, evictions, entries ve
+            total_bytes içeren sözlük
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "bits_served": self.bits_served,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "total_bytes": self.total_bytes,
+        }
+
+    def clear(self):
+        """Tüm yörüngeleri ve seed kullanım sayılarını atar."""
+        with self._lock:
+            self._entries.clear()
+            self._uses.clear()
+            self.total_bytes = 0
+
+
+# Süreç genelinde paylaşılan varsayılan yörünge önbelleği
+shared_trajectory_cache = TrajectoryCache()
+
+
+class CheckpointIndex:
+    """
+    Bir seed'in keystream'i için kontrol noktası indeksi.
+
+    Her `interval` byte'ta bir (offset, current, step_count) anlık
+    görüntüsü saklar. Bir kez oluşturulup dosyaya kaydedilebilir ve
+    CollatzPRNG.seek() tarafından yeniden kullanılır.
+    """
+
+    def __init__(self, seed, interval=1 << 20, jump_bits=None):
+        """
+        Args:
+            seed: Keystream'in seed değeri
+            interval: Kontrol noktaları arası byte sayısı
+            jump_bits: İndeks oluşturulurken kullanılacak sıçrama genişliği
+        """
+        if interval <= 0:
+            raise ValueError("Kontrol noktası aralığı pozitif olmalı!")
+        self.seed = seed
+        self.interval = interval
+        self.jump_bits = jump_bits
+        # (byte_offset, current, step_count); ilk nokta keystream başı
+        self.checkpoints = [(0, seed, 0)]
+
+    @classmethod
+    def build(cls, seed, length, interval=1 << 20, jump_bits=None):
+        """
+        length byte'lık keystream'i kapsayan bir indeks oluşturur.
+
+        Args:
+            seed: Keystream'in seed değeri
+            length: Kapsanacak keystream uzunluğu (byte)
+            interval: Kontrol noktaları arası byte sayısı
+            jump_bits: Üretimde kullanılacak sıçrama genişliği
+
+        Returns:
+            CheckpointIndex
+        """
+        index = cls(seed, interval, jump_bits)
+        index.extend(length)
+        return index
+
+    @property
+    def covered(self):
+        """İndeksin kapsadığı son kontrol noktasının byte konumu."""
+        return self.checkpoints[-1][0]
+
+    def extend(self, length):
+        """
+        İndeksi en az length byte'ı kapsayacak şekilde büyütür.
+
+        Args:
+            length: Kapsanacak keystream uzunluğu (byte)
+        """
+        offset, current, step_count = self.checkpoints[-1]
+        if offset + self.interval > length:
+            return
+        prng = CollatzPRNG(self.seed, jump_bits=self.jump_bits)
+        prng.current, prng.step_count = current, step_count
+        block = bytearray(self.interval)
+        while offset + self.interval <= length:
+            prng.fill_bytes(block)
+            offset += self.interval
+            self.checkpoints.append((offset, prng.current, prng.step_count))
+
+    def nearest(self, bit_offset):
+        """
+        Verilen bit konumunun önündeki en yakın kontrol noktasını bulur.
+
+        Args:
+            bit_offset: Hedef bit konumu
+
+        Returns:
+            (current, step_count) tuple'ı
+        """
+        i = min((bit_offset >> 3) // self.interval, len(self.checkpoints) - 1)
+        _, current, step_count = self.checkpoints[i]
+        return current, step_count
+
+    def save(self, path):
+        """
+        İndeksi JSON dosyasına kaydeder.
+
+        Büyük sayılar, JSON'daki ondalık basamak sınırına takılmamak için
+        onaltılık metin olarak yazılır.
+
+        Args:
+            path: Dosya yolu
+        """
+        data = {
+            "seed": hex(self.seed),
+            "interval": self.interval,
+            "jump_bits": self.jump_bits,
+            "checkpoints": [
+                [offset, hex(current), step_count]
+                for offset, current, step_count in self.checkpoints
+            ],
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Kaydedilmiş indeksi yükler.
+
+        Args:
+            path: Dosya yolu
+
+        Returns:
+            CheckpointIndex
+        """
+        with open(path) as f:
+            data = json.load(f)
+        index = cls(int(data["seed"], 16), data["interval"], data["jump_bits"])
+        index.checkpoints = [
+            (offset, int(current, 16), step_count)
+            for offset, current, step_count in data["checkpoints"]
+        ]
+        return index
+
+
 def collatz_sequence(n, max_steps=100):
     """
     Bir sayının Collatz dizisini döndürür.
@@ -0,0 +1,174 @@
+"""
+Collatz Cipher - random.Random Uyumlu Üreteç
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+`random` modülü arayüzüyle yazılmış (simülasyon vb.) kodların Collatz
+PRNG'yi kullanabilmesi için random.Random alt sınıfı sağlar. getrandbits()
+bitleri tek tek next_bit() çağrılarıyla değil, fill_bytes() ile toplu
+üretilen bir bit havuzundan alır; randrange, choice, shuffle, sample gibi
+kalıtılan metotlar da bu sayede toplu hızda çalışır.
+
+Bit sırası CollatzPRNG ile aynıdır: getrandbits(k), aynı konumdaki bir
+CollatzPRNG'nin next_int(k) sonucuna eşittir.
+
+Kullanım:
+    rng = CollatzRandom(2024)
+    rng.shuffle(liste)
+    x = rng.random()
+"""
+
+import hashlib
+import os
+import random
+
+from collatz_prng import CollatzPRNG, encode_state
+
+
+# Havuz her dolduruluşunda en az bu kadar keystream üretilir (byte)
+_POOL_BYTES = 1 << 10
+
+# getstate() biçim sürümü
+_VERSION = 1
+
+# random() için 53 bitlik kesir çarpanı
+_RECIP_BPF = 2.0 ** -53
+
+
+def _derive(data):
+    """Byte dizisinden random modülündeki gibi SHA-512 ile seed türetir."""
+    return int.from_bytes(data + hashlib.sha512(data).digest(), 'big')
+
+
+class CollatzRandom(random.Random):
+    """
+    CollatzPRNG destekli random.Random.
+
+    getstate()/setstate() PRNG'nin (seed, current, step_count) durumuna
+    karşılık gelir; havuzda bekleyen bitler durumun parçası değildir,
+    kaydedilen durum tam olarak tüketilen bit konumunu gösterir.
+    """
+
+    def __init__(self, x=None, jump_bits=None):
+        """
+        Args:
+            x: Seed (1'den büyük tam sayı, str/bytes veya None: os.urandom)
+            jump_bits: CollatzPRNG sıçrama tablosu genişliği (None: kapalı)
+        """
+        self._jump_bits = jump_bits
+        super().__init__(x)
+
+    def seed(self, a=None, version=2):
+        """
+        Üreteci yeniden başlatır.
+
+        Kabul edilen türler random.Random ile aynıdır. Tam sayıların mutlak
+        değeri 1'den büyükse doğrudan PRNG seed'i olarak kullanılır; 0 ve
+        1 ile str/bytes random modülündeki gibi SHA-512 ile tam sayıya
+        çevrilir. float değerler hash() ile tam sayıya çevrilir.
+
+        Args:
+            a: Seed değeri (None: os.urandom)
+            version: random.Random ile uyumluluk için (kullanılmaz)
+        """
+        if a is None:
+            a = int.from_bytes(os.urandom(32), 'big') | (1 << 255)
+        elif isinstance(a, float):
+            a = hash(a)
+        elif isinstance(a, (str, bytes, bytearray)):
+            a = _derive(a.encode() if isinstance(a, str) else bytes(a))
+        elif not isinstance(a, int):
+            raise TypeError("Seed None, int, float, str, bytes veya "
+                            "bytearray olmalı!")
+        a = abs(a)
+        if a <= 1:
+            a = _derive(a.to_bytes(1, 'big'))
+        self._prng = CollatzPRNG(a, jump_bits=self._jump_bits)
+        self._bits = 0
+        self._nbits = 0
+        self.gauss_next = None
+
+    def _refill(self, count):
+        """Havuza en az count bit ekler (havuz boşken çağrılır)."""
+        nbytes = max(_POOL_BYTES, (count + 7) >> 3)
+        self._pool_start = (self._prng.current, self._prng.step_count)
+        self._bits = int.from_bytes(self._prng.generate_bytes(nbytes), 'big')
+        self._nbits = nbytes * 8
+
+    def getrandbits(self, k):
+        """
+        k rastgele bitten oluşan negatif olmayan tam sayı döndürür.
+
+        Args:
+            k: Bit sayısı
+
+        Returns:
+            0 <= sonuç < 2**k
+        """
+        if k < 0:
+            raise ValueError("Bit sayısı negatif olamaz!")
+        value = 0
+        need = k
+        while need:
+            if not self._nbits:
+                self._refill(need)
+            take = need if need < self._nbits else self._nbits
+            self._nbits -= take
+            value = (value << take) | (self._bits >> self._nbits)
+            self._bits &= (1 << self._nbits) - 1
+            need -= take
+        return value
+
+    def random(self):
+        """
+        [0.0, 1.0) aralığında rastgele kayan noktalı sayı döndürür.
+
+        Returns:
+            53 bitlik çözünürlükte float
+        """
+        return self.getrandbits(53) * _RECIP_BPF
+
+    def randbytes(self, n):
+        """
+        n rastgele byte döndürür (keystream ile aynı byte sırasında).
+
+        Args:
+            n: Byte sayısı
+
+        Returns:
+            bytes
+        """
+        return self.getrandbits(n * 8).to_bytes(n, 'big')
+
+    def getstate(self):
+        """
+        Üretecin durumunu döndürür.
+
+        Returns:
+            (sürüm, PRNG durumu, jump_bits, gauss_next) tuple'ı
+        """
+        prng = self._prng
+        if self._nbits:
+            # PRNG havuzun sonunda; havuz başından tüketilen konuma kadar
+            # yeniden üret
+            rewind = CollatzPRNG(prng.seed)
+            rewind.current, rewind.step_count = self._pool_start
+            rewind.skip(prng.step_count - self._nbits - rewind.step_count)
+            prng = rewind
+        state = encode_state(prng.seed, prng.current, prng.step_count)
+        return _VERSION, state, self._jump_bits, self.gauss_next
+
+    def setstate(self, state):
+        """
+        getstate() ile alınmış duruma döner.
+
+        Args:
+            state: getstate() çıktısı
+        """
+        version, prng_state, jump_bits, gauss_next = state
+        if version != _VERSION:
+            raise ValueError("Desteklenmeyen durum sürümü!")
+        self._jump_bits = jump_bits
+        self._prng = CollatzPRNG.from_state(prng_state, jump_bits)
+        self._bits = 0
+        self._nbits = 0
+        self.gauss_next = gauss_next
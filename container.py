@@ -0,0 +1,341 @@
+"""
+Collatz Cipher - Parçalı ve İndeksli Şifreli Kap Formatı
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Ham XOR çıktısının yapısı olmadığı için bir byte aralığını çözmek tüm
+önceki keystream'in üretilmesini gerektirir. Bu modülün kap formatı her
+parça sınırındaki PRNG durumunu şifreli bir indekste saklar; böylece
+herhangi bir aralık en yakın parçadan başlanarak çözülebilir ve parçalar
+paralel çözülebilir.
+
+Dosya düzeni:
+    [başlık][parça 0][parça 1]...[parça n-1][şifreli indeks][son ek]
+
+- Başlık : sihirli sayı, sürüm, parça boyutu
+- Parçalar: encrypt_bytes çıktısıyla aynı şifreli veri, chunk_size'lık
+- İndeks : her parça başındaki (step_count, current); anahtardan türetilen
+           ayrı bir anahtarla şifrelenir
+- Son ek : indeks uzunluğu, veri uzunluğu, HMAC etiketi, sihirli sayı
+
+Komut satırı:
+    python container.py pack ANAHTAR GIRDI CIKTI [--chunk-size N]
+    python container.py unpack ANAHTAR GIRDI CIKTI [--jobs N]
+"""
+
+import argparse
+import collections
+import hashlib
+import hmac
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from collatz_prng import CollatzPRNG
+from cipher import CollatzCipher, xor_bytes
+
+
+# Varsayılan parça boyutu (byte)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_MAGIC = b'CLZC'
+_INDEX_MAGIC = b'CLZI'
+_VERSION = 1
+
+# Başlık: sihirli sayı, sürüm, parça boyutu
+_HEADER = struct.Struct('>4sBxxxI')
+# Son ek: indeks uzunluğu, veri uzunluğu, HMAC-SHA256 etiketi, sihirli sayı
+_TRAILER = struct.Struct('>QQ32s4s')
+# İndeks girdisi: step_count, current'ın byte uzunluğu (ardından current)
+_ENTRY = struct.Struct('>QI')
+
+
+def _key_bytes(key):
+    """Anahtarı byte dizisine çevirir."""
+    return key.to_bytes((key.bit_length() + 7) // 8, 'big')
+
+
+def _index_cipher(key):
+    """İndeksi şifrelemek için anahtardan türetilmiş ayrı bir şifre üretir."""
+    digest = hashlib.blake2b(_key_bytes(key), person=b'collatz-index').digest()
+    return CollatzCipher(int.from_bytes(digest, 'big') | (1 << 511))
+
+
+def _tag(key, header, encrypted_index, length):
+    """Başlık, şifreli indeks ve uzunluk için HMAC etiketi hesaplar."""
+    mac = hmac.new(_key_bytes(key), digestmod=hashlib.sha256)
+    mac.update(header)
+    mac.update(struct.pack('>Q', length))
+    mac.update(encrypted_index)
+    return mac.digest()
+
+
+def _encode_index(states):
+    """(current, step_count) listesini byte dizisine çevirir."""
+    parts = []
+    for current, step_count in states:
+        raw = _key_bytes(current)
+        parts.append(_ENTRY.pack(step_count, len(raw)))
+        parts.append(raw)
+    return b''.join(parts)
+
+
+def _decode_index(blob):
+    """_encode_index çıktısını (current, step_count) listesine çevirir."""
+    states = []
+    offset = 0
+    while offset < len(blob):
+        step_count, size = _ENTRY.unpack_from(blob, offset)
+        offset += _ENTRY.size
+        current = int.from_bytes(blob[offset:offset + size], 'big')
+        offset += size
+        states.append((current, step_count))
+    return states
+
+
+def _read_full(src, size):
+    """Akış sonuna gelinmedikçe tam size byte okur."""
+    parts = []
+    while size:
+        chunk = src.read(size)
+        if not chunk:
+            break
+        parts.append(chunk)
+        size -= len(chunk)
+    return b''.join(parts)
+
+
+def pack(src, dst, key, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    src akışını şifreleyip kap formatında dst'ye yazar.
+
+    Args:
+        src: Düz veriyi içeren ikili dosya nesnesi
+        dst: Kabın yazılacağı ikili dosya nesnesi
+        key: Şifreleme anahtarı
+        chunk_size: Parça boyutu (byte)
+
+    Returns:
+        Şifrelenen veri uzunluğu (byte)
+    """
+    if chunk_size <= 0:
+        raise ValueError("Parça boyutu pozitif olmalı!")
+    header = _HEADER.pack(_MAGIC, _VERSION, chunk_size)
+    dst.write(header)
+
+    context = CollatzCipher(key).encryptor()
+    states = []
+    length = 0
+    while True:
+        chunk = _read_full(src, chunk_size)
+        if not chunk:
+            break
+        states.append(context.state)
+        dst.write(context.update(chunk))
+        length += len(chunk)
+
+    encrypted_index = _index_cipher(key).encrypt_bytes(_encode_index(states))
+    dst.write(encrypted_index)
+    dst.write(_TRAILER.pack(len(encrypted_index), length,
+                            _tag(key, header, encrypted_index, length),
+                            _INDEX_MAGIC))
+    return length
+
+
+def _decrypt_chunk(path, key, state, start, end):
+    """
+    Paralel çözmede bir işçinin [start, end) aralığındaki parçayı çözer.
+
+    Returns:
+        Çözülmüş byte dizisi
+    """
+    with open(path, 'rb') as f:
+        f.seek(_HEADER.size + start)
+        data = _read_full(f, end - start)
+    prng = CollatzPRNG(key)
+    prng.current, prng.step_count = state
+    return xor_bytes(data, prng.generate_bytes(len(data)))
+
+
+class ContainerReader:
+    """
+    Kap formatındaki şifreli veriden rastgele erişimle okuma yapar.
+
+    Kullanım:
+        with ContainerReader('veri.clz', anahtar) as reader:
+            parca = reader.read_range(start, end)
+    """
+
+    def __init__(self, path, key):
+        """
+        Args:
+            path: Kap dosyasının yolu
+            key: Şifreleme anahtarı
+
+        Raises:
+            ValueError: Dosya kap formatında değilse, anahtar yanlışsa veya
+                indeks değiştirilmişse
+        """
+        self.path = path
+        self.key = key
+        self._file = open(path, 'rb')
+        try:
+            self._load_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _load_index(self):
+        """Başlığı ve son eki okur, etiketi doğrular ve indeksi çözer."""
+        f = self._file
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError("Geçersiz kap dosyası!")
+        magic, version, self.chunk_size = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Geçersiz kap dosyası!")
+
+        # Son ekin sığmadığı kısa dosyalarda seek OSError verirdi
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size + _TRAILER.size:
+            raise ValueError("Geçersiz kap dosyası!")
+        f.seek(size - _TRAILER.size)
+        index_length, self.length, tag, magic = _TRAILER.unpack(
+            f.read(_TRAILER.size))
+        if (magic != _INDEX_MAGIC or _HEADER.size + self.length
+                + index_length + _TRAILER.size != size):
+            raise ValueError("Geçersiz kap dosyası!")
+
+        f.seek(_HEADER.size + self.length)
+        encrypted_index = f.read(index_length)
+        expected = _tag(self.key, header, encrypted_index, self.length)
+        if not hmac.compare_digest(tag, expected):
+            raise ValueError("İndeks doğrulanamadı (yanlış anahtar veya "
+                             "bozuk dosya)!")
+        self.states = _decode_index(
+            _index_cipher(self.key).decrypt_bytes(encrypted_index))
+
+    @property
+    def chunk_count(self):
+        """Kaptaki parça sayısı."""
+        return len(self.states)
+
+    def read_range(self, start, end):
+        """
+        Düz verinin [start, end) byte aralığını çözer.
+
+        Okuma start'ı içeren parçanın başındaki PRNG durumundan başlar;
+        önceki parçaların keystream'i üretilmez.
+
+        Args:
+            start: Aralık başlangıcı (byte)
+            end: Aralık sonu (byte, hariç)
+
+        Returns:
+            Çözülmüş byte dizisi
+        """
+        if not 0 <= start <= end <= self.length:
+            raise ValueError("Geçersiz byte aralığı!")
+        if start == end:
+            return b''
+        chunk = start // self.chunk_size
+        prng = CollatzPRNG(self.key)
+        prng.current, prng.step_count = self.states[chunk]
+        prng.skip((start - chunk * self.chunk_size) * 8)
+
+        self._file.seek(_HEADER.size + start)
+        data = _read_full(self._file, end - start)
+        return xor_bytes(data, prng.generate_bytes(len(data)))
+
+    def read_chunk(self, index):
+        """
+        Tek bir parçayı çözer.
+
+        Args:
+            index: Parça numarası
+
+        Returns:
+            Çözülmüş byte dizisi
+        """
+        start = index * self.chunk_size
+        return self.read_range(start, min(start + self.chunk_size,
+                                          self.length))
+
+    def unpack(self, dst, jobs=1):
+        """
+        Tüm veriyi çözüp dst'ye yazar.
+
+        jobs > 1 ise parçalar işlemler arasında paralel çözülür ve sırayla
+        yazılır; bellekte aynı anda en fazla 2 * jobs parça bulunur.
+
+        Args:
+            dst: Yazılacak ikili dosya nesnesi
+            jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+
+        Returns:
+            Yazılan byte sayısı
+        """
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        if jobs <= 1:
+            for index in range(self.chunk_count):
+                dst.write(self.read_chunk(index))
+            return self.length
+
+        pending = collections.deque()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for index, state in enumerate(self.states):
+                start = index * self.chunk_size
+                end = min(start + self.chunk_size, self.length)
+                pending.append(pool.submit(_decrypt_chunk, self.path, self.key,
+                                           state, start, end))
+                if len(pending) >= 2 * jobs:
+                    dst.write(pending.popleft().result())
+            while pending:
+                dst.write(pending.popleft().result())
+        return self.length
+
+    def close(self):
+        """Dosyayı kapatır."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: pack / unpack."""
+    parser = argparse.ArgumentParser(
+        description="Collatz Cipher parçalı kap formatı")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pack_parser = commands.add_parser("pack", help="Dosyayı şifreleyip paketle")
+    pack_parser.add_argument("key", type=lambda v: int(v, 0))
+    pack_parser.add_argument("input")
+    pack_parser.add_argument("output")
+    pack_parser.add_argument("--chunk-size", type=int,
+                             default=DEFAULT_CHUNK_SIZE)
+
+    unpack_parser = commands.add_parser("unpack", help="Paketi çöz")
+    unpack_parser.add_argument("key", type=lambda v: int(v, 0))
+    unpack_parser.add_argument("input")
+    unpack_parser.add_argument("output")
+    unpack_parser.add_argument("--jobs", type=int, default=1)
+
+    args = parser.parse_args(argv)
+    if args.key <= 1:
+        parser.error("Anahtar 1'den büyük pozitif tam sayı olmalı!")
+
+    if args.command == "pack":
+        with open(args.input, 'rb') as src, open(args.output, 'wb') as dst:
+            pack(src, dst, args.key, args.chunk_size)
+    else:
+        with ContainerReader(args.input, args.key) as reader, \
+                open(args.output, 'wb') as dst:
+            reader.unpack(dst, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
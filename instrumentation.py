@@ -0,0 +1,247 @@
+"""
+Collatz Cipher - Ölçüm Sayaçları ve Profil Kancaları
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Keystream hızı düştüğünde nedenini görmek için isteğe bağlı ölçüm sağlar:
+adım sayısı, tek/çift oranı, yeniden başlatmalar (seed + step_count),
+current'ın ulaştığı en büyük bit uzunluğu, şifrelenen byte sayısı ve
+sürenin üretim / XOR / G/Ç arasındaki dağılımı.
+
+Ölçüm kapalıyken sıcak yollar değişmez: sayaçlar yalnızca
+InstrumentedCollatzPRNG alt sınıfında tutulur, şifreleme yardımcıları ise
+çağrı başına bir kez stats özelliğine bakar.
+
+Kullanım:
+    cipher = CollatzCipher(anahtar)
+    stats = cipher.enable_stats(hooks=[lambda olay, bilgi: print(olay, bilgi)])
+    cipher.encrypt_file('girdi.bin', 'cikti.bin')
+    print(stats.as_dict())
+"""
+
+import time
+
+from collatz_prng import CollatzPRNG
+
+
+class CollatzStats:
+    """
+    PRNG ve şifreleme ölçüm sayaçları.
+
+    Kancalar (hooks) `kanca(olay, bilgi)` biçiminde çağrılır. Olaylar:
+    - 'restart'  : Yörünge 1'e ulaşıp yeniden başlatıldı (value, step_count)
+    - 'peak'     : current yeni bir en büyük bit uzunluğuna ulaştı (bits)
+    - 'generate' : Bir keystream bloğu üretildi (bytes, seconds)
+    - 'xor'      : Bir blok XOR'landı (bytes, seconds)
+    - 'io'       : Bir parça okundu/yazıldı (bytes, seconds)
+    """
+
+    def __init__(self, trace=True, hooks=()):
+        """
+        Args:
+            trace: True ise yeniden başlatmalar ve en büyük bit uzunluğu da
+                izlenir (üretim adım adım yapılır, daha yavaştır)
+            hooks: Olay kancaları listesi
+        """
+        self.trace = trace
+        self.hooks = list(hooks)
+        self.reset()
+
+    def reset(self):
+        """Tüm sayaçları sıfırlar."""
+        self.steps = 0
+        self.odd_steps = 0
+        self.restarts = 0
+        self.peak_bits = 0
+        self.bytes_generated = 0
+        self.bytes_encrypted = 0
+        self.generate_seconds = 0.0
+        self.xor_seconds = 0.0
+        self.io_seconds = 0.0
+
+    def add_hook(self, hook):
+        """Olay kancası ekler."""
+        self.hooks.append(hook)
+
+    def emit(self, event, **info):
+        """Olayı tüm kancalara iletir."""
+        for hook in self.hooks:
+            hook(event, info)
+
+    def record_generate(self, count, seconds):
+        """Bir keystream bloğunun üretimini kaydeder."""
+        self.bytes_generated += count
+        self.generate_seconds += seconds
+        if self.hooks:
+            self.emit('generate', bytes=count, seconds=seconds)
+
+    def record_xor(self, count, seconds):
+        """Bir bloğun XOR'lanmasını kaydeder."""
+        self.bytes_encrypted += count
+        self.xor_seconds += seconds
+        if self.hooks:
+            self.emit('xor', bytes=count, seconds=seconds)
+
+    def record_io(self, count, seconds):
+        """Bir parçanın okunup yazılmasını kaydeder."""
+        self.io_seconds += seconds
+        if self.hooks:
+            self.emit('io', bytes=count, seconds=seconds)
+
+    def as_dict(self):
+        """
+        Sayaçları sözlük olarak döndürür.
+
+        trace=False iken restarts ve peak_bits ölçülmediği için None olur.
+
+        Returns:
+            Sayaçları ve türetilmiş oranları içeren sözlük
+        """
+        return {
+            "steps": self.steps,
+            "odd_steps": self.odd_steps,
+            "even_steps": self.steps - self.odd_steps,
+            "odd_ratio": self.odd_steps / self.steps if self.steps else 0.0,
+            "restarts": self.restarts if self.trace else None,
+            "peak_bits": self.peak_bits if self.trace else None,
+            "bytes_generated": self.bytes_generated,
+            "bytes_encrypted": self.bytes_encrypted,
+            "generate_seconds": self.generate_seconds,
+            "xor_seconds": self.xor_seconds,
+            "io_seconds": self.io_seconds,
+        }
+
+
+class InstrumentedCollatzPRNG(CollatzPRNG):
+    """
+    Sayaçlarını bir CollatzStats nesnesine yazan CollatzPRNG.
+
+    Bit dizisi CollatzPRNG ile birebir aynıdır. trace=False iken üretim
+    normal hızlı yoldan yapılır ve yalnızca adım, tek adım (çıktıdaki 1
+    bitleri), byte ve süre sayılır.
+    """
+
+    __slots__ = ('stats',)
+
+    def __init__(self, seed, jump_bits=None, index=None, stats=None):
+        """
+        Args:
+            seed: Başlangıç değeri (pozitif tam sayı, 1'den büyük olmalı)
+            jump_bits: Bkz. CollatzPRNG
+            index: Bkz. CollatzPRNG
+            stats: Sayaçların yazılacağı CollatzStats (None ise yeni oluşturulur)
+        """
+        super().__init__(seed, jump_bits, index)
+        self.stats = stats if stats is not None else CollatzStats()
+        self.stats.peak_bits = max(self.stats.peak_bits, seed.bit_length())
+
+    def next_bit(self):
+        """
+        Bir sonraki rastgele biti üretir ve sayaçları günceller.
+
+        Returns:
+            0 veya 1
+        """
+        stats = self.stats
+        if stats.trace and self.current <= 1:
+            self._restart(stats, self.seed + self.step_count, self.step_count)
+        bit = super().next_bit()
+        stats.steps += 1
+        stats.odd_steps += bit
+        if stats.trace and bit:
+            self._observe_peak(stats, self.current.bit_length())
+        return bit
+
+    @staticmethod
+    def _restart(stats, value, step_count):
+        """Yeniden başlatmayı kaydeder."""
+        stats.restarts += 1
+        if stats.hooks:
+            stats.emit('restart', value=value, step_count=step_count)
+
+    @staticmethod
+    def _observe_peak(stats, bits):
+        """Yeni bir en büyük bit uzunluğunu kaydeder."""
+        if bits > stats.peak_bits:
+            stats.peak_bits = bits
+            if stats.hooks:
+                stats.emit('peak', bits=bits)
+
+    def fill_bytes(self, buffer):
+        """
+        Tamponu keystream ile doldurur ve sayaçları günceller.
+
+        Args:
+            buffer: Yazılabilir tampon
+
+        Returns:
+            Yazılan byte sayısı
+        """
+        stats = self.stats
+        view = memoryview(buffer).cast('B')
+        steps = self.step_count
+        start = time.perf_counter()
+        if stats.trace:
+            count = self._fill_traced(view, stats)
+        else:
+            count = super().fill_bytes(view)
+        elapsed = time.perf_counter() - start
+
+        stats.steps += self.step_count - steps
+        stats.odd_steps += int.from_bytes(view, 'big').bit_count()
+        stats.record_generate(count, elapsed)
+        return count
+
+    def _fill_traced(self, view, stats):
+        """
+        Yeniden başlatmaları ve en büyük bit uzunluğunu izleyerek üretir.
+
+        Çift sayılarda sondaki sıfırlar tek kaydırmayla geçilir; current
+        yalnızca tek adımda büyüyebildiği için bit uzunluğu orada ölçülür.
+        """
+        count = len(view)
+        seed = self.seed
+        n = self.current
+        steps = self.step_count
+        remaining = count * 8
+        acc = 0
+        nacc = 0
+        pos = 0
+
+        while remaining:
+            if n <= 1:
+                n = seed + steps
+                self._restart(stats, n, steps)
+                self._observe_peak(stats, n.bit_length())
+            if n & 1:
+                n = 3 * n + 1
+                acc = (acc << 1) | 1
+                nacc += 1
+                steps += 1
+                remaining -= 1
+                if n.bit_length() > stats.peak_bits:
+                    self._observe_peak(stats, n.bit_length())
+            else:
+                z = (n & -n).bit_length() - 1
+                if z > remaining:
+                    z = remaining
+                n >>= z
+                acc <<= z
+                nacc += z
+                steps += z
+                remaining -= z
+
+            # Biriken bitleri topluca tampona yaz
+            if nacc >= 64:
+                rem = nacc & 7
+                nbytes = nacc >> 3
+                view[pos:pos + nbytes] = (acc >> rem).to_bytes(nbytes, 'big')
+                pos += nbytes
+                nacc = rem
+                acc &= (1 << rem) - 1
+
+        if nacc:
+            view[pos:] = acc.to_bytes(nacc >> 3, 'big')
+
+        self.current = n
+        self.step_count = steps
+        return count
@@ -0,0 +1,364 @@
+"""
+Collatz Cipher - Keystream Önek Depoları
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Aynı anahtarlarla tekrar tekrar şifreleme yapılırken keystream'in her
+seferinde yeniden üretilmemesi için anahtar başına keystream önekini
+saklar:
+- KeystreamStore       : Önekleri diskte saklar ve mmap ile sunar
+- KeystreamPrefixCache : Önekleri işlem belleğinde tutar
+
+Disk deposunda her anahtar için iki dosya tutulur:
+- <ad>.ks   : Ham keystream byte'ları
+- <ad>.json : Anahtar, uzunluk, CRC32 ve öneki uzatmak için PRNG durumu
+
+Not: Depo keystream'in kendisini sakladığı için dizin anahtar kadar
+gizli tutulmalıdır.
+"""
+
+import collections
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+import zlib
+
+from collatz_prng import CollatzPRNG
+
+
+# Deponun varsayılan toplam boyut sınırı (byte)
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Önekler bu boyutun katlarına yuvarlanarak büyütülür (byte)
+_GROW_BLOCK = 1 << 16
+
+# Bellek içi önek önbelleğinin varsayılan boyut sınırı (byte)
+DEFAULT_PREFIX_CACHE_BYTES = 1 << 26
+
+
+class KeystreamStore:
+    """
+    Anahtar başına keystream öneklerini diskte tutan LRU depo.
+
+    Önekler, daha uzun bir keystream istendiğinde tembel olarak büyütülür.
+    Toplam boyut max_bytes'ı aşarsa en uzun süredir kullanılmayan anahtarlar
+    silinir. Bir önek bu işlemde ilk kez kullanılırken CRC32 ile doğrulanır;
+    bozuk önekler atılıp yeniden üretilir.
+
+    Depo tek bir işlem tarafından kullanılmak üzere tasarlanmıştır.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Deponun dizini (yoksa oluşturulur)
+            max_bytes: Toplam keystream boyutu sınırı (byte)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+        self._entries = {}
+        self._maps = {}
+        self._verified = set()
+        self._load_entries()
+
+    def _paths(self, name):
+        """Bir girdinin veri ve meta dosyası yollarını döndürür."""
+        base = os.path.join(self.directory, name)
+        return base + ".ks", base + ".json"
+
+    @staticmethod
+    def _name(key):
+        """Anahtardan dosya adı türetir."""
+        return hashlib.sha256(hex(key).encode()).hexdigest()[:32]
+
+    def _load_entries(self):
+        """Dizindeki girdileri okur, boyutu tutarsız olanları siler."""
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json"):
+                continue
+            name = filename[:-5]
+            data_path, meta_path = self._paths(name)
+            try:
+                with open(meta_path) as f:
+                    meta = json.load(f)
+                valid = os.path.getsize(data_path) == meta["length"]
+            except (OSError, ValueError, KeyError):
+                valid = False
+            if not valid:
+                self._remove(name)
+                continue
+            meta["atime"] = os.stat(meta_path).st_mtime
+            self._entries[name] = meta
+
+    def _verify(self, name, meta):
+        """Veri dosyasının CRC32 değerini meta ile karşılaştırır."""
+        data_path, _ = self._paths(name)
+        crc = 0
+        with open(data_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                crc = zlib.crc32(block, crc)
+        return crc == meta["crc"]
+
+    def _write_meta(self, name, meta):
+        """Meta dosyasını atomik olarak yazar."""
+        _, meta_path = self._paths(name)
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({k: v for k, v in meta.items() if k != "atime"}, f)
+        os.replace(tmp_path, meta_path)
+
+    def _close_map(self, name):
+        """Girdinin açık mmap'ini kapatır."""
+        mm = self._maps.pop(name, None)
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                # Çağıran hâlâ bir görünüm tutuyor; çöp toplayıcı kapatır
+                pass
+
+    def _remove(self, name):
+        """Girdiyi bellekten ve diskten siler."""
+        self._close_map(name)
+        self._entries.pop(name, None)
+        self._verified.discard(name)
+        for path in self._paths(name):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _grow(self, key, name, meta, length, jump_bits=None):
+        """Öneki en az length byte olacak şekilde sonuna ekleyerek büyütür."""
+        target = -(-length // _GROW_BLOCK) * _GROW_BLOCK
+        prng = CollatzPRNG(key, jump_bits=jump_bits)
+        if meta is None:
+            meta = {"key": hex(key), "length": 0, "crc": 0,
+                    "current": hex(key), "step_count": 0}
+        prng.current = int(meta["current"], 16)
+        prng.step_count = meta["step_count"]
+
+        self._close_map(name)
+        data_path, _ = self._paths(name)
+        crc = meta["crc"]
+        block = bytearray(_GROW_BLOCK)
+        with open(data_path, 'ab') as f:
+            for _ in range((target - meta["length"]) // _GROW_BLOCK):
+                prng.fill_bytes(block)
+                crc = zlib.crc32(block, crc)
+                f.write(block)
+
+        meta.update(length=target, crc=crc, current=hex(prng.current),
+                    step_count=prng.step_count)
+        self._write_meta(name, meta)
+        self._entries[name] = meta
+        self._verified.add(name)
+        return meta
+
+    def _touch(self, name):
+        """Girdinin son kullanım zamanını günceller."""
+        _, meta_path = self._paths(name)
+        now = time.time()
+        os.utime(meta_path, (now, now))
+        self._entries[name]["atime"] = now
+
+    def _evict(self, keep):
+        """Toplam boyut sınırı aşıldıysa en eski girdileri siler."""
+        total = self.total_bytes
+        candidates = sorted((meta["atime"], name)
+                            for name, meta in self._entries.items()
+                            if name != keep)
+        for _, name in candidates:
+            if total <= self.max_bytes:
+                break
+            total -= self._entries[name]["length"]
+            self._remove(name)
+
+    @property
+    def total_bytes(self):
+        """Depodaki toplam keystream boyutu (byte)."""
+        return sum(meta["length"] for meta in self._entries.values())
+
+    def keystream(self, key, length, jump_bits=None):
+        """
+        Anahtarın keystream'inin ilk length byte'ını döndürür.
+
+        Args:
+            key: Şifreleme anahtarı
+            length: İstenen keystream uzunluğu (byte)
+            jump_bits: Önek büyütülürken PRNG'nin kullanacağı sıçrama
+                genişliği (bkz. CollatzPRNG)
+
+        Returns:
+            Diskteki keystream'e eşlenmiş salt okunur memoryview
+        """
+        name = self._name(key)
+        meta = self._entries.get(name)
+        if meta is not None and name not in self._verified:
+            if meta["key"] == hex(key) and self._verify(name, meta):
+                self._verified.add(name)
+            else:
+                self._remove(name)
+                meta = None
+
+        if meta is None or meta["length"] < length:
+            self.misses += 1
+            meta = self._grow(key, name, meta, length, jump_bits)
+        else:
+            self.hits += 1
+
+        self._touch(name)
+        self._evict(keep=name)
+        self.bytes_served += length
+        if length == 0:
+            return memoryview(b'')
+
+        mm = self._maps.get(name)
+        if mm is None:
+            data_path, _ = self._paths(name)
+            with open(data_path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[name] = mm
+        return memoryview(mm)[:length]
+
+    def stats(self):
+        """
+        Depo sayaçlarını döndürür.
+
+        Returns:
+            hits, misses, bytes_served, keys ve total_bytes içeren sözlük
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_served": self.bytes_served,
+            "keys": len(self._entries),
+            "total_bytes": self.total_bytes,
+        }
+
+    def close(self):
+        """Açık tüm mmap'leri kapatır."""
+        for name in list(self._maps):
+            self._close_map(name)
+
+
+class KeystreamPrefixCache:
+    """
+    Anahtar başına keystream öneklerini bellekte tutan LRU önbellek.
+
+    Bir önek istenen boyuta kadar, her seferinde en az iki katına çıkarak
+    büyütülür; büyütme kaldığı yerden devam eden PRNG ile yapılır, önek
+    baştan üretilmez. Aynı önbellek birçok CollatzCipher örneği ve iş
+    parçacığı arasında paylaşılabilir; toplam boyut max_bytes'ı aşınca en
+    uzun süredir kullanılmayan anahtarların önekleri atılır. max_bytes'tan
+    uzun istekler önbelleğe alınmaz.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_PREFIX_CACHE_BYTES):
+        """
+        Args:
+            max_bytes: Toplam önek boyutu sınırı (byte)
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.bytes_served = 0
+        # key -> (önek, önekin sonundaki PRNG)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def keystream(self, key, length, jump_bits=None):
+        """
+        Anahtarın keystream'inin ilk length byte'ını döndürür.
+
+        Args:
+            key: Şifreleme anahtarı
+            length: İstenen keystream uzunluğu (byte)
+            jump_bits: Önek büyütülürken PRNG'nin kullanacağı sıçrama
+                genişliği (bkz. CollatzPRNG)
+
+        Returns:
+            Önbellekteki keystream'e salt okunur memoryview; length
+            max_bytes'tan büyükse None (çağıran keystream'i kendisi üretir)
+        """
+        if length > self.max_bytes:
+            with self._lock:
+                self.bypassed += 1
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = (bytearray(), CollatzPRNG(key))
+                self._entries[key] = entry
+            else:
+                self._entries.move_to_end(key)
+
+            prefix, prng = entry
+            if len(prefix) < length:
+                self.misses += 1
+                # Keystream sıçrama genişliğinden bağımsızdır; kaldığı
+                # yerden istenen genişlikle devam edilir
+                prng.jump_bits = jump_bits
+                # Çağıranların elindeki görünümler bozulmasın diye yeni
+                # tampon; geometrik büyüme artan isteklerde kopyalamayı
+                # doğrusal tutar
+                target = min(max(length, 2 * len(prefix), _GROW_BLOCK),
+                             self.max_bytes)
+                grown = bytearray(target)
+                grown[:len(prefix)] = prefix
+                prng.fill_bytes(memoryview(grown)[len(prefix):])
+                self.total_bytes += target - len(prefix)
+                prefix = grown
+                self._entries[key] = (prefix, prng)
+                self._evict(keep=key)
+            else:
+                self.hits += 1
+
+            self.bytes_served += length
+            return memoryview(prefix).toreadonly()[:length]
+
+    def _evict(self, keep):
+        """Boyut sınırı aşıldıysa en eski önekleri atar."""
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            if key == keep:
+                self._entries.move_to_end(key)
+                continue
+            prefix, _ = self._entries.pop(key)
+            self.total_bytes -= len(prefix)
+
+    def stats(self):
+        """
+        Önbellek sayaçlarını döndürür.
+
+        Returns:
+            hits, misses, bypassed (önbelleğe sığmayan istekler),
+            bytes_served, keys ve total_bytes içeren sözlük
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "bytes_served": self.bytes_served,
+            "keys": len(self._entries),
+            "total_bytes": self.total_bytes,
+        }
+
+    def clear(self):
+        """Tüm önekleri atar."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+# Süreç genelinde paylaşılan varsayılan önek önbelleği
+shared_prefix_cache = KeystreamPrefixCache()
@@ -0,0 +1,496 @@
+"""
+Collatz Cipher - Yörünge Birleşme İndeksi
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Collatz yörüngeleri birleşir: iki farklı anahtarın yörüngeleri aynı
+değerde buluştuğunda, ikisi de 1'e ulaşıp yeniden başlatılana kadar
+(seed + step_count) aynı parite bitlerini, yani aynı keystream'i üretir.
+Bu modül büyük anahtar envanterlerinde bu tür örtüşmeleri, anahtarları
+ikişer ikişer karşılaştırmadan bulur.
+
+Her anahtarın keystream'inin ilk scan_bits bitinde yörünge değerleri
+özetlenir ve özetler arasından içerik tabanlı çapalar seçilir (winnowing:
+her pencerenin en küçük özeti). Çapa seçimi yalnızca değerlere bağlı
+olduğundan birleşmiş iki yörünge, ortak kısımlarında aynı çapaları seçer.
+Çapalar diskteki bir SQLite tablosunda özete göre indekslenir; aynı özeti
+taşıyan kayıtlar aday çiftlerdir. Adaylar yörünge yeniden üretilerek
+doğrulanır; böylece örtüşmenin her iki anahtardaki başlangıç konumu ve
+uzunluğu bulunur.
+
+Taranan önek içinde en az min_length bit süren her örtüşme bulunur; daha
+kısa örtüşmeler raporlanmaz. Aynı anahtarın kendi keystream'inin farklı
+konumlarında tekrarlanan kısımlar da raporlanır.
+
+Komut satırı:
+    python merge_index.py build INDEKS.db ANAHTARLAR.txt [--jobs N]
+    python merge_index.py report INDEKS.db [--jobs N] [--output rapor.json]
+"""
+
+import argparse
+import functools
+import itertools
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# Anahtar başına taranan keystream uzunluğunun varsayılanı (bit)
+DEFAULT_SCAN_BITS = 1 << 13
+
+# Raporlanan en kısa örtüşmenin varsayılanı (bit)
+DEFAULT_MIN_LENGTH = 512
+
+# Bir işçiye tek seferde gönderilen anahtar sayısı
+DEFAULT_BATCH_SIZE = 256
+
+# Yörünge değerlerinin özeti: değer mod (2**61 - 1)
+_MODULUS = (1 << 61) - 1
+
+# Çapa seçiminde özetleri karıştırmak için çarpan (64 bit altın oran)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+# Seçim anahtarının konum için ayrılan alt bitleri
+_POS_BITS = 24
+_POS_MASK = (1 << _POS_BITS) - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER);
+CREATE TABLE IF NOT EXISTS keys (id INTEGER PRIMARY KEY, key TEXT UNIQUE);
+CREATE TABLE IF NOT EXISTS anchors (
+    digest INTEGER NOT NULL,
+    key_id INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+"""
+
+
+def _window(min_length):
+    """Çapa seçim penceresinin genişliği."""
+    return max(1, min_length // 2)
+
+
+def _walk(key, scan_bits):
+    """
+    Anahtarın ilk scan_bits bitindeki yörünge değerlerini özetler.
+
+    Returns:
+        (özetler, bölüm sonları) - özetler bit konumu başına bir değer,
+        bölüm sonları yörüngenin 1'e ulaştığı bit konumlarıdır. Son bölüm
+        taranan önekin dışına taşsa da sonuna kadar yürünür.
+    """
+    digests = []
+    ends = []
+    n = key
+    steps = 0
+    while steps < scan_bits:
+        if n <= 1:
+            ends.append(steps)
+            n = key + steps
+        digests.append(n % _MODULUS)
+        n = 3 * n + 1 if n & 1 else n >> 1
+        steps += 1
+    while n > 1:
+        n = 3 * n + 1 if n & 1 else n >> 1
+        steps += 1
+    ends.append(steps)
+    return digests, ends
+
+
+def _window_minima(keys, width):
+    """
+    Her width uzunluğundaki pencerenin en küçük değeri (van Herk/Gil-Werman).
+
+    Diziyi width'lik bloklara bölüp blok içi önek ve sonek minimumlarını
+    alır; her pencere bir sonek ile bir önek parçasının birleşimidir.
+    """
+    count = len(keys)
+    pad = -count % width
+    padded = np.concatenate([keys, np.full(pad, np.iinfo(np.uint64).max,
+                                           dtype=np.uint64)])
+    blocks = padded.reshape(-1, width)
+    prefix = np.minimum.accumulate(blocks, axis=1).ravel()
+    suffix = np.minimum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.minimum(suffix[:count - width + 1], prefix[width - 1:count])
+
+
+def key_anchors(key, scan_bits=DEFAULT_SCAN_BITS,
+                min_length=DEFAULT_MIN_LENGTH):
+    """
+    Bir anahtarın çapalarını seçer.
+
+    Her pencerede en küçük karışık özete sahip konum seçilir (eşitlikte en
+    sağdaki). Yeniden başlatmaya min_length'ten kısa süre kalmışsa çapa,
+    raporlanacak bir örtüşmenin ilk çapası olamayacağı için atlanır.
+
+    Args:
+        key: Anahtar (1'den büyük tam sayı)
+        scan_bits: Taranacak keystream uzunluğu (bit)
+        min_length: Aranan en kısa örtüşme (bit)
+
+    Returns:
+        (özet, bit konumu, yeniden başlatmaya kalan bit) listesi
+    """
+    digests, ends = _walk(key, scan_bits)
+    values = np.array(digests, dtype=np.uint64)
+    positions = np.arange(len(values), dtype=np.uint64)
+    mixed = values * _MIX
+    select = ((mixed >> np.uint64(_POS_BITS)) << np.uint64(_POS_BITS)) | (
+        np.uint64(_POS_MASK) - positions)
+
+    width = min(_window(min_length), len(values))
+    minima = _window_minima(select, width)
+    offsets = np.unique(np.uint64(_POS_MASK) - (minima & np.uint64(_POS_MASK)))
+
+    ends = np.array(ends, dtype=np.int64)
+    offsets = offsets.astype(np.int64)
+    remaining = ends[np.searchsorted(ends, offsets, side='right')] - offsets
+    keep = remaining > min_length - _window(min_length)
+    return [(digests[offset], offset, length) for offset, length in
+            zip(offsets[keep].tolist(), remaining[keep].tolist())]
+
+
+def _anchor_batch(batch, scan_bits, min_length):
+    """İşçi: (key_id, anahtar) listesinin çapa satırlarını üretir."""
+    rows = []
+    for key_id, key in batch:
+        rows.extend((digest, key_id, offset, length) for digest, offset, length
+                    in key_anchors(key, scan_bits, min_length))
+    return rows
+
+
+def _trajectory(key, count):
+    """Anahtarın ilk count bit konumundaki yörünge değerleri."""
+    values = []
+    n = key
+    for steps in range(count):
+        if n <= 1:
+            n = key + steps
+        values.append(n)
+        n = 3 * n + 1 if n & 1 else n >> 1
+    return values
+
+
+def _verify_batch(batch, scan_bits):
+    """
+    İşçi: aday çiftleri yörüngeleri yeniden üreterek doğrular.
+
+    Çapa konumlarından geriye doğru, değerler farklılaşana kadar yürünerek
+    örtüşmenin başlangıcı bulunur. Yörüngeler anahtar başına bir kez
+    üretilir; adaylar anahtara göre sıralı geldiği için küçük bir önbellek
+    yeterlidir.
+
+    Args:
+        batch: (key_a, offset_a, key_b, offset_b, kalan uzunluk) listesi
+        scan_bits: Taranan keystream uzunluğu (bit)
+
+    Returns:
+        Her aday için (başlangıç_a, başlangıç_b, uzunluk) ya da değerler
+        farklıysa (özet çakışması) None. Yeniden başlatma değerleri de
+        çakışıyorsa keystream'ler o noktadan sonra hep aynıdır ve uzunluk
+        None olur.
+    """
+    trajectory = functools.lru_cache(maxsize=64)(
+        functools.partial(_trajectory, count=scan_bits))
+    results = []
+    for key_a, offset_a, key_b, offset_b, length in batch:
+        values_a = trajectory(key_a)
+        values_b = trajectory(key_b)
+        if values_a[offset_a] != values_b[offset_b]:
+            results.append(None)
+            continue
+        back = 0
+        limit = min(offset_a, offset_b)
+        while back < limit and (values_a[offset_a - back - 1] ==
+                                values_b[offset_b - back - 1]):
+            back += 1
+        start_a = offset_a - back
+        start_b = offset_b - back
+        end_a = offset_a + length
+        if key_a + end_a == key_b + offset_b + length:
+            results.append((start_a, start_b, None))
+        else:
+            results.append((start_a, start_b, end_a - start_a))
+    return results
+
+
+def _map(worker, batches, jobs):
+    """worker'ı partilere uygular; jobs > 1 ise işlemler arasında paralel."""
+    if jobs > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(batches))) as pool:
+            yield from pool.map(worker, batches)
+    else:
+        yield from map(worker, batches)
+
+
+class MergeIndex:
+    """
+    Anahtar envanteri için diskteki yörünge birleşme indeksi.
+
+    Parametreler (scan_bits, min_length) indeks ilk oluşturulurken
+    kaydedilir; aynı dosya farklı parametrelerle açılamaz.
+    """
+
+    def __init__(self, path, scan_bits=None, min_length=None):
+        """
+        Args:
+            path: SQLite dosyası (yoksa oluşturulur)
+            scan_bits: Anahtar başına taranacak keystream uzunluğu (bit)
+            min_length: Raporlanacak en kısa örtüşme (bit)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        meta = dict(self._conn.execute("SELECT name, value FROM meta"))
+        requested = {"scan_bits": scan_bits, "min_length": min_length}
+        if meta:
+            for name, value in requested.items():
+                if value is not None and value != meta[name]:
+                    raise ValueError(
+                        f"İndeks farklı {name} ile oluşturulmuş: {meta[name]}")
+        else:
+            meta = {"scan_bits": scan_bits or DEFAULT_SCAN_BITS,
+                    "min_length": min_length or DEFAULT_MIN_LENGTH}
+            if not 0 < meta["scan_bits"] <= 1 << _POS_BITS:
+                raise ValueError(
+                    f"scan_bits 1 ile {1 << _POS_BITS} arasında olmalı!")
+            if meta["min_length"] < 1:
+                raise ValueError("min_length pozitif olmalı!")
+            with self._conn:
+                self._conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                                       meta.items())
+        self.scan_bits = meta["scan_bits"]
+        self.min_length = meta["min_length"]
+
+    def add_keys(self, keys, jobs=1, batch_size=DEFAULT_BATCH_SIZE,
+                 progress=None):
+        """
+        Anahtarları indekse ekler; indekste zaten olanlar atlanır.
+
+        Çapalar işlemler arasında paralel hesaplanır, SQLite'a tek işlem
+        yazar. Toplu ekleme hızlı olsun diye özet indeksi eklemeden önce
+        kaldırılır ve sonra yeniden oluşturulur.
+
+        Args:
+            keys: Anahtarlar (1'den büyük tam sayılar)
+            jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+            batch_size: İşçiye tek seferde gönderilen anahtar sayısı
+            progress: Her partiden sonra progress(eklenen_anahtar) ile çağrılır
+
+        Returns:
+            Yeni eklenen anahtar sayısı
+        """
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+
+        added = []
+        with self._conn:
+            for key in keys:
+                if key <= 1:
+                    raise ValueError(
+                        "Anahtar 1'den büyük pozitif tam sayı olmalı!")
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO keys (key) VALUES (?)",
+                    (format(key, 'x'),))
+                if cursor.rowcount:
+                    added.append((cursor.lastrowid, key))
+        if not added:
+            return 0
+
+        batches = [added[i:i + batch_size]
+                   for i in range(0, len(added), batch_size)]
+        worker = functools.partial(_anchor_batch, scan_bits=self.scan_bits,
+                                   min_length=self.min_length)
+        with self._conn:
+            self._conn.execute("DROP INDEX IF EXISTS anchors_digest")
+            done = 0
+            for batch, rows in zip(batches, _map(worker, batches, jobs)):
+                self._conn.executemany(
+                    "INSERT INTO anchors VALUES (?, ?, ?, ?)", rows)
+                done += len(batch)
+                if progress is not None:
+                    progress(done)
+            self._conn.execute(
+                "CREATE INDEX anchors_digest ON anchors (digest)")
+        return len(added)
+
+    def _keys(self, key_ids):
+        """Anahtar kimliklerini anahtarlara çevirir."""
+        result = {}
+        for key_id in key_ids:
+            (text,) = self._conn.execute(
+                "SELECT key FROM keys WHERE id = ?", (key_id,)).fetchone()
+            result[key_id] = int(text, 16)
+        return result
+
+    def _candidates(self):
+        """
+        Aynı özeti taşıyan çapalardan aday çiftleri toplar.
+
+        Aynı örtüşme birden çok ortak çapa taşır; her (anahtar, bölüm)
+        çifti için en erken çapa (kalan uzunluğu en büyük olan) tutulur.
+        Eşit değerlerin yeniden başlatmaya kalan süresi de eşit olduğundan
+        uzunluğu farklı kayıtlar doğrudan elenir.
+        """
+        rows = self._conn.execute(
+            "SELECT digest, key_id, offset, length FROM anchors WHERE digest "
+            "IN (SELECT digest FROM anchors GROUP BY digest "
+            "HAVING COUNT(*) > 1) ORDER BY digest, key_id, offset")
+        candidates = {}
+        for _, bucket in itertools.groupby(rows, key=lambda row: row[0]):
+            bucket = [row[1:] for row in bucket]
+            for a, b in itertools.combinations(bucket, 2):
+                if a[2] != b[2]:
+                    continue
+                pair = (a[0], a[1] + a[2], b[0], b[1] + b[2])
+                if pair not in candidates or candidates[pair][2] < a[2]:
+                    candidates[pair] = (a[1], b[1], a[2])
+        return candidates
+
+    def collisions(self, jobs=1, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Keystream'leri örtüşen anahtar çiftlerini bulur.
+
+        Adaylar işlemler arasında paralel doğrulanır.
+
+        Args:
+            jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+            batch_size: İşçiye tek seferde gönderilen aday sayısı
+
+        Returns:
+            (sözlük listesi, sayaçlar) - her sözlük key_a, offset_a, key_b,
+            offset_b (örtüşmenin başladığı bit konumları) ve length (bit;
+            None: örtüşme sonsuza kadar sürer) içerir. Sayaçlar aday çift
+            ve özet çakışması sayılarını verir.
+        """
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        candidates = sorted(self._candidates().items())
+        keys = self._keys({key_id for pair, _ in candidates
+                           for key_id in (pair[0], pair[2])})
+        tasks = [(keys[id_a], offset_a, keys[id_b], offset_b, length)
+                 for (id_a, _, id_b, _), (offset_a, offset_b, length)
+                 in candidates]
+        batches = [tasks[i:i + batch_size]
+                   for i in range(0, len(tasks), batch_size)]
+        worker = functools.partial(_verify_batch, scan_bits=self.scan_bits)
+        overlaps = itertools.chain.from_iterable(_map(worker, batches, jobs))
+
+        found = {}
+        false_positives = 0
+        for ((id_a, _, id_b, _), _), overlap in zip(candidates, overlaps):
+            if overlap is None:
+                false_positives += 1
+                continue
+            start_a, start_b, run = overlap
+            if run is not None and run < self.min_length:
+                continue
+            # Sonsuz örtüşmeler sonraki her bölümde yeniden bulunur
+            ident = (id_a, id_b, start_a - start_b) if run is None else (
+                id_a, id_b, start_a, start_b)
+            if ident in found and found[ident]["offset_a"] <= start_a:
+                continue
+            found[ident] = {"key_a": keys[id_a], "offset_a": start_a,
+                            "key_b": keys[id_b], "offset_b": start_b,
+                            "length": run}
+
+        report = sorted(found.values(), key=lambda entry: (
+            entry["key_a"], entry["key_b"], entry["offset_a"]))
+        counts = {"candidates": len(candidates),
+                  "false_positives": false_positives}
+        return report, counts
+
+    def stats(self):
+        """
+        İndeks sayaçlarını döndürür.
+
+        Returns:
+            Anahtar ve çapa sayıları, parametreler ve dosya boyutu
+        """
+        (keys,) = self._conn.execute("SELECT COUNT(*) FROM keys").fetchone()
+        (anchors,) = self._conn.execute(
+            "SELECT COUNT(*) FROM anchors").fetchone()
+        return {
+            "keys": keys,
+            "anchors": anchors,
+            "scan_bits": self.scan_bits,
+            "min_length": self.min_length,
+            "file_bytes": os.path.getsize(self.path),
+        }
+
+    def close(self):
+        """Veritabanını kapatır."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_keys(path):
+    """
+    Anahtar dosyasını okur: satır başına bir anahtar (onluk veya 0x),
+    boş satırlar ve # ile başlayan satırlar atlanır.
+    """
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield int(line, 0)
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: build / report."""
+    parser = argparse.ArgumentParser(
+        description="Collatz yörünge birleşme indeksi")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Anahtarları indeksle")
+    build_parser.add_argument("index")
+    build_parser.add_argument("keys", help="Satır başına bir anahtar")
+    build_parser.add_argument("--jobs", type=int, default=1)
+    build_parser.add_argument("--scan-bits", type=int, default=None)
+    build_parser.add_argument("--min-length", type=int, default=None)
+    build_parser.add_argument("--batch-size", type=int,
+                              default=DEFAULT_BATCH_SIZE)
+
+    report_parser = commands.add_parser("report",
+                                        help="Örtüşen anahtarları listele")
+    report_parser.add_argument("index")
+    report_parser.add_argument("--jobs", type=int, default=1)
+    report_parser.add_argument("--output", help="JSON raporunun yazılacağı dosya")
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        with MergeIndex(args.index, args.scan_bits, args.min_length) as index:
+            added = index.add_keys(
+                read_keys(args.keys), args.jobs, args.batch_size,
+                progress=lambda done: print(f"{done} anahtar işlendi"))
+            stats = index.stats()
+        print(f"{added} yeni anahtar; toplam {stats['keys']} anahtar, "
+              f"{stats['anchors']} çapa")
+        return
+
+    with MergeIndex(args.index) as index:
+        report, counts = index.collisions(args.jobs)
+        stats = index.stats()
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"meta": {**stats, **counts}, "collisions": report}, f,
+                      indent=2)
+
+    print(f"{stats['keys']} anahtar, {counts['candidates']} aday çift, "
+          f"{counts['false_positives']} özet çakışması")
+    for entry in report:
+        length = "sonsuz" if entry["length"] is None else entry["length"]
+        print(f"{entry['key_a']} @ {entry['offset_a']}  ~  "
+              f"{entry['key_b']} @ {entry['offset_b']}  uzunluk={length} bit")
+
+
+if __name__ == "__main__":
+    main()
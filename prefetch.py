@@ -0,0 +1,144 @@
+"""
+Collatz Cipher - Arka Plan Keystream Ön Üretimi
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Keystream üretimi ile okuma/XOR/yazma işlemlerini örtüştürmek için bir
+üretici iş parçacığı keystream bloklarını önceden, yeniden kullanılan
+tamponlardan oluşan sınırlı bir halkaya üretir.
+"""
+
+import queue
+import threading
+import time
+
+
+class KeystreamPrefetcher:
+    """
+    Bir CollatzPRNG'nin keystream'ini arka planda önceden üreten boru hattı.
+
+    CollatzPRNG ile aynı fill_bytes() arayüzünü sunar; bu yüzden keystream
+    kaynağı bekleyen her yerde PRNG yerine kullanılabilir. Halkada `depth`
+    adet `block_size` byte'lık tampon bulunur; bellek kullanımı sabittir.
+
+    Kullanım:
+        with KeystreamPrefetcher(prng) as keystream:
+            keystream.fill_bytes(buffer)
+    """
+
+    def __init__(self, prng, block_size=1 << 16, depth=4):
+        """
+        Args:
+            prng: Keystream'i üretecek CollatzPRNG (yalnızca üretici kullanır)
+            block_size: Halkadaki her tamponun boyutu (byte)
+            depth: Halkadaki tampon sayısı
+        """
+        if block_size <= 0 or depth <= 0:
+            raise ValueError("Blok boyutu ve derinlik pozitif olmalı!")
+        self.block_size = block_size
+        self.depth = depth
+        self.position = 0
+        self.blocks_produced = 0
+        self.blocks_consumed = 0
+        self.producer_stall = 0.0
+        self.consumer_stall = 0.0
+        self._depth_total = 0
+
+        self._prng = prng
+        self._buffers = [bytearray(block_size) for _ in range(depth)]
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for index in range(depth):
+            self._free.put(index)
+        self._block = None
+        self._offset = 0
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        """Üretici döngüsü: boş tamponları keystream ile doldurur."""
+        while True:
+            start = time.perf_counter()
+            index = self._free.get()
+            self.producer_stall += time.perf_counter() - start
+            if index is None:
+                return
+            try:
+                self._prng.fill_bytes(self._buffers[index])
+            except BaseException as exc:
+                self._ready.put(exc)
+                return
+            self.blocks_produced += 1
+            self._ready.put(index)
+
+    def _take(self):
+        """Sıradaki hazır bloğu alır; üretici hata verdiyse hatayı yükseltir."""
+        self._depth_total += self._ready.qsize()
+        start = time.perf_counter()
+        item = self._ready.get()
+        self.consumer_stall += time.perf_counter() - start
+        if isinstance(item, BaseException):
+            self._closed = True
+            raise item
+        self._block = item
+        self._offset = 0
+
+    def fill_bytes(self, buffer):
+        """
+        Tamponu önceden üretilmiş keystream ile doldurur.
+
+        Args:
+            buffer: Yazılabilir tampon
+
+        Returns:
+            Yazılan byte sayısı
+        """
+        if self._closed:
+            raise ValueError("Ön üretici kapatıldı!")
+        view = memoryview(buffer).cast('B')
+        count = len(view)
+        pos = 0
+        while pos < count:
+            if self._block is None:
+                self._take()
+            take = min(self.block_size - self._offset, count - pos)
+            block = self._buffers[self._block]
+            view[pos:pos + take] = block[self._offset:self._offset + take]
+            pos += take
+            self._offset += take
+            if self._offset == self.block_size:
+                self.blocks_consumed += 1
+                self._free.put(self._block)
+                self._block = None
+        self.position += count
+        return count
+
+    def stats(self):
+        """
+        Boru hattı ölçümlerini döndürür.
+
+        Returns:
+            Üretilen/tüketilen blok sayıları, ortalama hazır kuyruk derinliği
+            ve üretici/tüketici bekleme süreleri (saniye) içeren sözlük
+        """
+        takes = self.blocks_consumed + (self._block is not None)
+        return {
+            "blocks_produced": self.blocks_produced,
+            "blocks_consumed": self.blocks_consumed,
+            "avg_queue_depth": self._depth_total / takes if takes else 0.0,
+            "producer_stall": self.producer_stall,
+            "consumer_stall": self.consumer_stall,
+        }
+
+    def close(self):
+        """Üreticiyi durdurur ve iş parçacığının bitmesini bekler."""
+        self._closed = True
+        self._free.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,424 @@
+"""
+Collatz Cipher - Seed Aralıkları İçin Toplu Durma Zamanı Eleği
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Anahtar uzayı analizinde her seed için şu değerler gerekir:
+- steps : 1'e ulaşana kadarki adım sayısı (toplam durma zamanı)
+- odd   : Bu adımlardan tek sayıda yapılanların sayısı
+- peak  : Yörüngenin ulaştığı en büyük değer
+
+collatz_sequence() her seed'i tek tek yürür; bu modül ise bir bloktaki tüm
+seed'leri NumPy şeritleri olarak birlikte ilerletir. Bir yörünge daha önce
+hesaplanmış bir değerin altına düştüğünde yörüngenin geri kalanı tablodan
+okunur. Aralık, sonuçları daha önceki dalgalarda hesaplanmış olacak
+şekilde ikiye katlanan dalgalara bölünür; her dalganın blokları
+işlemler arasında paralel hesaplanır.
+
+Sonuçlar seed başına 12 byte'lık yapılı bir .npy dosyasına bellek
+eşlemeli olarak yazılır; aralık bilgisi yanındaki .json dosyasındadır.
+
+Komut satırı:
+    python sieve.py build BASLANGIC BITIS CIKTI.npy [--jobs N]
+    python sieve.py query CIKTI.npy SEED [SEED ...]
+    python sieve.py max CIKTI.npy {steps,odd,peak}
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# Seed başına kayıt: adım sayısı, tek adım sayısı, en büyük değer
+RECORD_DTYPE = np.dtype([('steps', '<u2'), ('odd', '<u2'), ('peak', '<u8')])
+
+# Bellekte tutulan küçük değer tablosunun varsayılan boyutu
+DEFAULT_SMALL_LIMIT = 1 << 20
+
+# Bir işçinin tek seferde işlediği seed sayısı
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# En büyük değer uint64'e sığmadığında yazılan doygun değer
+PEAK_OVERFLOW = 2 ** 64 - 1
+
+# 3n+1 bu değerden büyük tek sayılarda uint64'ü taşırır
+_ODD_LIMIT = (2 ** 64 - 2) // 3
+
+# İşçi süreçlerde paylaşılan küçük tablo (bkz. _init_worker)
+_small_table = None
+
+
+def _lookup(values, small, table, base):
+    """
+    Hesaplanmış değerlerin kayıtlarını okur.
+
+    values'taki her değer ya küçük tabloda (< len(small)) ya da ana tabloda
+    (>= base) bulunmalıdır.
+    """
+    in_small = values < len(small)
+    records = np.empty(len(values), dtype=RECORD_DTYPE)
+    records[in_small] = small[values[in_small]]
+    if not in_small.all():
+        rest = ~in_small
+        records[rest] = table[(values[rest] - base).astype(np.int64)]
+    return records
+
+
+def _finish_slow(value, steps, odd, peak, known, small_len, base, small,
+                 table):
+    """
+    uint64'ü taşıracak bir şeridi büyük sayılarla tamamlar.
+
+    Returns:
+        (steps, odd, peak) tuple'ı; peak uint64'e sığmazsa PEAK_OVERFLOW
+    """
+    while not (value < known and (value < small_len or value >= base)):
+        if value & 1:
+            value = 3 * value + 1
+            odd += 1
+        else:
+            value >>= 1
+        steps += 1
+        peak = max(peak, value)
+    if value > 1:
+        record = small[value] if value < small_len else table[value - base]
+        steps += int(record['steps'])
+        odd += int(record['odd'])
+        peak = max(peak, int(record['peak']))
+    return steps, odd, min(peak, PEAK_OVERFLOW)
+
+
+def sieve_block(lo, hi, small, table=None, base=0, known=None):
+    """
+    [lo, hi) aralığındaki seed'lerin kayıtlarını hesaplar.
+
+    Tüm şeritler birlikte ilerletilir; tek adım ardından gelen yarıya
+    bölme ile birleştirilir. Bir şeridin değeri known'un altına düşüp
+    tablolardan birinde bulunduğunda kalan yörünge tablodan eklenir.
+
+    Args:
+        lo: Aralık başlangıcı (lo >= 1)
+        hi: Aralık sonu (hariç)
+        small: 0..len(small)-1 değerlerini kapsayan kayıt tablosu
+            (known'un altındaki kısmı dolu olmalı)
+        table: base'den başlayan ve known'un altı dolu olan ana tablo
+        base: table'ın ilk kaydının seed değeri
+        known: Bu değerin altındaki kayıtlar hesaplanmış (None: lo)
+
+    Returns:
+        hi - lo uzunluğunda RECORD_DTYPE dizisi
+    """
+    out = np.empty(hi - lo, dtype=RECORD_DTYPE)
+    small_len = len(small)
+    known = lo if known is None else known
+    if table is None:
+        # Ana tablo yok: hiçbir değer base ile known arasında olamaz
+        base = known
+        table = small[:0]
+
+    lane = np.arange(hi - lo, dtype=np.int64)
+    value = np.arange(lo, hi, dtype=np.uint64)
+    steps = np.zeros(hi - lo, dtype=np.int64)
+    odd = np.zeros(hi - lo, dtype=np.int64)
+    peak = value.copy()
+
+    one = np.uint64(1)
+    three = np.uint64(3)
+    limit = np.uint64(_ODD_LIMIT)
+    known_ = np.uint64(known)
+    small_ = np.uint64(small_len)
+    base_ = np.uint64(base)
+
+    # 1 değeri tabloda değilse doğrudan bitir
+    if lo == 1:
+        out[0] = (0, 0, 1)
+        lane, value, steps, odd, peak = (a[1:] for a in
+                                         (lane, value, steps, odd, peak))
+
+    while len(lane):
+        is_odd = (value & one).astype(bool)
+        risky = is_odd & (value > limit)
+        if risky.any():
+            for i in np.flatnonzero(risky):
+                out[lane[i]] = _finish_slow(
+                    int(value[i]), int(steps[i]), int(odd[i]), int(peak[i]),
+                    known, small_len, base, small, table)
+            keep = ~risky
+            lane, value, steps, odd, peak, is_odd = (
+                a[keep] for a in (lane, value, steps, odd, peak, is_odd))
+
+        # Tek: n -> 3n+1 -> (3n+1)/2 (iki adım); çift: n -> n/2
+        grown = value * three + one
+        np.maximum(peak, np.where(is_odd, grown, value), out=peak)
+        value = np.where(is_odd, grown >> one, value >> one)
+        steps += 1 + is_odd
+        odd += is_odd
+
+        done = (value < known_) & ((value < small_) | (value >= base_))
+        if done.any():
+            ids = lane[done]
+            records = _lookup(value[done], small, table, base)
+            out['steps'][ids] = steps[done] + records['steps']
+            out['odd'][ids] = odd[done] + records['odd']
+            out['peak'][ids] = np.maximum(peak[done], records['peak'])
+            keep = ~done
+            lane, value, steps, odd, peak = (
+                a[keep] for a in (lane, value, steps, odd, peak))
+
+    return out
+
+
+def small_table(limit=DEFAULT_SMALL_LIMIT):
+    """
+    0..limit-1 seed'lerinin kayıt tablosunu bellekte hesaplar.
+
+    Tablo ikiye katlanan dalgalarla doldurulur; her dalga kendisinden
+    önceki kısmı tablo olarak kullanır. 0 girdisi kullanılmaz.
+
+    Args:
+        limit: Tablo boyutu
+
+    Returns:
+        RECORD_DTYPE dizisi
+    """
+    table = np.zeros(max(limit, 2), dtype=RECORD_DTYPE)
+    table[1] = (0, 0, 1)
+    lo = 2
+    while lo < len(table):
+        hi = min(2 * lo, len(table))
+        table[lo:hi] = sieve_block(lo, hi, table[:lo])
+        lo = hi
+    return table
+
+
+def _init_worker(small):
+    """İşçi sürecine küçük tabloyu yerleştirir."""
+    global _small_table
+    _small_table = small
+
+
+def _sieve_file_block(path, base, known, lo, hi):
+    """
+    Paralel elemede bir işçinin [lo, hi) bloğunu hesaplayıp dosyaya yazar.
+
+    Dosyanın yalnızca known'un altındaki (önceki dalgalarda yazılmış)
+    kısmı okunur.
+
+    Returns:
+        Yazılan kayıt sayısı
+    """
+    table = np.load(path, mmap_mode='r+')
+    table[lo - base:hi - base] = sieve_block(lo, hi, _small_table, table,
+                                             base, known)
+    table.flush()
+    return hi - lo
+
+
+def _meta_path(path):
+    """Sonuç dosyasının aralık bilgisinin tutulduğu yol."""
+    return os.path.splitext(path)[0] + ".json"
+
+
+def build(start, stop, path, jobs=1, block_size=DEFAULT_BLOCK_SIZE,
+          small_limit=DEFAULT_SMALL_LIMIT, progress=None):
+    """
+    [start, stop) aralığındaki tüm seed'leri eleyip dosyaya yazar.
+
+    Aralık [a, 2a) biçimindeki dalgalara bölünür: bir dalgadaki her seed'in
+    yörüngesi dalga başının altına düşmeden önce küçük tablonun da altına
+    inmiyorsa, ana tablonun önceki dalgalarda yazılmış kısmından okunur.
+    Dalgaların blokları jobs işlem arasında paralel hesaplanır.
+
+    Args:
+        start: Aralık başlangıcı (start >= 1)
+        stop: Aralık sonu (hariç)
+        path: Sonuç dosyası (.npy)
+        jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+        block_size: İşçi başına blok boyutu (seed)
+        small_limit: Bellekte tutulacak küçük tablonun boyutu
+        progress: Her dalgadan sonra progress(hesaplanan_son_seed) ile
+            çağrılır (opsiyonel)
+
+    Returns:
+        SieveResult
+    """
+    if not 1 <= start < stop:
+        raise ValueError("Geçersiz seed aralığı!")
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    small = small_table(min(small_limit, stop))
+    table = np.lib.format.open_memmap(path, mode='w+', dtype=RECORD_DTYPE,
+                                      shape=(stop - start,))
+    # Küçük tablonun kapsadığı seed'ler doğrudan kopyalanır
+    lo = min(max(start, len(small)), stop)
+    if start < lo:
+        table[:lo - start] = small[start:lo]
+    table.flush()
+    del table
+
+    pool = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=(small,))
+    else:
+        _init_worker(small)
+    try:
+        while lo < stop:
+            hi = min(max(2 * lo, lo + block_size), stop)
+            blocks = [(a, min(a + block_size, hi))
+                      for a in range(lo, hi, block_size)]
+            if pool is None:
+                for a, b in blocks:
+                    _sieve_file_block(path, start, lo, a, b)
+            else:
+                futures = [pool.submit(_sieve_file_block, path, start, lo,
+                                       a, b)
+                           for a, b in blocks]
+                for future in futures:
+                    future.result()
+            lo = hi
+            if progress is not None:
+                progress(lo)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    with open(_meta_path(path), 'w') as f:
+        json.dump({"start": start, "stop": stop, "fields": ["steps", "odd",
+                                                           "peak"]}, f)
+    return SieveResult(path)
+
+
+class SieveResult:
+    """
+    build() ile üretilmiş sonuç dosyasını sorgular.
+
+    Dosya bellek eşlemeli açılır; yalnızca sorgulanan kısımlar okunur.
+
+    Kullanım:
+        result = SieveResult('eleme.npy')
+        steps, odd, peak = result[27]
+        seed, steps = result.max('steps')
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Sonuç dosyası (.npy)
+        """
+        with open(_meta_path(path)) as f:
+            meta = json.load(f)
+        self.path = path
+        self.start = meta["start"]
+        self.stop = meta["stop"]
+        self.records = np.load(path, mmap_mode='r')
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, seed):
+        """
+        Bir seed'in kaydını döndürür.
+
+        Returns:
+            (steps, odd, peak) tuple'ı
+        """
+        if not self.start <= seed < self.stop:
+            raise IndexError("Seed dosyanın aralığında değil!")
+        record = self.records[seed - self.start]
+        return int(record['steps']), int(record['odd']), int(record['peak'])
+
+    def range(self, lo, hi):
+        """
+        [lo, hi) seed'lerinin kayıtlarını döndürür.
+
+        Returns:
+            RECORD_DTYPE dizisi (dosyaya eşlenmiş görünüm)
+        """
+        if not self.start <= lo <= hi <= self.stop:
+            raise ValueError("Geçersiz seed aralığı!")
+        return self.records[lo - self.start:hi - self.start]
+
+    def lookup(self, seeds):
+        """
+        Birden çok seed'in kayıtlarını döndürür.
+
+        Args:
+            seeds: Seed dizisi
+
+        Returns:
+            RECORD_DTYPE dizisi
+        """
+        seeds = np.asarray(seeds, dtype=np.int64)
+        if len(seeds) and (seeds.min() < self.start
+                           or seeds.max() >= self.stop):
+            raise IndexError("Seed dosyanın aralığında değil!")
+        return self.records[seeds - self.start]
+
+    def max(self, field, lo=None, hi=None, block_size=DEFAULT_BLOCK_SIZE):
+        """
+        Bir alanın en büyük değerini ve onu veren ilk seed'i bulur.
+
+        Dosya blok blok taranır; bellek kullanımı aralıktan bağımsızdır.
+
+        Args:
+            field: 'steps', 'odd' veya 'peak'
+            lo: Aralık başlangıcı (None: dosya başı)
+            hi: Aralık sonu (None: dosya sonu)
+            block_size: Tarama bloğu boyutu (seed)
+
+        Returns:
+            (seed, değer) tuple'ı
+        """
+        lo = self.start if lo is None else lo
+        hi = self.stop if hi is None else hi
+        best_seed, best = None, -1
+        for a in range(lo, hi, block_size):
+            values = self.range(a, min(a + block_size, hi))[field]
+            i = int(np.argmax(values))
+            if int(values[i]) > best:
+                best_seed, best = a + i, int(values[i])
+        return best_seed, best
+
+
+def main(argv=None):
+    """Komut satırı arayüzü: build / query / max."""
+    parser = argparse.ArgumentParser(
+        description="Collatz durma zamanı eleği")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Aralığı ele")
+    build_parser.add_argument("start", type=int)
+    build_parser.add_argument("stop", type=int)
+    build_parser.add_argument("output")
+    build_parser.add_argument("--jobs", type=int, default=1)
+    build_parser.add_argument("--block-size", type=int,
+                              default=DEFAULT_BLOCK_SIZE)
+
+    query_parser = commands.add_parser("query", help="Seed kayıtlarını yazdır")
+    query_parser.add_argument("input")
+    query_parser.add_argument("seeds", nargs="+", type=int)
+
+    max_parser = commands.add_parser("max", help="En büyük değeri bul")
+    max_parser.add_argument("input")
+    max_parser.add_argument("field", choices=["steps", "odd", "peak"])
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        build(args.start, args.stop, args.output, args.jobs, args.block_size,
+              progress=lambda seed: print(f"{seed} seed'e kadar hesaplandı"))
+    elif args.command == "query":
+        result = SieveResult(args.input)
+        for seed in args.seeds:
+            steps, odd, peak = result[seed]
+            print(f"{seed}: adım={steps} tek={odd} tepe={peak}")
+    else:
+        seed, value = SieveResult(args.input).max(args.field)
+        print(f"{args.field}: {value} (seed {seed})")
+
+
+if __name__ == "__main__":
+    main()
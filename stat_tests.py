@@ -0,0 +1,473 @@
+"""
+Collatz Cipher - Keystream İstatistiksel Test Bataryası
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Anahtarların keystream kalitesini ölçmek için CollatzPRNG çıktısını NumPy
+parçaları halinde akıtarak NIST SP 800-22 tarzı testleri sabit bellekle
+çalıştırır ve her test için p-değeri döndürür:
+
+- frequency       : 1 bitlerinin oranı (monobit)
+- block_frequency : 128 bitlik bloklarda 1 oranı
+- runs            : Ardışık aynı bit koşularının sayısı
+- longest_run     : 128 bitlik bloklarda en uzun 1 koşusu
+- serial          : Örtüşen 3 bitlik desenler (iki p-değeri)
+- pairs           : Ardışık byte çiftleri (plot_scatter_2d'nin sayısal hali)
+- byte_chi_square : Byte değerlerinin dağılımı (plot_histogram'ın sayısal hali)
+- autocorrelation : Farklı gecikmelerde bitlerin kendisiyle uyumu
+
+p-değerleri scipy gerektirmeden, düzenlenmiş üst tamamlanmamış gama
+fonksiyonu (igamc) ve erfc ile hesaplanır.
+
+Komut satırı:
+    python stat_tests.py ANAHTAR [ANAHTAR ...] [--bytes N] [--jobs N]
+                         [--output RAPOR.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from collatz_prng import CollatzPRNG
+
+
+# Test başına anlamlılık düzeyi
+DEFAULT_ALPHA = 0.01
+
+# Varsayılan akış parçası boyutu (byte)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Blok frekansı ve en uzun koşu testlerinin blok boyutu (bit)
+_BLOCK_BITS = 128
+
+# M = 128 için en uzun koşu sınıfları (<=4, 5, 6, 7, 8, >=9) olasılıkları
+_LONGEST_RUN_PROBS = (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)
+
+# Seri testin desen uzunluğu (bit)
+_SERIAL_BITS = 3
+
+# Varsayılan otokorelasyon gecikmeleri (bit)
+DEFAULT_LAGS = (1, 2, 3, 8, 16, 32)
+
+
+def igamc(a, x):
+    """
+    Düzenlenmiş üst tamamlanmamış gama fonksiyonu Q(a, x).
+
+    x < a + 1 iken seri açılımı, aksi halde sürekli kesir kullanılır.
+
+    Args:
+        a: Şekil parametresi (a > 0)
+        x: Alt sınır (x >= 0)
+
+    Returns:
+        Q(a, x) = 1 - P(a, x)
+    """
+    if x <= 0:
+        return 1.0
+    log_front = -x + a * math.log(x) - math.lgamma(a)
+    max_iter = int(10 * math.sqrt(a)) + 1000
+    if x < a + 1:
+        # P(a, x) = e^-x x^a / Γ(a) * Σ x^n / (a (a+1) ... (a+n))
+        term = 1.0 / a
+        total = term
+        ap = a
+        for _ in range(max_iter):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - math.exp(log_front) * total)
+
+    # Lentz yöntemiyle sürekli kesir
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, max_iter):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        if abs(d) < tiny:
+            d = tiny
+        c = b + an / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_front) * h
+
+
+def _chi_square_p(statistic, dof):
+    """Ki-kare istatistiğinin p-değeri."""
+    return igamc(dof / 2, statistic / 2)
+
+
+def _normal_p(z):
+    """Standart normal istatistiğin iki yönlü p-değeri."""
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def _pattern_counts(bits, m):
+    """Örtüşen m bitlik desenlerin sayıları (uzunluğu 2^m)."""
+    if len(bits) < m:
+        return np.zeros(1 << m, dtype=np.int64)
+    values = np.zeros(len(bits) - m + 1, dtype=np.int64)
+    for i in range(m):
+        values <<= 1
+        values |= bits[i:len(bits) - m + 1 + i]
+    return np.bincount(values, minlength=1 << m)
+
+
+def _psi_square(counts, n):
+    """Seri test için ψ² istatistiği."""
+    if n == 0:
+        return 0.0
+    return len(counts) / n * float(np.dot(counts, counts)) - n
+
+
+class StatisticalBattery:
+    """
+    Byte akışı üzerinde tüm testleri sabit bellekle biriktiren sınıf.
+
+    Kullanım:
+        battery = StatisticalBattery()
+        for chunk in akış:
+            battery.update(chunk)
+        sonuclar = battery.results()
+    """
+
+    def __init__(self, lags=DEFAULT_LAGS, alpha=DEFAULT_ALPHA):
+        """
+        Args:
+            lags: Otokorelasyon gecikmeleri (bit)
+            alpha: Bir testin geçmesi için en küçük p-değeri
+        """
+        self.lags = tuple(lags)
+        self.alpha = alpha
+        self.n = 0
+        self.ones = 0
+        self.transitions = 0
+        self.blocks = 0
+        self.block_deviation = 0
+        self.longest_runs = np.zeros(len(_LONGEST_RUN_PROBS), dtype=np.int64)
+        self.serial_counts = [np.zeros(1 << m, dtype=np.int64)
+                              for m in range(1, _SERIAL_BITS + 1)]
+        self.byte_counts = np.zeros(256, dtype=np.int64)
+        self.pair_counts = np.zeros(1 << 16, dtype=np.int64)
+        self.lag_mismatches = np.zeros(len(self.lags), dtype=np.int64)
+        self.lag_pairs = np.zeros(len(self.lags), dtype=np.int64)
+
+        # Parça sınırlarını aşan testler için önceki parçanın sonu
+        self._block_tail = np.zeros(0, dtype=np.uint8)
+        self._history = np.zeros(0, dtype=np.uint8)
+        self._head = np.zeros(0, dtype=np.uint8)
+        self._last_byte = None
+
+    def update(self, data):
+        """
+        Bir parça keystream'i testlere ekler.
+
+        Args:
+            data: Byte dizisi (bytes, bytearray, memoryview, uint8 dizisi)
+        """
+        data = np.frombuffer(data, dtype=np.uint8)
+        if not len(data):
+            return
+        bits = np.unpackbits(data)
+
+        self._update_bytes(data)
+        self._update_blocks(bits)
+        history = self._history
+        self._update_runs(bits, history)
+        self._update_serial(bits, history)
+        self._update_autocorrelation(bits, history)
+
+        keep = max(max(self.lags, default=0), _SERIAL_BITS - 1)
+        self._history = np.concatenate((history, bits[-keep:]))[-keep:]
+        if len(self._head) < _SERIAL_BITS - 1:
+            self._head = np.concatenate((self._head, bits))[:_SERIAL_BITS - 1]
+        self.n += len(bits)
+        self.ones += int(np.count_nonzero(bits))
+
+    def _update_bytes(self, data):
+        """Byte ve ardışık byte çifti sayılarını günceller."""
+        self.byte_counts += np.bincount(data, minlength=256)
+        pairs = (data[:-1].astype(np.int64) << 8) | data[1:]
+        self.pair_counts += np.bincount(pairs, minlength=1 << 16)
+        if self._last_byte is not None:
+            self.pair_counts[(self._last_byte << 8) | int(data[0])] += 1
+        self._last_byte = int(data[-1])
+
+    def _update_blocks(self, bits):
+        """Blok frekansı ve en uzun koşu testleri için tam blokları işler."""
+        bits = np.concatenate((self._block_tail, bits))
+        count = len(bits) // _BLOCK_BITS
+        self._block_tail = bits[count * _BLOCK_BITS:].copy()
+        if not count:
+            return
+        blocks = bits[:count * _BLOCK_BITS].reshape(count, _BLOCK_BITS)
+
+        sums = blocks.sum(axis=1, dtype=np.int64) - _BLOCK_BITS // 2
+        self.blocks += count
+        self.block_deviation += int(np.dot(sums, sums))
+
+        # Her satırı iki yandan sıfırla çevirip sıfırlar arası boşlukları bul
+        width = _BLOCK_BITS + 2
+        padded = np.zeros((count, width), dtype=np.uint8)
+        padded[:, 1:-1] = blocks
+        zeros = np.flatnonzero(padded.ravel() == 0)
+        gaps = np.diff(zeros) - 1
+        starts = np.searchsorted(zeros[:-1] // width, np.arange(count))
+        longest = np.maximum.reduceat(gaps, starts)
+        classes = np.clip(longest, 4, 9) - 4
+        self.longest_runs += np.bincount(classes,
+                                         minlength=len(_LONGEST_RUN_PROBS))
+
+    def _update_runs(self, bits, history):
+        """Ardışık bitlerin farklı olduğu konumları sayar."""
+        self.transitions += int(np.count_nonzero(bits[1:] != bits[:-1]))
+        if len(history):
+            self.transitions += int(history[-1] != bits[0])
+
+    def _update_serial(self, bits, history):
+        """Örtüşen 1..m bitlik desenleri sayar (parça sınırları dahil)."""
+        for m, counts in enumerate(self.serial_counts, 1):
+            window = np.concatenate(
+                (history[max(0, len(history) - (m - 1)):], bits))
+            counts += _pattern_counts(window, m)
+
+    def _update_autocorrelation(self, bits, history):
+        """Her gecikme için uyuşmayan bit çiftlerini sayar."""
+        window = np.concatenate((history, bits))
+        offset = len(history)
+        for i, lag in enumerate(self.lags):
+            first = max(offset, lag)
+            if first >= len(window):
+                continue
+            self.lag_mismatches[i] += int(np.count_nonzero(
+                window[first:] != window[first - lag:len(window) - lag]))
+            self.lag_pairs[i] += len(window) - first
+
+    def _serial_results(self):
+        """Döngüsel örtüşen desenlerle seri testin iki p-değeri."""
+        n = self.n
+        psi = [0.0]
+        for m, counts in enumerate(self.serial_counts, 1):
+            counts = counts.copy()
+            # Döngüsel kapanış: sondaki bitler baştaki bitlerle devam eder
+            history = self._history
+            wrap = np.concatenate((history[max(0, len(history) - (m - 1)):],
+                                   self._head[:m - 1]))
+            counts += _pattern_counts(wrap, m)
+            psi.append(_psi_square(counts, n))
+        m = _SERIAL_BITS
+        delta1 = psi[m] - psi[m - 1]
+        delta2 = psi[m] - 2 * psi[m - 1] + psi[m - 2]
+        return {
+            "statistic": [delta1, delta2],
+            "p_value": [igamc(2 ** (m - 2), delta1 / 2),
+                        igamc(2 ** (m - 3), delta2 / 2)],
+        }
+
+    def results(self):
+        """
+        Biriken sayılardan test sonuçlarını hesaplar.
+
+        Returns:
+            test adı -> {"statistic", "p_value", "passed"} sözlüğü
+        """
+        n = self.n
+        if n == 0:
+            raise ValueError("Test edilecek veri yok!")
+        results = {}
+
+        s = 2 * self.ones - n
+        results["frequency"] = {"statistic": s / math.sqrt(n),
+                                "p_value": _normal_p(s / math.sqrt(n))}
+
+        if self.blocks:
+            chi2 = 4 * self.block_deviation / _BLOCK_BITS
+            results["block_frequency"] = {
+                "statistic": chi2,
+                "p_value": igamc(self.blocks / 2, chi2 / 2),
+            }
+
+        pi = self.ones / n
+        runs = self.transitions + 1
+        if abs(pi - 0.5) >= 2 / math.sqrt(n):
+            # Frekans ön koşulu sağlanmıyor; koşu testi anlamsız
+            p_runs = 0.0
+        else:
+            p_runs = math.erfc(abs(runs - 2 * n * pi * (1 - pi))
+                               / (2 * math.sqrt(2 * n) * pi * (1 - pi)))
+        results["runs"] = {"statistic": runs, "p_value": p_runs}
+
+        if self.blocks:
+            expected = self.blocks * np.array(_LONGEST_RUN_PROBS)
+            chi2 = float((((self.longest_runs - expected) ** 2)
+                          / expected).sum())
+            results["longest_run"] = {
+                "statistic": chi2,
+                "p_value": _chi_square_p(chi2, len(_LONGEST_RUN_PROBS) - 1),
+            }
+
+        results["serial"] = self._serial_results()
+
+        byte_total = int(self.byte_counts.sum())
+        expected = byte_total / 256
+        chi2 = float(((self.byte_counts - expected) ** 2).sum() / expected)
+        results["byte_chi_square"] = {"statistic": chi2,
+                                      "p_value": _chi_square_p(chi2, 255)}
+
+        pair_total = byte_total - 1
+        if pair_total > 0:
+            # Örtüşen çiftler bağımsız değil: ψ²(çift) - ψ²(tekli) ~ χ²(256·255)
+            delta = (_psi_square(self.pair_counts, pair_total)
+                     - _psi_square(self.byte_counts, byte_total))
+            results["pairs"] = {"statistic": delta,
+                                "p_value": _chi_square_p(delta, 256 * 255)}
+
+        lags = {}
+        for lag, mismatches, pairs in zip(self.lags, self.lag_mismatches,
+                                          self.lag_pairs):
+            pairs = int(pairs)
+            if not pairs:
+                continue
+            z = 2 * (int(mismatches) - pairs / 2) / math.sqrt(pairs)
+            lags[str(lag)] = {"statistic": z, "p_value": _normal_p(z)}
+        results["autocorrelation"] = lags
+
+        for result in [*results.values(), *lags.values()]:
+            if "p_value" in result:
+                p_values = result["p_value"]
+                if not isinstance(p_values, list):
+                    p_values = [p_values]
+                result["passed"] = min(p_values) >= self.alpha
+        return results
+
+
+def analyze_key(key, num_bytes, chunk_size=DEFAULT_CHUNK_SIZE, jump_bits=None,
+             lags=DEFAULT_LAGS, alpha=DEFAULT_ALPHA):
+    """
+    Bir anahtarın keystream'inin ilk num_bytes byte'ını test eder.
+
+    Keystream yeniden kullanılan tek bir tampona parça parça üretilir;
+    bellek kullanımı num_bytes'tan bağımsızdır.
+
+    Args:
+        key: Şifreleme anahtarı
+        num_bytes: Test edilecek keystream uzunluğu (byte)
+        chunk_size: Parça boyutu (byte)
+        jump_bits: CollatzPRNG sıçrama tablosu genişliği (None: kapalı)
+        lags: Otokorelasyon gecikmeleri (bit)
+        alpha: Anlamlılık düzeyi
+
+    Returns:
+        key, bytes, seconds ve tests içeren sözlük
+    """
+    start = time.perf_counter()
+    prng = CollatzPRNG(key, jump_bits=jump_bits)
+    battery = StatisticalBattery(lags, alpha)
+    buffer = bytearray(min(chunk_size, num_bytes))
+    remaining = num_bytes
+    while remaining:
+        view = memoryview(buffer)[:min(len(buffer), remaining)]
+        prng.fill_bytes(view)
+        battery.update(view)
+        remaining -= len(view)
+    return {
+        "key": hex(key),
+        "bytes": num_bytes,
+        "seconds": time.perf_counter() - start,
+        "tests": battery.results(),
+    }
+
+
+def run_battery(keys, num_bytes, jobs=1, **options):
+    """
+    Birden çok anahtarı test eder; jobs > 1 ise anahtarlar işlemler
+    arasında paralel test edilir.
+
+    Args:
+        keys: Anahtar listesi
+        num_bytes: Anahtar başına test edilecek keystream uzunluğu (byte)
+        jobs: Paralel işlem sayısı (None: tüm çekirdekler)
+        **options: analyze_key'e iletilecek seçenekler
+
+    Returns:
+        "meta" ve "keys" anahtarlı, JSON'a yazılabilir rapor
+    """
+    keys = list(keys)
+    if any(key <= 1 for key in keys):
+        raise ValueError("Anahtar 1'den büyük pozitif tam sayı olmalı!")
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1 or len(keys) <= 1:
+        reports = [analyze_key(key, num_bytes, **options) for key in keys]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(keys))) as pool:
+            futures = [pool.submit(analyze_key, key, num_bytes, **options)
+                       for key in keys]
+            reports = [future.result() for future in futures]
+
+    return {
+        "meta": {
+            "bytes_per_key": num_bytes,
+            "alpha": options.get("alpha", DEFAULT_ALPHA),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "keys": reports,
+    }
+
+
+def main(argv=None):
+    """Komut satırı arayüzü."""
+    parser = argparse.ArgumentParser(
+        description="Collatz keystream istatistiksel testleri")
+    parser.add_argument("keys", nargs="+", type=lambda v: int(v, 0))
+    parser.add_argument("--bytes", type=int, default=1 << 20,
+                        help="Anahtar başına test edilecek byte sayısı")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--jump-bits", type=int, default=None)
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument("--output", help="JSON raporunun yazılacağı dosya")
+    args = parser.parse_args(argv)
+    if any(key <= 1 for key in args.keys):
+        parser.error("Anahtar 1'den büyük pozitif tam sayı olmalı!")
+
+    report = run_battery(args.keys, args.bytes, args.jobs,
+                         chunk_size=args.chunk_size, jump_bits=args.jump_bits,
+                         alpha=args.alpha)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    for entry in report["keys"]:
+        print(f"Anahtar {entry['key']} ({entry['bytes']} byte, "
+              f"{entry['seconds']:.1f} s)")
+        tests = dict(entry["tests"])
+        for lag, result in tests.pop("autocorrelation").items():
+            tests[f"autocorrelation[{lag}]"] = result
+        for name, result in tests.items():
+            p_values = result["p_value"]
+            if not isinstance(p_values, list):
+                p_values = [p_values]
+            status = "GEÇTİ" if result["passed"] else "KALDI"
+            p_text = ", ".join(f"{p:.4f}" for p in p_values)
+            print(f"  {name:<24}{p_text:>20}  {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Collatz Cipher - Toplu Şifreleme Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+keystream_batch/encrypt_batch sonuçlarının her anahtar için CollatzPRNG ve
+encrypt_bytes ile birebir aynı olduğunu doğrular.
+"""
+
+import os
+import random
+
+import pytest
+
+from batch import _ODD_LIMIT, _SEED_LIMIT, decrypt_batch, encrypt_batch, \
+    keystream_batch
+from cipher import CollatzCipher
+from collatz_prng import CollatzPRNG
+
+
+def test_keystream_batch_matches_prng():
+    rng = random.Random(4)
+    # Küçük, taşma sınırına yakın, uint64 sınırındaki ve büyük anahtarlar
+    keys = [2, 3, 27, 2 ** 40 + 3, _ODD_LIMIT - 2, _ODD_LIMIT + 1,
+            _SEED_LIMIT - 1, _SEED_LIMIT, 2 ** 64 + 1, 2 ** 128 + 51]
+    keys += [rng.randrange(2, 2 ** 62) for _ in range(20)]
+    lengths = [rng.randrange(0, 300) for _ in keys]
+    for key, length, keystream in zip(keys, lengths,
+                                      keystream_batch(keys, lengths)):
+        assert keystream == CollatzPRNG(key).generate_bytes(length), key
+
+
+def test_encrypt_batch_matches_encrypt_bytes():
+    keys = [5, 2 ** 50 + 1, 2 ** 90 + 7, 5]
+    messages = [os.urandom(n) for n in (10, 0, 200, 33)]
+    encrypted = encrypt_batch(keys, messages)
+    assert encrypted == [CollatzCipher(k).encrypt_bytes(m)
+                         for k, m in zip(keys, messages)]
+    assert decrypt_batch(keys, encrypted) == messages
+
+
+def test_keystream_batch_rejects_bad_input():
+    assert keystream_batch([], []) == []
+    with pytest.raises(ValueError):
+        keystream_batch([2, 3], [1])
+    with pytest.raises(ValueError):
+        keystream_batch([1], [1])
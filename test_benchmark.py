@@ -0,0 +1,67 @@
+"""
+Collatz Cipher - Ölçüm Paketi Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Ölçüm paketinin küçük boyutlarla çalıştığını ve taban çizgisi
+karşılaştırmasının gerilemeleri yakaladığını doğrular.
+"""
+
+import copy
+import json
+
+from benchmark import bench_parallel, compare, main, run_suite
+
+
+SMALL = dict(seed_bits=[8, 128], prng_bytes=16, message_sizes=[16, 256],
+             max_size=256, file_size=1024, chunk_sizes=[512], repeat=1)
+
+
+def test_run_suite_small():
+    report = run_suite(memory=True, **SMALL)
+    results = report["results"]
+    assert "encrypt_bytes/size=16" in results
+    assert "encrypt_file/chunk_size=512/size=1024" in results
+    for result in results.values():
+        assert result["rate"] > 0
+        assert result["peak_bytes"] >= 0
+    json.dumps(report)
+
+
+def test_compare_detects_regressions():
+    current = {"results": {
+        "a": {"rate": 80.0, "peak_bytes": 100},
+        "b": {"rate": 100.0, "peak_bytes": 130},
+        "c": {"rate": 1.0},
+    }}
+    baseline = {"results": {
+        "a": {"rate": 100.0, "peak_bytes": 100},
+        "b": {"rate": 100.0, "peak_bytes": 100},
+    }}
+    regressions = compare(current, baseline, threshold=0.1)
+    assert [(name, metric) for name, metric, *_ in regressions] == \
+        [("a", "rate"), ("b", "peak_bytes")]
+    assert compare(current, current) == []
+
+
+def test_main_exit_code_against_baseline(tmp_path):
+    output = tmp_path / "sonuc.json"
+    args = ["run", "--seed-bits", "8", "--prng-bytes", "16", "--max-size",
+            "16", "--file-size", "512", "--chunk-sizes", "512", "--repeat",
+            "1", "--no-memory", "--output", str(output)]
+    assert main(args) == 0
+
+    baseline = json.loads(output.read_text())
+    faster = copy.deepcopy(baseline)
+    for result in faster["results"].values():
+        result["rate"] *= 100
+    baseline_path = tmp_path / "taban.json"
+    baseline_path.write_text(json.dumps(faster))
+    assert main(args + ["--baseline", str(baseline_path)]) == 1
+
+
+def test_bench_parallel_reports_cold_index():
+    curve = bench_parallel(size=4096, max_jobs=2)
+    assert [row[0] for row in curve] == [1, 2]
+    jobs, elapsed, speedup, cold, cold_speedup = curve[1]
+    assert cold >= elapsed
+    assert cold_speedup <= speedup
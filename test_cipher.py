@@ -0,0 +1,292 @@
+"""
+Collatz Cipher - Şifreleme Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+CollatzCipher'ın bellek içi, akış ve dosya yollarının next_bit() tabanlı
+başvuru keystream'iyle ve birbirleriyle aynı sonucu verdiğini doğrular.
+"""
+
+import asyncio
+import io
+import os
+import random
+
+import pytest
+
+from cipher import CollatzCipher, xor_bytes
+from collatz_prng import CheckpointIndex, CollatzPRNG
+from keystream_store import KeystreamPrefixCache, KeystreamStore
+
+
+KEYS = [2 ** 40 + 3, 2 ** 130 + 7]
+
+DATA = os.urandom(5000)
+
+
+def _reference(key, data):
+    """next_bit() ile üretilen keystream'le XOR'lanmış veri."""
+    prng = CollatzPRNG(key)
+    return bytes(b ^ prng.next_byte() for b in data)
+
+
+@pytest.mark.parametrize('key', KEYS)
+@pytest.mark.parametrize('jump_bits', [None, 1, 8, 16])
+def test_encrypt_bytes_jump_bits(key, jump_bits):
+    expected = _reference(key, DATA)
+    cipher = CollatzCipher(key, jump_bits=jump_bits)
+    assert cipher.encrypt_bytes(DATA) == expected
+    assert cipher.decrypt_bytes(expected) == DATA
+
+
+@pytest.mark.parametrize('jump_bits', [None, 8])
+def test_keystream_sources_jump_bits(tmp_path, jump_bits):
+    key = KEYS[0]
+    expected = _reference(key, DATA)
+    store = KeystreamStore(str(tmp_path))
+    try:
+        cipher = CollatzCipher(key, store=store, jump_bits=jump_bits)
+        assert cipher.encrypt_bytes(DATA) == expected
+    finally:
+        store.close()
+    cipher = CollatzCipher(key, prefix_cache=KeystreamPrefixCache(),
+                           jump_bits=jump_bits)
+    assert cipher.encrypt_bytes(DATA) == expected
+
+
+def test_invalid_jump_bits():
+    with pytest.raises(ValueError):
+        CollatzCipher(KEYS[0], jump_bits=21)
+
+
+def test_xor_bytes():
+    assert xor_bytes(b'\x0f\xf0', b'\xff\xff') == b'\xf0\x0f'
+    assert xor_bytes(b'', b'') == b''
+
+
+def test_parallel_encrypt_file_with_saved_index(tmp_path):
+    key = KEYS[0]
+    src, dst = tmp_path / 'plain', tmp_path / 'cipher'
+    index_path = tmp_path / 'plain.idx'
+    src.write_bytes(DATA)
+    CheckpointIndex.build(key, len(DATA), interval=1000).save(str(index_path))
+    cipher = CollatzCipher(key)
+    assert cipher.encrypt_file(str(src), str(dst), jobs=3,
+                               index_path=str(index_path)) == len(DATA)
+    assert dst.read_bytes() == _reference(key, DATA)
+
+
+def test_parallel_encrypt_file_without_index_warns(tmp_path):
+    key = KEYS[0]
+    src, dst = tmp_path / 'plain', tmp_path / 'cipher'
+    src.write_bytes(DATA)
+    with pytest.warns(RuntimeWarning):
+        CollatzCipher(key).encrypt_file(str(src), str(dst), jobs=2)
+    assert dst.read_bytes() == _reference(key, DATA)
+
+
+def test_parallel_encrypt_file_rejects_foreign_index(tmp_path):
+    src, index_path = tmp_path / 'plain', tmp_path / 'plain.idx'
+    src.write_bytes(DATA)
+    CheckpointIndex.build(KEYS[1], len(DATA), interval=1000).save(
+        str(index_path))
+    with pytest.raises(ValueError):
+        CollatzCipher(KEYS[0]).encrypt_file(str(src), str(tmp_path / 'out'),
+                                            jobs=2, index_path=str(index_path))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096, 1 << 20])
+def test_encrypt_file_matches_encrypt_bytes(tmp_path, chunk_size):
+    key = KEYS[1]
+    src, enc, dec = tmp_path / 'plain', tmp_path / 'enc', tmp_path / 'dec'
+    src.write_bytes(DATA)
+    cipher = CollatzCipher(key)
+    assert cipher.encrypt_file(str(src), str(enc), chunk_size) == len(DATA)
+    assert enc.read_bytes() == _reference(key, DATA)
+    assert cipher.decrypt_file(str(enc), str(dec), chunk_size) == len(DATA)
+    assert dec.read_bytes() == DATA
+
+
+def test_encrypt_stream_matches_encrypt_bytes():
+    key = KEYS[0]
+    dst = io.BytesIO()
+    assert CollatzCipher(key).encrypt_stream(io.BytesIO(DATA), dst, 333) == \
+        len(DATA)
+    assert dst.getvalue() == _reference(key, DATA)
+
+
+def test_encrypt_file_same_path(tmp_path):
+    key = KEYS[0]
+    path = tmp_path / 'data'
+    path.write_bytes(DATA)
+    CollatzCipher(key).encrypt_file(str(path), str(path))
+    assert path.read_bytes() == _reference(key, DATA)
+    CollatzCipher(key).decrypt_file(str(path), str(path))
+    assert path.read_bytes() == DATA
+
+
+def test_encrypt_file_empty(tmp_path):
+    src, dst = tmp_path / 'plain', tmp_path / 'enc'
+    src.write_bytes(b'')
+    assert CollatzCipher(KEYS[0]).encrypt_file(str(src), str(dst)) == 0
+    assert dst.read_bytes() == b''
+
+
+@pytest.mark.parametrize('block_size', [1, 100, 1 << 16])
+def test_encrypt_into_matches_encrypt_bytes(block_size):
+    key = KEYS[1]
+    dst = bytearray(len(DATA) + 10)
+    assert CollatzCipher(key).encrypt_into(memoryview(DATA), dst,
+                                           block_size) == len(DATA)
+    assert bytes(dst[:len(DATA)]) == _reference(key, DATA)
+    assert dst[len(DATA):] == bytearray(10)
+
+
+def test_encrypt_inplace_numpy_buffer():
+    import numpy as np
+
+    key = KEYS[0]
+    buffer = np.frombuffer(DATA, dtype=np.uint32).copy()
+    CollatzCipher(key).encrypt_inplace(buffer, block_size=512)
+    assert buffer.tobytes() == _reference(key, DATA)
+    CollatzCipher(key).encrypt_inplace(buffer)
+    assert buffer.tobytes() == DATA
+
+
+def test_encrypt_into_rejects_bad_targets():
+    cipher = CollatzCipher(KEYS[0])
+    with pytest.raises(ValueError):
+        cipher.encrypt_into(DATA, bytearray(len(DATA) - 1))
+    with pytest.raises(TypeError):
+        cipher.encrypt_into(DATA, bytes(len(DATA)))
+
+
+def test_encrypt_file_inplace_matches_encrypt_bytes(tmp_path):
+    key = KEYS[1]
+    path = tmp_path / 'data'
+    path.write_bytes(DATA)
+    reports = []
+    assert CollatzCipher(key).encrypt_file_inplace(
+        str(path), flush_size=1000, block_size=300,
+        progress=lambda offset, state: reports.append(offset)) == len(DATA)
+    assert path.read_bytes() == _reference(key, DATA)
+    assert reports == list(range(1000, len(DATA), 1000)) + [len(DATA)]
+
+
+def test_encrypt_file_inplace_resume(tmp_path):
+    key = KEYS[0]
+    path = tmp_path / 'data'
+    path.write_bytes(DATA)
+    reports = []
+
+    def interrupt(offset, state):
+        reports.append((offset, state))
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        CollatzCipher(key).encrypt_file_inplace(str(path), flush_size=2048,
+                                                progress=interrupt)
+    offset, state = reports[-1]
+    CollatzCipher(key).encrypt_file_inplace(str(path), start=offset,
+                                            state=state)
+    assert path.read_bytes() == _reference(key, DATA)
+
+    # Durum verilmezse PRNG start konumuna seek() ile getirilir
+    path.write_bytes(DATA[:offset] + _reference(key, DATA)[offset:])
+    CollatzCipher(key).encrypt_file_inplace(str(path), start=offset)
+    assert path.read_bytes() == DATA
+
+
+def test_encryptor_random_chunks_match_encrypt_bytes():
+    key = KEYS[1]
+    rng = random.Random(1)
+    context = CollatzCipher(key).encryptor(block_size=256)
+    parts, pos = [], 0
+    while pos < len(DATA):
+        size = rng.choice((0, 1, 5, 64, 1000))
+        parts.append(context.update(DATA[pos:pos + size]))
+        pos += size
+    assert context.finalize() == b''
+    assert b''.join(parts) == _reference(key, DATA)
+    assert context.position == len(DATA)
+    with pytest.raises(ValueError):
+        context.update(b'x')
+
+
+def test_context_state_resumes_in_new_cipher():
+    key = KEYS[0]
+    context = CollatzCipher(key).encryptor()
+    head = context.update(DATA[:1234])
+    out = bytearray(len(DATA) - 1234)
+    resumed = CollatzCipher(key, state=context.state).decryptor()
+    assert resumed.update_into(DATA[1234:], out) == len(out)
+    assert head + bytes(out) == _reference(key, DATA)
+
+
+def _stream_reader(data):
+    """Veriyi içeren ve EOF'u işaretlenmiş bir asyncio.StreamReader."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+# İkinci boyutta parçalar ASYNC_SLICE_SIZE'ı aşar ve executor'da dilimlenir
+@pytest.mark.parametrize('chunk_size', [100, 1 << 20])
+def test_aencrypt_stream_matches_encrypt_bytes(chunk_size):
+    key = KEYS[1]
+
+    async def collect():
+        reader = _stream_reader(DATA)
+        cipher = CollatzCipher(key)
+        return b''.join([chunk async for chunk in
+                         cipher.aencrypt_stream(reader, chunk_size)])
+
+    assert asyncio.run(collect()) == _reference(key, DATA)
+
+
+def test_apipe_matches_encrypt_bytes():
+    key = KEYS[0]
+
+    class Writer:
+        def __init__(self):
+            self.data = bytearray()
+
+        def write(self, chunk):
+            self.data += chunk
+
+        async def drain(self):
+            pass
+
+    async def pipe():
+        return await CollatzCipher(key).apipe(_stream_reader(DATA), writer,
+                                              chunk_size=777)
+
+    writer = Writer()
+    total = asyncio.run(pipe())
+    assert total == len(DATA)
+    assert bytes(writer.data) == _reference(key, DATA)
+
+
+def test_wrap_writer_matches_encrypt_bytes():
+    key = KEYS[1]
+    raw = io.BytesIO()
+    writer = CollatzCipher(key).wrap_writer(raw, buffer_size=500)
+    for start in range(0, len(DATA), 333):
+        writer.write(DATA[start:start + 333])
+    writer.flush()
+    assert raw.getvalue() == _reference(key, DATA)
+    writer.close()
+    assert raw.closed
+
+
+def test_wrap_reader_read_and_seek():
+    key = KEYS[0]
+    reader = CollatzCipher(key).wrap_reader(io.BytesIO(_reference(key, DATA)),
+                                            buffer_size=256)
+    assert reader.read(100) == DATA[:100]
+    assert reader.read() == DATA[100:]
+    reader.seek(3000)
+    assert reader.tell() == 3000
+    assert reader.read(123) == DATA[3000:3123]
+    reader.seek(17)
+    assert reader.read(5) == DATA[17:22]
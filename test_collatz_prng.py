@@ -0,0 +1,237 @@
+"""
+Collatz Cipher - Üretim Motorları Eşdeğerlik Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+fill_bytes() arkasındaki her motorun (adım adım, büyük seed, sıçrama
+tablosu, yörünge önbelleği) next_bit() ile birebir aynı bit dizisini ve
+aynı son durumu ürettiğini, kaydedilen durumdan keystream'e kaldığı yerden
+devam edildiğini doğrular.
+"""
+
+import pickle
+import random
+
+import pytest
+
+from collatz_prng import BIG_SEED_BITS, CheckpointIndex, CollatzPRNG, \
+    TrajectoryCache, decode_state, encode_state
+
+
+# BIG_SEED_BITS sınırının iki yanındaki seed'ler; küçük seed'ler (3, 27...)
+# byte sınırına denk gelmeyen konumlarda sık sık yeniden başlar
+SEEDS = [
+    2, 3, 7, 27, 97, 12345,
+    2 ** BIG_SEED_BITS - 1,
+    2 ** BIG_SEED_BITS,
+    2 ** BIG_SEED_BITS + 1,
+    2 ** (BIG_SEED_BITS + 1) + 3,
+    2 ** 128 + 51,
+    2 ** 521 - 1,
+]
+
+LENGTH = 512
+
+
+def _reference(seed, length, skip_bits=0):
+    """next_bit() ile keystream ve son durum (current, step_count) üretir."""
+    prng = CollatzPRNG(seed)
+    for _ in range(skip_bits):
+        prng.next_bit()
+    out = bytearray(length)
+    for i in range(length):
+        byte = 0
+        for _ in range(8):
+            byte = (byte << 1) | prng.next_bit()
+        out[i] = byte
+    return bytes(out), (prng.current, prng.step_count)
+
+
+def _cached(seed, warm=False):
+    """Seed'i önbelleğe kabul edilmiş bir TrajectoryCache ile PRNG kurar."""
+    cache = TrajectoryCache()
+    cache.admit(seed, True)
+    if warm:
+        CollatzPRNG(seed, trajectory_cache=cache).generate_bytes(LENGTH)
+    else:
+        cache.admit(seed, True)
+    return CollatzPRNG(seed, trajectory_cache=cache)
+
+
+def _engines():
+    """Karşılaştırılacak motorlar: (ad, PRNG üreticisi) çiftleri."""
+    yield 'scalar', lambda seed: CollatzPRNG(seed)
+    yield 'cached', _cached
+    yield 'warm', lambda seed: _cached(seed, warm=True)
+    for k in (1, 8, 16, 20):
+        yield 'jump%d' % k, lambda seed, k=k: CollatzPRNG(seed, jump_bits=k)
+
+
+ENGINES = list(_engines())
+
+
+def _fill(prng, length):
+    buffer = bytearray(length)
+    assert prng.fill_bytes(buffer) == length
+    return bytes(buffer)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('name,make', ENGINES, ids=[e[0] for e in ENGINES])
+def test_engine_matches_next_bit(name, make, seed):
+    expected, state = _reference(seed, LENGTH)
+    prng = make(seed)
+    assert _fill(prng, LENGTH) == expected
+    assert (prng.current, prng.step_count) == state
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_runs_engine_matches_next_bit(seed):
+    # _fill_runs normalde yalnızca büyük seed'lerde seçilir; küçük
+    # seed'lerde de aynı diziyi üretmeli
+    expected, state = _reference(seed, LENGTH)
+    prng = CollatzPRNG(seed)
+    buffer = bytearray(LENGTH)
+    assert prng._fill_runs(memoryview(buffer)) == LENGTH
+    assert bytes(buffer) == expected
+    assert (prng.current, prng.step_count) == state
+
+
+@pytest.mark.parametrize('jump_bits', range(1, 21))
+def test_every_jump_width_matches_next_bit(jump_bits):
+    for seed in (3, 27, 2 ** BIG_SEED_BITS + 1, 2 ** 128 + 51):
+        expected, state = _reference(seed, 128)
+        prng = CollatzPRNG(seed, jump_bits=jump_bits)
+        assert _fill(prng, 128) == expected
+        assert (prng.current, prng.step_count) == state
+
+
+@pytest.mark.parametrize('seed', [3, 27, 2 ** BIG_SEED_BITS + 1])
+@pytest.mark.parametrize('name,make', ENGINES, ids=[e[0] for e in ENGINES])
+def test_engine_continues_after_unaligned_next_bit(name, make, seed):
+    # next_bit() ile byte ortasına gelindikten sonra fill_bytes() kaldığı
+    # yerden devam etmeli
+    expected, state = _reference(seed, LENGTH, skip_bits=13)
+    prng = make(seed)
+    for _ in range(13):
+        prng.next_bit()
+    assert _fill(prng, LENGTH) == expected
+    assert (prng.current, prng.step_count) == state
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+@pytest.mark.parametrize('name,make', ENGINES, ids=[e[0] for e in ENGINES])
+def test_engine_random_chunk_splits(name, make, seed):
+    expected, state = _reference(seed, LENGTH)
+    rng = random.Random(seed)
+    prng = make(seed)
+    parts = []
+    remaining = LENGTH
+    while remaining:
+        size = min(remaining, rng.choice((0, 1, 2, 3, 7, 16, 61)))
+        parts.append(_fill(prng, size))
+        remaining -= size
+    assert b''.join(parts) == expected
+    assert (prng.current, prng.step_count) == state
+
+
+def test_shared_trajectory_cache_hits_match_next_bit():
+    # İlk üretim önbelleğe dokunmaz, ikincisi yörüngeleri kaydeder,
+    # üçüncüsü kopyalar; sonuç değişmemeli
+    cache = TrajectoryCache()
+    for seed in (3, 27, 97):
+        expected, _ = _reference(seed, LENGTH)
+        for _ in range(3):
+            prng = CollatzPRNG(seed, trajectory_cache=cache)
+            assert _fill(prng, LENGTH) == expected
+    assert cache.stats()['hits'] > 0
+
+
+def test_trajectory_cache_skips_one_off_seeds():
+    cache = TrajectoryCache()
+    prng = CollatzPRNG(2 ** 40 + 3, trajectory_cache=cache)
+    for _ in range(4):
+        _fill(prng, 100)
+    stats = cache.stats()
+    assert stats['entries'] == 0
+    assert stats['hits'] + stats['misses'] == 0
+
+
+@pytest.mark.parametrize('count', [0, 1, 7, 8, 13, 4096 + 5])
+def test_generate_bits_out_matches_next_bit(count):
+    import numpy as np
+
+    for seed in (27, 2 ** BIG_SEED_BITS + 1):
+        reference = CollatzPRNG(seed)
+        expected = [reference.next_bit() for _ in range(count)]
+        prng = CollatzPRNG(seed)
+        out = np.full(count, 9, dtype=np.uint8)
+        assert prng.generate_bits(count, out=out) is out
+        assert out.tolist() == expected
+        assert prng.step_count == reference.step_count
+
+
+@pytest.mark.parametrize('seed', [27, 2 ** 128 + 51])
+def test_state_round_trip_continues_keystream(seed):
+    expected = CollatzPRNG(seed).generate_bytes(300)
+    prng = CollatzPRNG(seed, jump_bits=8)
+    head = prng.generate_bytes(100)
+    state = prng.getstate()
+    assert decode_state(state) == (seed, prng.current, prng.step_count)
+    assert encode_state(*decode_state(state)) == state
+
+    restored = CollatzPRNG.from_state(state)
+    assert head + restored.generate_bytes(200) == expected
+    prng.generate_bytes(50)
+    prng.setstate(state)
+    assert head + prng.generate_bytes(200) == expected
+
+    index = CheckpointIndex.build(seed, 100, interval=256)
+    prng = CollatzPRNG(seed, jump_bits=8, index=index)
+    head = prng.generate_bytes(100)
+    clone = pickle.loads(pickle.dumps(prng))
+    assert (clone.jump_bits, clone.index.seed) == (8, seed)
+    assert head + clone.generate_bytes(200) == expected
+
+
+def test_state_rejects_bad_input():
+    assert not hasattr(CollatzPRNG(27), '__dict__')
+    state = CollatzPRNG(27).getstate()
+    for blob in (b'', state[:-1], state + b'\0', b'\xff' + state[1:]):
+        with pytest.raises(ValueError):
+            decode_state(blob)
+    index = CheckpointIndex(29)
+    with pytest.raises(ValueError):
+        CollatzPRNG(29, index=index).setstate(state)
+
+
+@pytest.mark.parametrize('dtype', ['uint8', 'uint16', 'uint32', 'uint64',
+                                   'float64'])
+def test_generate_array_matches_next_int(dtype):
+    import numpy as np
+
+    for seed in (27, 2 ** BIG_SEED_BITS + 1):
+        reference = CollatzPRNG(seed)
+        bits = np.dtype(dtype).itemsize * 8
+        expected = [reference.next_int(bits) for _ in range(33)]
+        if dtype == 'float64':
+            expected = [(value >> 11) * 2.0 ** -53 for value in expected]
+        prng = CollatzPRNG(seed)
+        assert prng.generate_array(33, dtype).tolist() == expected
+        assert prng.step_count == reference.step_count
+
+        out = np.empty(33, dtype=dtype)
+        assert CollatzPRNG(seed).generate_array(33, out=out) is out
+        assert out.tolist() == expected
+
+        packed = CollatzPRNG(seed).generate_bits(8 * 33 + 5, packed=True)
+        assert np.unpackbits(packed, count=8 * 33 + 5).tolist() == \
+            CollatzPRNG(seed).generate_bits(8 * 33 + 5)
+
+
+def test_generate_array_rejects_bad_dtype():
+    import numpy as np
+
+    with pytest.raises(ValueError):
+        CollatzPRNG(27).generate_array(4, 'int32')
+    with pytest.raises(ValueError):
+        CollatzPRNG(27).generate_array(4, out=np.empty(5, dtype=np.uint8))
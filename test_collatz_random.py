@@ -0,0 +1,57 @@
+"""
+Collatz Cipher - random.Random Uyumlu Üreteç Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+CollatzRandom'un bitleri CollatzPRNG ile aynı sırada verdiğini ve
+getstate()/setstate() ile tam tüketilen konuma dönüldüğünü doğrular.
+"""
+
+import pickle
+
+import pytest
+
+from collatz_prng import CollatzPRNG
+from collatz_random import CollatzRandom
+
+
+SEED = 2 ** 80 + 13
+
+
+@pytest.mark.parametrize('jump_bits', [None, 8])
+def test_getrandbits_matches_next_int(jump_bits):
+    rng = CollatzRandom(SEED, jump_bits=jump_bits)
+    reference = CollatzPRNG(SEED)
+    for k in [1, 7, 32, 53, 0, 3000, 64, 9000, 5]:
+        expected = reference.next_int(k) if k else 0
+        assert rng.getrandbits(k) == expected, k
+    assert rng.randbytes(100) == reference.generate_bytes(100)
+
+
+def test_seed_variants():
+    assert CollatzRandom(-SEED).random() == CollatzRandom(SEED).random()
+    assert CollatzRandom('abc').random() == CollatzRandom(b'abc').random()
+    assert CollatzRandom(0).random() != CollatzRandom(1).random()
+    assert 0.0 <= CollatzRandom().random() < 1.0
+    with pytest.raises(TypeError):
+        CollatzRandom([1, 2])
+
+    rng = CollatzRandom(SEED)
+    first = [rng.random() for _ in range(10)]
+    rng.seed(SEED)
+    assert [rng.random() for _ in range(10)] == first
+
+
+def test_state_restores_consumed_position():
+    rng = CollatzRandom(SEED, jump_bits=8)
+    rng.getrandbits(13)
+    rng.gauss(0, 1)
+    state = rng.getstate()
+    expected = [rng.random() for _ in range(50)]
+
+    rng.setstate(state)
+    assert [rng.random() for _ in range(50)] == expected
+    clone = pickle.loads(pickle.dumps(CollatzRandom(2)))
+    clone.setstate(state)
+    assert [clone.random() for _ in range(50)] == expected
+    with pytest.raises(ValueError):
+        rng.setstate((0,) + state[1:])
@@ -0,0 +1,89 @@
+"""
+Collatz Cipher - Kap Formatı Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+pack() ile yazılan kapların encrypt_bytes ile aynı şifreli veriyi taşıdığını,
+rastgele erişimle doğru çözüldüğünü ve bozuk dosyaların reddedildiğini
+doğrular.
+"""
+
+import io
+import os
+import random
+
+import pytest
+
+from cipher import CollatzCipher
+from container import _HEADER, ContainerReader, pack
+
+
+KEY = 2 ** 100 + 9
+
+DATA = os.urandom(10000)
+
+
+@pytest.fixture
+def container_path(tmp_path):
+    path = tmp_path / 'veri.clz'
+    with open(path, 'wb') as f:
+        assert pack(io.BytesIO(DATA), f, KEY, chunk_size=1000) == len(DATA)
+    return str(path)
+
+
+def test_pack_payload_matches_encrypt_bytes(container_path):
+    with open(container_path, 'rb') as f:
+        f.seek(_HEADER.size)
+        payload = f.read(len(DATA))
+    assert payload == CollatzCipher(KEY).encrypt_bytes(DATA)
+
+
+def test_read_range_matches_plaintext(container_path):
+    rng = random.Random(3)
+    with ContainerReader(container_path, KEY) as reader:
+        assert reader.length == len(DATA)
+        assert reader.chunk_count == 10
+        for _ in range(50):
+            start = rng.randrange(len(DATA) + 1)
+            end = rng.randrange(start, len(DATA) + 1)
+            assert reader.read_range(start, end) == DATA[start:end]
+        assert reader.read_chunk(9) == DATA[9000:]
+        with pytest.raises(ValueError):
+            reader.read_range(5, len(DATA) + 1)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_unpack(container_path, jobs):
+    dst = io.BytesIO()
+    with ContainerReader(container_path, KEY) as reader:
+        assert reader.unpack(dst, jobs=jobs) == len(DATA)
+    assert dst.getvalue() == DATA
+
+
+def test_wrong_key_and_tampering_rejected(container_path):
+    with pytest.raises(ValueError):
+        ContainerReader(container_path, KEY + 2)
+
+    with open(container_path, 'r+b') as f:
+        f.seek(_HEADER.size + len(DATA))
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 1]))
+    with pytest.raises(ValueError):
+        ContainerReader(container_path, KEY)
+
+
+@pytest.mark.parametrize('size', [0, 3, _HEADER.size, _HEADER.size + 20])
+def test_short_file_rejected(container_path, size):
+    with open(container_path, 'r+b') as f:
+        f.truncate(size)
+    with pytest.raises(ValueError):
+        ContainerReader(container_path, KEY)
+
+
+def test_empty_payload(tmp_path):
+    path = tmp_path / 'bos.clz'
+    with open(path, 'wb') as f:
+        pack(io.BytesIO(b''), f, KEY)
+    with ContainerReader(str(path), KEY) as reader:
+        assert reader.length == 0
+        assert reader.read_range(0, 0) == b''
@@ -0,0 +1,84 @@
+"""
+Collatz Cipher - Ölçüm Sayaçları Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Ölçümlü PRNG'nin CollatzPRNG ile aynı keystream'i ürettiğini ve
+sayaçların next_bit() ile sayılan değerlerle tuttuğunu doğrular.
+"""
+
+import io
+import os
+
+import pytest
+
+from cipher import CollatzCipher
+from collatz_prng import CollatzPRNG
+from instrumentation import CollatzStats, InstrumentedCollatzPRNG
+from keystream_store import KeystreamPrefixCache
+
+
+KEY = 2 ** 66 + 5
+
+DATA = os.urandom(3000)
+
+
+def _counted(seed, count):
+    """next_bit() ile üretip adım, tek adım ve yeniden başlatma sayar."""
+    prng = CollatzPRNG(seed)
+    odd = restarts = 0
+    for _ in range(count * 8):
+        if prng.current <= 1:
+            restarts += 1
+        odd += prng.next_bit()
+    return count * 8, odd, restarts
+
+
+@pytest.mark.parametrize('seed', [27, KEY])
+@pytest.mark.parametrize('trace', [True, False])
+def test_instrumented_prng_matches_and_counts(seed, trace):
+    stats = CollatzStats(trace=trace)
+    prng = InstrumentedCollatzPRNG(seed, stats=stats)
+    data = prng.generate_bytes(500) + bytes(
+        prng.next_byte() for _ in range(3))
+    assert data == CollatzPRNG(seed).generate_bytes(503)
+
+    steps, odd, restarts = _counted(seed, 503)
+    result = stats.as_dict()
+    assert result["steps"] == steps
+    assert result["odd_steps"] == odd
+    assert result["bytes_generated"] == 500
+    if trace:
+        assert result["restarts"] == restarts
+        assert result["peak_bits"] >= seed.bit_length()
+    else:
+        assert result["restarts"] is None
+
+
+def test_hooks_receive_events():
+    events = []
+    stats = CollatzStats(hooks=[lambda event, info: events.append(event)])
+    InstrumentedCollatzPRNG(27, stats=stats).generate_bytes(100)
+    assert {'restart', 'peak', 'generate'} <= set(events)
+
+
+@pytest.mark.parametrize('prefix_cache', [None, KeystreamPrefixCache()])
+def test_cipher_stats_count_encrypted_bytes(prefix_cache):
+    cipher = CollatzCipher(KEY, prefix_cache=prefix_cache)
+    stats = cipher.enable_stats(trace=False)
+    assert cipher.encrypt_bytes(DATA) == CollatzCipher(KEY).encrypt_bytes(DATA)
+    assert stats.bytes_encrypted == len(DATA)
+    cipher.disable_stats()
+    assert cipher.stats is None
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_stream_stats_with_prefetch(prefetch):
+    cipher = CollatzCipher(KEY)
+    stats = cipher.enable_stats(trace=False)
+    dst = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(DATA), dst, chunk_size=1000,
+                          prefetch=prefetch)
+    assert dst.getvalue() == CollatzCipher(KEY).encrypt_bytes(DATA)
+    assert stats.bytes_encrypted == len(DATA)
+    assert stats.xor_seconds > 0
+    assert stats.io_seconds > 0
@@ -0,0 +1,124 @@
+"""
+Collatz Cipher - Keystream Önek Deposu Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+KeystreamStore ve KeystreamPrefixCache'in CollatzPRNG ile aynı keystream'i
+sunduğunu ve sayaçlarının doğru tutulduğunu doğrular.
+"""
+
+import pytest
+
+from cipher import CollatzCipher
+from collatz_prng import CollatzPRNG
+from keystream_store import KeystreamPrefixCache, KeystreamStore
+
+
+KEY = 2 ** 40 + 3
+
+
+def test_store_stats(tmp_path):
+    store = KeystreamStore(str(tmp_path))
+    try:
+        assert store.stats() == {"hits": 0, "misses": 0, "bytes_served": 0,
+                                 "keys": 0, "total_bytes": 0}
+        store.keystream(KEY, 100)
+        store.keystream(KEY, 50)
+        stats = store.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["bytes_served"] == 150
+        assert stats["keys"] == 1
+        assert stats["total_bytes"] >= 100
+    finally:
+        store.close()
+
+
+def test_prefix_cache_stats():
+    cache = KeystreamPrefixCache(max_bytes=1 << 20)
+    cache.keystream(KEY, 100)
+    cache.keystream(KEY, 50)
+    assert cache.keystream(KEY, (1 << 20) + 1) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["bypassed"]) == (1, 1, 1)
+    assert stats["bytes_served"] == 150
+    assert stats["keys"] == 1
+
+
+def test_prefix_cache_keystream_matches_prng():
+    cache = KeystreamPrefixCache(max_bytes=1 << 20)
+    for length in (10, 1000, 70000, 5):
+        assert bytes(cache.keystream(KEY, length)) == \
+            CollatzPRNG(KEY).generate_bytes(length)
+
+
+def test_encrypt_many_matches_encrypt_text():
+    texts = ['', 'a', 'merhaba dünya', 'x' * 300]
+    for prefix_cache in (None, KeystreamPrefixCache()):
+        cipher = CollatzCipher(KEY, prefix_cache=prefix_cache)
+        encrypted = cipher.encrypt_many(texts)
+        assert encrypted == [CollatzCipher(KEY).encrypt_text(t)
+                             for t in texts]
+        assert cipher.decrypt_many(encrypted) == texts
+
+
+@pytest.mark.parametrize('items', [['abc', 'd'], ['0g'], ['00', '1']])
+def test_decrypt_many_rejects_bad_hex(items):
+    with pytest.raises(ValueError):
+        CollatzCipher(KEY).decrypt_many(items)
+
+
+def test_store_keystream_matches_prng_and_persists(tmp_path):
+    expected = CollatzPRNG(KEY).generate_bytes(100000)
+    store = KeystreamStore(str(tmp_path))
+    try:
+        assert bytes(store.keystream(KEY, 10)) == expected[:10]
+        assert bytes(store.keystream(KEY, 100000)) == expected
+    finally:
+        store.close()
+
+    store = KeystreamStore(str(tmp_path))
+    try:
+        assert bytes(store.keystream(KEY, 70000)) == expected[:70000]
+        assert store.stats()["hits"] == 1
+    finally:
+        store.close()
+
+
+def test_store_regenerates_corrupt_prefix(tmp_path):
+    store = KeystreamStore(str(tmp_path))
+    expected = bytes(store.keystream(KEY, 100))
+    store.close()
+    data_path = next(tmp_path.glob('*.ks'))
+    with open(data_path, 'r+b') as f:
+        f.write(b'\x00' * 16)
+
+    store = KeystreamStore(str(tmp_path))
+    try:
+        assert bytes(store.keystream(KEY, 100)) == expected
+        assert store.stats()["misses"] == 1
+    finally:
+        store.close()
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = KeystreamStore(str(tmp_path), max_bytes=1 << 17)
+    try:
+        for key in (KEY, KEY + 2, KEY + 4):
+            store.keystream(key, 1 << 16)
+        assert store.stats()["keys"] == 2
+        assert store.total_bytes <= 1 << 17
+        assert bytes(store.keystream(KEY + 4, 10)) == \
+            CollatzPRNG(KEY + 4).generate_bytes(10)
+    finally:
+        store.close()
+
+
+def test_cipher_with_store_matches_encrypt_bytes(tmp_path):
+    data = bytes(range(256)) * 20
+    store = KeystreamStore(str(tmp_path))
+    try:
+        cipher = CollatzCipher(KEY, store=store)
+        encrypted = cipher.encrypt_bytes(data)
+        assert encrypted == CollatzCipher(KEY).encrypt_bytes(data)
+        assert cipher.decrypt_bytes(encrypted) == data
+    finally:
+        store.close()
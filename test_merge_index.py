@@ -0,0 +1,74 @@
+"""
+Collatz Cipher - Yörünge Birleşme İndeksi Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Raporlanan örtüşmelerin CollatzPRNG keystream'lerinde gerçekten aynı bitler
+olduğunu ve yapay olarak birleştirilmiş anahtarların bulunduğunu doğrular.
+"""
+
+import pytest
+
+from collatz_prng import CollatzPRNG
+from merge_index import MergeIndex
+
+
+SCAN_BITS = 2048
+
+MIN_LENGTH = 64
+
+# 2**70 + 27'nin yörüngesi 1'e yüzlerce adımda ulaşır; 2 katı ve 4 katı
+# bir ve iki adım sonra aynı yörüngeye girer
+BASE = 2 ** 70 + 27
+
+KEYS = [BASE, 2 * BASE, 4 * BASE, 2 ** 66 + 101, 12345]
+
+
+def _bits(key):
+    # Son bölüm taranan önekin dışına taşabildiği için fazlası üretilir
+    prng = CollatzPRNG(key)
+    return [prng.next_bit() for _ in range(4 * SCAN_BITS)]
+
+
+@pytest.fixture
+def index(tmp_path):
+    with MergeIndex(str(tmp_path / 'indeks.db'), SCAN_BITS,
+                    MIN_LENGTH) as index:
+        assert index.add_keys(KEYS[:3], batch_size=2) == 3
+        assert index.add_keys(KEYS, jobs=2, batch_size=2) == 2
+        yield index
+
+
+def test_collisions_match_keystreams(index):
+    report, counts = index.collisions()
+    assert counts["candidates"] >= len(report)
+    pairs = {(entry["key_a"], entry["key_b"]) for entry in report}
+    assert {(BASE, 2 * BASE), (BASE, 4 * BASE),
+            (2 * BASE, 4 * BASE)} <= pairs
+
+    bits = {key: _bits(key) for key in KEYS}
+    for entry in report:
+        a, b = bits[entry["key_a"]], bits[entry["key_b"]]
+        start_a, start_b = entry["offset_a"], entry["offset_b"]
+        length = entry["length"]
+        if length is None:
+            length = SCAN_BITS - max(start_a, start_b)
+        else:
+            assert length >= MIN_LENGTH
+        assert a[start_a:start_a + length] == b[start_b:start_b + length]
+
+    assert index.collisions(jobs=2, batch_size=1)[0] == report
+
+
+def test_reopen_keeps_parameters(index, tmp_path):
+    stats = index.stats()
+    assert stats["keys"] == len(KEYS)
+    assert stats["anchors"] > 0
+    path = str(tmp_path / 'indeks.db')
+    with MergeIndex(path) as reopened:
+        assert (reopened.scan_bits, reopened.min_length) == \
+            (SCAN_BITS, MIN_LENGTH)
+        assert reopened.add_keys([BASE]) == 0
+    with pytest.raises(ValueError):
+        MergeIndex(path, min_length=MIN_LENGTH * 2)
+    with pytest.raises(ValueError):
+        index.add_keys([1])
@@ -0,0 +1,67 @@
+"""
+Collatz Cipher - Keystream Ön Üretim Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+KeystreamPrefetcher'ın PRNG ile aynı keystream'i verdiğini ve üretici
+hatalarını tüketiciye ilettiğini doğrular.
+"""
+
+import io
+import os
+import random
+
+import pytest
+
+from cipher import CollatzCipher
+from collatz_prng import CollatzPRNG
+from prefetch import KeystreamPrefetcher
+
+
+KEY = 2 ** 70 + 1
+
+
+def test_prefetcher_matches_prng():
+    expected = CollatzPRNG(KEY).generate_bytes(20000)
+    rng = random.Random(2)
+    parts = []
+    with KeystreamPrefetcher(CollatzPRNG(KEY), block_size=1000,
+                             depth=3) as keystream:
+        remaining = len(expected)
+        while remaining:
+            buffer = bytearray(min(remaining, rng.choice((0, 1, 999, 2500))))
+            assert keystream.fill_bytes(buffer) == len(buffer)
+            parts.append(bytes(buffer))
+            remaining -= len(buffer)
+        stats = keystream.stats()
+    assert b''.join(parts) == expected
+    assert keystream.position == len(expected)
+    assert stats["blocks_consumed"] == 20
+
+
+def test_prefetcher_propagates_producer_error():
+    class Broken:
+        def fill_bytes(self, buffer):
+            raise RuntimeError("bozuk")
+
+    keystream = KeystreamPrefetcher(Broken(), block_size=16)
+    with pytest.raises(RuntimeError):
+        keystream.fill_bytes(bytearray(4))
+    with pytest.raises(ValueError):
+        keystream.fill_bytes(bytearray(4))
+    keystream.close()
+
+
+def test_prefetcher_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        KeystreamPrefetcher(CollatzPRNG(KEY), block_size=0)
+
+
+def test_encrypt_stream_with_prefetch_matches_encrypt_bytes():
+    data = os.urandom(10000)
+    cipher = CollatzCipher(KEY)
+    dst = io.BytesIO()
+    assert cipher.encrypt_stream(io.BytesIO(data), dst, chunk_size=700,
+                                 prefetch=2) == len(data)
+    assert dst.getvalue() == CollatzCipher(KEY).encrypt_bytes(data)
+    assert cipher.prefetch_stats["blocks_produced"] >= \
+        cipher.prefetch_stats["blocks_consumed"]
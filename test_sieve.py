@@ -0,0 +1,59 @@
+"""
+Collatz Cipher - Durma Zamanı Eleği Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+build() ile yazılan kayıtların collatz_sequence() ile tek tek yürünen
+yörüngelerle aynı olduğunu doğrular.
+"""
+
+import pytest
+
+from collatz_prng import collatz_sequence
+from sieve import SieveResult, build, small_table
+
+
+def _record(seed):
+    """collatz_sequence() ile (steps, odd, peak) hesaplar."""
+    sequence = collatz_sequence(seed, max_steps=10 ** 6)
+    return (len(sequence) - 1, sum(n % 2 for n in sequence[:-1]),
+            max(sequence))
+
+
+def test_small_table_matches_collatz_sequence():
+    table = small_table(3000)
+    for seed in range(1, 3000):
+        record = table[seed]
+        assert (int(record['steps']), int(record['odd']),
+                int(record['peak'])) == _record(seed), seed
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+@pytest.mark.parametrize('start', [1, 700, 5000])
+def test_build_matches_collatz_sequence(tmp_path, start, jobs):
+    path = str(tmp_path / 'eleme.npy')
+    waves = []
+    result = build(start, 9000, path, jobs=jobs, block_size=500,
+                   small_limit=1000, progress=waves.append)
+    assert len(result) == 9000 - start
+    assert waves[-1] == 9000
+    for seed in range(start, 9000):
+        assert result[seed] == _record(seed), seed
+
+    reopened = SieveResult(path)
+    best = max(range(start, 9000), key=lambda n: (_record(n)[0], -n))
+    assert reopened.max('steps', block_size=777) == (best, _record(best)[0])
+    assert [int(r['peak']) for r in reopened.lookup([start, 8999])] == \
+        [_record(start)[2], _record(8999)[2]]
+
+
+def test_bad_ranges_rejected(tmp_path):
+    path = str(tmp_path / 'eleme.npy')
+    with pytest.raises(ValueError):
+        build(10, 10, path)
+    result = build(10, 20, path)
+    with pytest.raises(IndexError):
+        result[20]
+    with pytest.raises(IndexError):
+        result.lookup([9])
+    with pytest.raises(ValueError):
+        result.range(5, 15)
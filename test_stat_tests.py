@@ -0,0 +1,87 @@
+"""
+Collatz Cipher - İstatistiksel Test Bataryası Testleri
+Bilgi Sistemleri Güvenliği - Ödev Projesi
+
+Parça parça akıtılan keystream'in tek seferde verilenle aynı sonuçları
+ürettiğini ve sayaçların doğrudan hesaplanan değerlerle tuttuğunu doğrular.
+"""
+
+import json
+import math
+import random
+
+import numpy as np
+import pytest
+
+from collatz_prng import CollatzPRNG
+from stat_tests import StatisticalBattery, analyze_key, igamc, run_battery
+
+
+KEY = 2 ** 90 + 17
+
+DATA = CollatzPRNG(KEY).generate_bytes(20000)
+
+
+def test_chunked_updates_match_single_update():
+    whole = StatisticalBattery()
+    whole.update(DATA)
+    chunked = StatisticalBattery()
+    rng = random.Random(5)
+    position = 0
+    while position < len(DATA):
+        size = rng.choice((0, 1, 3, 15, 16, 17, 1000))
+        chunked.update(DATA[position:position + size])
+        position += size
+    assert chunked.results() == whole.results()
+
+
+def test_counters_match_direct_computation():
+    battery = StatisticalBattery(lags=(1, 8))
+    battery.update(DATA)
+    bits = np.unpackbits(np.frombuffer(DATA, dtype=np.uint8))
+    assert battery.n == len(bits)
+    assert battery.ones == int(bits.sum())
+    assert battery.transitions == int(np.count_nonzero(bits[1:] != bits[:-1]))
+    assert battery.byte_counts.tolist() == \
+        np.bincount(np.frombuffer(DATA, dtype=np.uint8), minlength=256).tolist()
+    assert battery.lag_mismatches.tolist() == \
+        [int(np.count_nonzero(bits[lag:] != bits[:-lag])) for lag in (1, 8)]
+
+    results = battery.results()
+    assert results["frequency"]["statistic"] == pytest.approx(
+        (2 * int(bits.sum()) - len(bits)) / math.sqrt(len(bits)))
+    assert set(results["autocorrelation"]) == {"1", "8"}
+
+
+def test_igamc_known_values():
+    assert igamc(3, 0) == 1.0
+    for x in (0.1, 1.0, 7.5):
+        assert igamc(1, x) == pytest.approx(math.exp(-x))
+    assert igamc(0.5, 2.0) == pytest.approx(math.erfc(math.sqrt(2.0)))
+
+
+def test_constant_stream_fails():
+    battery = StatisticalBattery()
+    battery.update(bytes(4096))
+    results = battery.results()
+    assert not results["frequency"]["passed"]
+    assert not results["byte_chi_square"]["passed"]
+    with pytest.raises(ValueError):
+        StatisticalBattery().results()
+
+
+def test_analyze_key_matches_battery_and_jobs():
+    battery = StatisticalBattery()
+    battery.update(DATA)
+    for options in ({}, {"jump_bits": 8, "chunk_size": 777}):
+        report = analyze_key(KEY, len(DATA), **options)
+        assert report["tests"] == battery.results()
+
+    keys = [KEY, 2 ** 40 + 3]
+    serial = run_battery(keys, 2000)
+    parallel = run_battery(keys, 2000, jobs=2)
+    assert [entry["tests"] for entry in serial["keys"]] == \
+        [entry["tests"] for entry in parallel["keys"]]
+    json.dumps(parallel)
+    with pytest.raises(ValueError):
+        run_battery([KEY, 1], 100)